@@ -0,0 +1,86 @@
+"""
+Run the benchmark suite.
+
+Usage::
+
+    python -m benchmarks [-k PATTERN] [--output FILE]
+                         [--baseline FILE] [--threshold RATIO]
+
+Results are printed as a table and written to the output file as JSON.
+Given a baseline written by an earlier run, every benchmark is compared
+against it and the exit status is 1 if any benchmark is slower than the
+baseline by more than the threshold, 0.2 (20 percent) by default, or if
+any benchmark of the baseline matching the pattern did not run.
+"""
+import argparse
+import sys
+
+from benchmarks.suite import compare, dump, load, missing, report, run
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    parser.add_argument(
+        '-k',
+        dest='pattern',
+        help='only run benchmarks whose names contain this pattern'
+    )
+    parser.add_argument('--output', help='file to write JSON results to')
+    parser.add_argument(
+        '--baseline',
+        help='JSON results of an earlier run to compare against'
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.2,
+        help='allowed relative slowdown compared to the baseline'
+    )
+    parser.add_argument(
+        '--number',
+        type=int,
+        default=20,
+        help='number of runs per timing'
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=5,
+        help='number of timings, of which the best is reported'
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.pattern, number=args.number, repeat=args.repeat)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as fp:
+            baseline = load(fp)
+        if args.pattern is not None:
+            baseline = {
+                name: time
+                for name, time in baseline.items()
+                if args.pattern in name
+            }
+    report(results, baseline)
+    if args.output:
+        with open(args.output, 'w') as fp:
+            dump(results, fp)
+    if baseline is None:
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    for name, before, after, ratio in regressions:
+        print(
+            'Regression: %s %.3f us -> %.3f us (%.2fx)' % (
+                name, before, after, ratio
+            ),
+            file=sys.stderr
+        )
+    absent = missing(results, baseline)
+    for name in absent:
+        print('Missing: %s' % name, file=sys.stderr)
+    return 1 if regressions or absent else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""
+Benchmark operations that derive new intervals from existing ones.
+
+Each operation is timed twice: once with derived intervals created through
+the trusted ``from_bounds`` path and once with ``from_bounds`` replaced by
+the full constructor, which parses, coerces and rounds the bounds again.
+
+The trusted path is part of the benchmark suite as
+``derived_intervals.<class>.<operation>``, see :mod:`benchmarks.suite`.
+
+Usage::
+
+    python -m benchmarks.derived_intervals
+"""
+from contextlib import contextmanager
+from datetime import date
+from decimal import Decimal
+
+from benchmarks.suite import measure, SIZE
+from intervals import (
+    AbstractInterval,
+    canonicalize,
+    DateInterval,
+    DecimalInterval,
+    FloatInterval,
+    IntInterval
+)
+
+SAMPLES = [
+    (IntInterval([1, 10]), IntInterval([5, 20])),
+    (FloatInterval([1.5, 10]), FloatInterval([5, 20.5])),
+    (
+        DecimalInterval([Decimal('1.5'), Decimal('10')]),
+        DecimalInterval([Decimal('5'), Decimal('20.5')])
+    ),
+    (
+        DateInterval([date(2000, 1, 1), date(2000, 1, 31)]),
+        DateInterval([date(2000, 1, 15), date(2000, 2, 15)])
+    ),
+]
+
+OPERATIONS = [
+    ('a & b', lambda a, b: a & b),
+    ('a | b', lambda a, b: a | b),
+    ('a + b', lambda a, b: a + b),
+    ('a - b', lambda a, b: a - b),
+    ('a.glb(b)', lambda a, b: a.glb(b)),
+    ('a.lub(b)', lambda a, b: a.lub(b)),
+    ('canonicalize(a)', lambda a, b: canonicalize(a)),
+]
+
+
+@contextmanager
+def constructor_path():
+    """
+    Replace the trusted construction path with the full constructor.
+    """
+    original = AbstractInterval.__dict__['from_bounds']
+
+    def from_bounds(
+        cls,
+        lower,
+        upper,
+        lower_inc=True,
+        upper_inc=True,
+        step=None
+    ):
+        kwargs = {} if step is None else {'step': step}
+        return cls(
+            [lower, upper],
+            lower_inc=lower_inc,
+            upper_inc=upper_inc,
+            **kwargs
+        )
+
+    AbstractInterval.from_bounds = classmethod(from_bounds)
+    try:
+        yield
+    finally:
+        AbstractInterval.from_bounds = original
+
+
+def _supported():
+    """
+    Return ``(class name, operation name, func, a, b)`` tuples of the
+    operations supported by the interval types of the samples.
+    """
+    cases = []
+    for a, b in SAMPLES:
+        for name, func in OPERATIONS:
+            try:
+                func(a, b)
+            except TypeError:
+                # Operation not supported by this interval type.
+                continue
+            cases.append((type(a).__name__, name, func, a, b))
+    return cases
+
+
+def _repeated(func, a, b):
+    def benchmark():
+        for _ in range(SIZE):
+            func(a, b)
+    return benchmark
+
+
+def benchmarks():
+    return [
+        ('%s.%s' % (class_name, name), _repeated(func, a, b), SIZE)
+        for class_name, name, func, a, b in _supported()
+    ]
+
+
+def run(number=20):
+    rows = []
+    for class_name, name, func, a, b in _supported():
+        benchmark = _repeated(func, a, b)
+        with constructor_path():
+            before = measure(benchmark, number)
+        after = measure(benchmark, number)
+        rows.append((class_name, name, before, after))
+    return rows
+
+
+def main():
+    print('%-16s %-16s %12s %12s %8s' % (
+        'class', 'operation', 'full (us)', 'trusted (us)', 'speedup'
+    ))
+    for class_name, name, before, after in run():
+        print('%-16s %-16s %12.2f %12.2f %7.1fx' % (
+            class_name, name, before, after, before / after
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""
+Benchmark conversion of date and datetime intervals into IntervalArray.
+
+Bounds are encoded with the codec of the interval class before they are
+handed to NumPy. The previous conversion, which let NumPy convert the date
+and datetime objects, is timed for comparison. Parsing interval strings in
+bulk with ``IntervalArray.from_strings`` is compared against parsing each
+string with ``from_string``.
+
+The current conversions are part of the benchmark suite as
+``encoding.<bounds>.<operation>``, see :mod:`benchmarks.suite`.
+
+Usage::
+
+    python -m benchmarks.encoding [SIZE]
+"""
+import sys
+from datetime import date, datetime, timedelta
+
+from benchmarks.suite import measure
+from intervals import DateInterval, DateTimeInterval, IntervalArray
+from intervals.array import _dtype, _encode
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+#: Number of runs per timing in the benchmark suite, where each run
+#: converts :data:`SUITE_SIZE` intervals.
+NUMBER = 2
+
+SUITE_SIZE = 10000
+
+
+def _date_intervals(size):
+    start = date(2000, 1, 1)
+    return [
+        DateInterval([
+            start + timedelta(days=i),
+            start + timedelta(days=i + 7)
+        ])
+        for i in range(size)
+    ]
+
+
+def _datetime_intervals(size):
+    start = datetime(2000, 1, 1)
+    return [
+        DateTimeInterval([
+            start + timedelta(seconds=i),
+            start + timedelta(seconds=i, hours=1)
+        ])
+        for i in range(size)
+    ]
+
+
+def _operations(size):
+    """
+    Return ``(bounds, operation, before, after)`` tuples of functions
+    converting given number of intervals the previous and the current way.
+    """
+    operations = []
+    for name, intervals in (
+        ('date', _date_intervals(size)),
+        ('datetime', _datetime_intervals(size)),
+    ):
+        interval_class = type(intervals[0])
+        dtype = _dtype(interval_class)
+        lowers = [interval.lower for interval in intervals]
+        strings = [str(interval) for interval in intervals]
+        operations.append((
+            name,
+            'encode bounds',
+            lambda lowers=lowers, dtype=dtype: _encode(lowers, dtype),
+            lambda lowers=lowers, dtype=dtype, codec=interval_class.codec: (
+                _encode(lowers, dtype, codec)
+            )
+        ))
+        operations.append((
+            name,
+            'parse strings',
+            lambda strings=strings, interval_class=interval_class: (
+                IntervalArray.from_intervals(
+                    [interval_class.from_string(s) for s in strings],
+                    interval_class
+                )
+            ),
+            lambda strings=strings, interval_class=interval_class: (
+                IntervalArray.from_strings(strings, interval_class)
+            )
+        ))
+    return operations
+
+
+def benchmarks():
+    if numpy is None:
+        return []
+    return [
+        ('%s.%s' % (name, operation.replace(' ', '_')), after, SUITE_SIZE)
+        for name, operation, _, after in _operations(SUITE_SIZE)
+    ]
+
+
+def run(size):
+    return [
+        (
+            name,
+            operation,
+            measure(before, number=5, repeat=3, size=size),
+            measure(after, number=5, repeat=3, size=size)
+        )
+        for name, operation, before, after in _operations(size)
+    ]
+
+
+def main(size=100000):
+    print('%-12s %-16s %12s %12s %8s' % (
+        'bounds', 'operation', 'before (us)', 'after (us)', 'speedup'
+    ))
+    for name, operation, before, after in run(size):
+        print('%-12s %-16s %12.2f %12.2f %7.1fx' % (
+            name, operation, before, after, before / after
+        ))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
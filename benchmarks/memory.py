@@ -0,0 +1,82 @@
+"""
+Measure the memory used per interval instance.
+
+The memory is measured with :mod:`tracemalloc` as the growth of allocated
+memory while creating a large number of intervals, divided by the number
+of intervals. The bounds are shared between the intervals, so only the
+interval objects themselves are measured.
+
+The measurements are part of the benchmark suite as ``memory.<class>``,
+see :mod:`benchmarks.suite`.
+
+Usage::
+
+    python -m benchmarks.memory
+"""
+import functools
+import gc
+import tracemalloc
+from datetime import date, datetime
+from decimal import Decimal
+
+from intervals import (
+    CharacterInterval,
+    DateInterval,
+    DateTimeInterval,
+    DecimalInterval,
+    FloatInterval,
+    IntInterval
+)
+
+SAMPLES = [
+    (IntInterval, [1, 10], {}),
+    (IntInterval, [0, 10], {'step': 2}),
+    (FloatInterval, [1.5, 10.5], {}),
+    (DecimalInterval, [Decimal('1.5'), Decimal('10.5')], {}),
+    (DateInterval, [date(2000, 1, 1), date(2000, 12, 31)], {}),
+    (DateTimeInterval, [datetime(2000, 1, 1), datetime(2000, 12, 31)], {}),
+    (CharacterInterval, ['a', 'z'], {}),
+]
+
+
+def bytes_per_instance(interval_class, bounds, kwargs, count=100000):
+    template = interval_class(bounds, **kwargs)
+    lower = template.lower
+    upper = template.upper
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    intervals = [
+        interval_class.from_bounds(lower, upper, step=kwargs.get('step'))
+        for _ in range(count)
+    ]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Subtract the list holding the intervals.
+    size = after - before - (len(intervals) * 8)
+    return size / float(count)
+
+
+def measurements():
+    """
+    Return ``(name, func)`` pairs of the samples, where func returns the
+    bytes per instance of the sample.
+    """
+    return [
+        (
+            interval_class.__name__ + (' (step)' if kwargs else ''),
+            functools.partial(
+                bytes_per_instance, interval_class, bounds, kwargs
+            )
+        )
+        for interval_class, bounds, kwargs in SAMPLES
+    ]
+
+
+def main():
+    for name, func in measurements():
+        print('%-24s %8.1f bytes' % (name, func()))
+
+
+if __name__ == '__main__':
+    main()
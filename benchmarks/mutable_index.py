@@ -0,0 +1,184 @@
+"""
+Benchmark a mixed workload of updates and queries on a mutable index.
+
+A scheduling workload is simulated over random one to four hour
+``DateTimeInterval`` reservations: the index starts with ``size``
+reservations, after which reservations are added, cancelled and queried
+for overlaps in random order. The same workload is run against
+``MutableIntervalIndex``, a plain list scanned on every query and a static
+``IntervalIndex`` rebuilt after every update, and the throughput of each is
+reported in operations per second.
+
+The workload of ``MutableIntervalIndex`` is part of the benchmark suite as
+``mutable_index.workload``, see :mod:`benchmarks.suite`. There the time of
+building the index of the initial reservations is included.
+
+Usage::
+
+    python -m benchmarks.mutable_index [size] [operations]
+"""
+import random
+import sys
+from datetime import datetime, timedelta
+
+from benchmarks.suite import measure
+from intervals import DateTimeInterval, IntervalIndex, MutableIntervalIndex
+
+#: Number of runs per timing in the benchmark suite. Each run builds the
+#: index, so the runs do not share any state.
+NUMBER = 2
+
+START = datetime(2020, 1, 1)
+
+#: Shares of adds, removes and overlap queries in the workload.
+MIX = (0.3, 0.2, 0.5)
+
+
+def reservation(rnd, span_hours=24 * 365):
+    lower = START + timedelta(minutes=15 * rnd.randrange(span_hours * 4))
+    return DateTimeInterval.closed_open(
+        lower,
+        lower + timedelta(minutes=15 * rnd.randint(4, 16))
+    )
+
+
+def workload(size, operations, seed=0):
+    """
+    Return the initial reservations and a list of ``(operation, interval,
+    payload)`` tuples, where removes refer to reservations that exist at
+    the time of the operation.
+    """
+    rnd = random.Random(seed)
+    initial = [(reservation(rnd), index) for index in range(size)]
+    live = list(initial)
+    ops = []
+    for index in range(size, size + operations):
+        roll = rnd.random()
+        if roll < MIX[0] or not live:
+            entry = (reservation(rnd), index)
+            live.append(entry)
+            ops.append(('add',) + entry)
+        elif roll < MIX[0] + MIX[1]:
+            position = rnd.randrange(len(live))
+            live[position], live[-1] = live[-1], live[position]
+            ops.append(('remove',) + live.pop())
+        else:
+            ops.append(('query', reservation(rnd), None))
+    return initial, ops
+
+
+class ListScan(object):
+    def __init__(self, entries):
+        self.entries = list(entries)
+
+    def add(self, interval, payload):
+        self.entries.append((interval, payload))
+
+    def remove(self, interval, payload):
+        self.entries.remove((interval, payload))
+
+    def overlapping(self, query):
+        return [
+            entry for entry in self.entries
+            if entry[0].is_connected(query)
+        ]
+
+
+class RebuiltIndex(ListScan):
+    def __init__(self, entries):
+        super().__init__(entries)
+        self.rebuild()
+
+    def rebuild(self):
+        self.index = IntervalIndex(interval for interval, _ in self.entries)
+
+    def add(self, interval, payload):
+        super().add(interval, payload)
+        self.rebuild()
+
+    def remove(self, interval, payload):
+        super().remove(interval, payload)
+        self.rebuild()
+
+    def overlapping(self, query):
+        return self.index.overlapping(query)
+
+
+def mutable_index(entries):
+    return MutableIntervalIndex(
+        [interval for interval, _ in entries],
+        [payload for _, payload in entries]
+    )
+
+
+def replay(factory, initial, ops):
+    """
+    Return a setup function creating an index of the initial reservations
+    with given factory and a function running given operations on it.
+    """
+    state = {}
+
+    def setup():
+        state['index'] = factory(initial)
+
+    def benchmark():
+        index = state['index']
+        for operation, interval, payload in ops:
+            if operation == 'add':
+                index.add(interval, payload)
+            elif operation == 'remove':
+                index.remove(interval, payload)
+            else:
+                index.overlapping(interval)
+
+    return setup, benchmark
+
+
+def benchmarks():
+    setup, benchmark = replay(mutable_index, *workload(10000, 5000))
+
+    def build_and_replay():
+        setup()
+        benchmark()
+
+    return [('workload', build_and_replay, 5000)]
+
+
+def run(size=100000, operations=20000):
+    """
+    Return ``(name, operations, microseconds per operation)`` rows.
+    """
+    initial, ops = workload(size, operations)
+    # The baselines are linear per operation, so they only run a sample of
+    # the workload and their throughput is extrapolated.
+    sample = ops[:max(1, operations // 100)]
+    rows = []
+    for name, factory, timed in (
+        ('MutableIntervalIndex', mutable_index, ops),
+        ('list scan', ListScan, sample),
+        ('rebuilt IntervalIndex', RebuiltIndex, sample),
+    ):
+        setup, benchmark = replay(factory, initial, timed)
+        rows.append((name, len(timed), measure(
+            benchmark,
+            number=1,
+            repeat=1,
+            size=len(timed),
+            setup=setup
+        )))
+    return rows
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    operations = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+    print('%d reservations, mix of %d%% adds, %d%% removes, %d%% queries' % (
+        (size,) + tuple(int(share * 100) for share in MIX)
+    ))
+    print('%24s %10s %12s' % ('index', 'ops', 'ops/s'))
+    for name, count, elapsed in run(size, operations):
+        print('%24s %10d %12.0f' % (name, count, 1e6 / elapsed))
+
+
+if __name__ == '__main__':
+    main()
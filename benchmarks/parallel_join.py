@@ -0,0 +1,93 @@
+"""
+Benchmark the scaling of the parallel overlap join.
+
+Two sequences of random integer intervals are joined with
+``parallel_overlap_join`` using 1, 2, 4 and 8 worker processes, and the
+speedup of each run is reported relative to the single worker run, which
+joins in the current process without a pool. The speedup is bounded by the
+number of CPUs of the machine.
+
+The joins are part of the benchmark suite as ``parallel_join.workers=N``,
+see :mod:`benchmarks.suite`.
+
+Usage::
+
+    python -m benchmarks.parallel_join [size]
+"""
+import os
+import random
+import sys
+
+from benchmarks.suite import measure
+from intervals import IntInterval, parallel_overlap_join
+
+WORKERS = (1, 2, 4, 8)
+
+#: Number of runs per timing in the benchmark suite, where each run joins
+#: :data:`SUITE_SIZE` intervals per side.
+NUMBER = 1
+
+SUITE_SIZE = 20000
+
+
+def generate(rnd, size, span=10 ** 7, max_length=1000):
+    intervals = []
+    for _ in range(size):
+        lower = rnd.randrange(span)
+        intervals.append(
+            IntInterval.closed_open(lower, lower + rnd.randint(1, max_length))
+        )
+    return intervals
+
+
+def join(left, right, workers):
+    def benchmark():
+        return parallel_overlap_join(
+            left, right, workers=workers, indices=True
+        )
+    return benchmark
+
+
+def benchmarks():
+    rnd = random.Random(0)
+    left = generate(rnd, SUITE_SIZE)
+    right = generate(rnd, SUITE_SIZE)
+    return [
+        ('workers=%d' % workers, join(left, right, workers), SUITE_SIZE)
+        for workers in WORKERS
+    ]
+
+
+def run(size=200000):
+    """
+    Return ``(workers, seconds, pairs)`` rows of the best of three joins
+    with each number of workers.
+    """
+    rnd = random.Random(0)
+    left = generate(rnd, size)
+    right = generate(rnd, size)
+    count = len(join(left, right, 1)())
+    return [
+        (
+            workers,
+            measure(join(left, right, workers), 1, 3, size=1) / 1e6,
+            count
+        )
+        for workers in WORKERS
+    ]
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    print('%d intervals per side, %d CPUs' % (size, os.cpu_count() or 1))
+    print('%8s %12s %10s %8s' % ('workers', 'time (s)', 'pairs', 'speedup'))
+    rows = run(size)
+    baseline = rows[0][1]
+    for workers, elapsed, count in rows:
+        print('%8d %12.3f %10d %7.2fx' % (
+            workers, elapsed, count, baseline / elapsed
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+"""
+Benchmark rounding of bounds by step.
+
+Each rounding strategy is timed against the previous implementation, which
+rounded every number through ``Decimal`` (or ``float`` for
+``DecimalInterval``) and ``py2round``. Interval construction, which rounds
+both bounds, is timed as well.
+
+The current rounding is part of the benchmark suite as
+``rounding.<strategy>.<operation>``, see :mod:`benchmarks.suite`.
+
+Usage::
+
+    python -m benchmarks.rounding
+"""
+from contextlib import contextmanager
+from decimal import Decimal
+
+from infinity import is_infinite
+
+from benchmarks.suite import measure, SIZE
+from intervals import DecimalInterval, FloatInterval, IntInterval
+from intervals.interval import py2round
+
+
+def legacy_number_rounding(interval, value):
+    if interval.step and not is_infinite(value):
+        return interval.type(
+            interval.rounding_type(interval.step) *
+            interval.rounding_type(
+                py2round(
+                    interval.rounding_type('1.0') /
+                    interval.rounding_type(interval.step) *
+                    interval.rounding_type(value)
+                )
+            )
+        )
+    return value
+
+
+def legacy_decimal_rounding(interval, value):
+    if interval.step and not is_infinite(value):
+        return interval.type(str(
+            float(interval.step) *
+            py2round(1.0 / float(interval.step) * float(value))
+        ))
+    return value
+
+
+CASES = [
+    (
+        'int, step 1',
+        IntInterval([1, 100]),
+        12345,
+        legacy_number_rounding
+    ),
+    (
+        'int, step 5',
+        IntInterval([0, 100], step=5),
+        12347,
+        legacy_number_rounding
+    ),
+    (
+        'decimal, step 0.01',
+        DecimalInterval([Decimal(1), Decimal(100)], step=Decimal('0.01')),
+        Decimal('123.456'),
+        legacy_decimal_rounding
+    ),
+    (
+        'float, step 0.5',
+        FloatInterval([1, 100], step=0.5),
+        12.3,
+        legacy_number_rounding
+    ),
+]
+
+
+@contextmanager
+def legacy_rounding(interval_class, legacy):
+    """
+    Replace the rounding of given interval class with given legacy function.
+    """
+    original = interval_class.__dict__.get('round_value_by_step')
+    interval_class.round_value_by_step = legacy
+    try:
+        yield
+    finally:
+        if original is None:
+            del interval_class.round_value_by_step
+        else:
+            interval_class.round_value_by_step = original
+
+
+def _operations(interval, value, rounding=None):
+    """
+    Return ``(operation, func)`` pairs timing given rounding, which defaults
+    to the rounding of the interval, alone and in the constructor.
+    """
+    interval_class = type(interval)
+    bounds = [value, value]
+    step = interval.step
+    if rounding is None:
+        rounding = type(interval).round_value_by_step
+
+    def round_value_by_step():
+        for _ in range(SIZE):
+            rounding(interval, value)
+
+    def constructor():
+        for _ in range(SIZE):
+            interval_class(bounds, step=step)
+
+    return [
+        ('round_value_by_step', round_value_by_step),
+        ('constructor', constructor),
+    ]
+
+
+def benchmarks():
+    return [
+        ('%s.%s' % (name, operation), func, SIZE)
+        for name, interval, value, _ in CASES
+        for operation, func in _operations(interval, value)
+    ]
+
+
+def run(number=200):
+    rows = []
+    for name, interval, value, legacy in CASES:
+        legacy_operations = _operations(interval, value, legacy)
+        with legacy_rounding(type(interval), legacy):
+            before = [measure(func, number) for _, func in legacy_operations]
+        for (operation, func), time in zip(
+            _operations(interval, value), before
+        ):
+            rows.append((name, operation, time, measure(func, number)))
+    return rows
+
+
+def main():
+    print('%-20s %-20s %12s %12s %8s' % (
+        'strategy', 'operation', 'legacy (us)', 'current (us)', 'speedup'
+    ))
+    for name, operation, before, after in run():
+        print('%-20s %-20s %12.2f %12.2f %7.1fx' % (
+            name, operation, before, after, before / after
+        ))
+
+
+if __name__ == '__main__':
+    main()
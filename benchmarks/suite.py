@@ -0,0 +1,374 @@
+"""
+Benchmark suite for the hot paths of interval classes.
+
+Every benchmark times one operation over a mix of inputs and reports the
+best time per operation in microseconds. The benchmarks of the modules in
+:data:`MODULES` are collected as well, and the memory used per interval
+instance is reported in bytes as ``memory.<class>``. Results can be written
+as JSON and compared against a saved baseline, see
+:mod:`benchmarks.__main__`.
+"""
+import importlib
+import json
+import platform
+import sys
+import timeit
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from intervals import (
+    canonicalize,
+    CharacterInterval,
+    DateInterval,
+    DateTimeInterval,
+    DecimalInterval,
+    FloatInterval,
+    Interval,
+    IntervalException,
+    IntInterval
+)
+
+
+def _int_bounds(i):
+    return [i, i + 10]
+
+
+def _float_bounds(i):
+    return [i + 0.5, i + 10.25]
+
+
+def _decimal_bounds(i):
+    return [Decimal(i) + Decimal('0.5'), Decimal(i) + Decimal('10.25')]
+
+
+def _date_bounds(i):
+    start = date(2000, 1, 1) + timedelta(days=i)
+    return [start, start + timedelta(days=30)]
+
+
+def _datetime_bounds(i):
+    start = datetime(2000, 1, 1) + timedelta(hours=i)
+    return [start, start + timedelta(hours=36)]
+
+
+def _character_bounds(i):
+    return [chr(97 + i % 20), chr(102 + i % 20)]
+
+
+def _string(bounds, i):
+    lower, upper = (
+        bound.isoformat() if hasattr(bound, 'isoformat') else str(bound)
+        for bound in bounds
+    )
+    formats = ['[%s, %s)', '(%s, %s]', '[%s, %s]']
+    if '-' not in lower + upper:
+        formats.append('%s - %s')
+    return formats[i % len(formats)] % (lower, upper)
+
+
+#: Interval classes with a function returning sample bounds for an index.
+CLASSES = [
+    (IntInterval, _int_bounds),
+    (FloatInterval, _float_bounds),
+    (DecimalInterval, _decimal_bounds),
+    (DateInterval, _date_bounds),
+    (DateTimeInterval, _datetime_bounds),
+    (CharacterInterval, _character_bounds),
+]
+
+#: Number of inputs each benchmark iterates over.
+SIZE = 100
+
+#: Modules whose ``benchmarks()`` function returns ``(name, func, size)``
+#: tuples of further benchmarks, where func runs an operation size times.
+#: Slow benchmarks can limit the number of runs per timing with a ``NUMBER``
+#: attribute of their module.
+MODULES = [
+    'derived_intervals',
+    'rounding',
+    'encoding',
+    'mutable_index',
+    'parallel_join',
+]
+
+
+def _benchmarks(interval_class, make_bounds):
+    """
+    Return ``(operation, func)`` pairs timing the hot paths of given
+    interval class. Each func runs the operation once for each input.
+    """
+    bounds = [make_bounds(i) for i in range(SIZE)]
+    inclusivity = [(i % 2 == 0, i % 3 == 0) for i in range(SIZE)]
+    strings = [_string(bounds[i], i) for i in range(SIZE)]
+    intervals = [
+        interval_class(b, lower_inc=lower_inc, upper_inc=upper_inc)
+        for b, (lower_inc, upper_inc) in zip(bounds, inclusivity)
+    ]
+    others = intervals[1:] + intervals[:1]
+    points = [b[0] for b in bounds[5:] + bounds[:5]]
+    pairs = list(zip(intervals, others))
+    equal_pairs = [
+        (interval, interval.from_bounds(
+            interval.lower,
+            interval.upper,
+            interval.lower_inc,
+            interval.upper_inc
+        ))
+        for interval in intervals
+    ]
+
+    def construct():
+        for b, (lower_inc, upper_inc) in zip(bounds, inclusivity):
+            interval_class(b, lower_inc=lower_inc, upper_inc=upper_inc)
+
+    def from_string():
+        for string in strings:
+            interval_class.from_string(string)
+
+    def eq():
+        for a, b in equal_pairs:
+            a == b
+
+    def contains_point():
+        for interval, point in zip(intervals, points):
+            point in interval
+
+    def contains_interval():
+        for a, b in pairs:
+            b in a
+
+    def and_():
+        for a, b in pairs:
+            if a.is_connected(b):
+                a & b
+
+    def or_():
+        for a, b in pairs:
+            if a.is_connected(b):
+                a | b
+
+    def factory():
+        for b in bounds:
+            Interval(b)
+
+    benchmarks = [
+        ('construct', construct),
+        ('from_string', from_string),
+        ('__eq__', eq),
+        ('__contains__ point', contains_point),
+        ('__contains__ interval', contains_interval),
+        ('__and__', and_),
+        ('__or__', or_),
+        ('Interval()', factory),
+    ]
+    if intervals[0].discrete:
+        def canonicalize_():
+            for interval in intervals:
+                canonicalize(interval)
+
+        benchmarks.append(('canonicalize', canonicalize_))
+    return benchmarks
+
+
+def _mixed_benchmarks():
+    """
+    Return benchmarks running over inputs of all interval classes mixed.
+    """
+    bounds = [
+        make_bounds(i)
+        for i in range(SIZE // len(CLASSES))
+        for _, make_bounds in CLASSES
+    ]
+    strings = [
+        '[%d, %d)' % (i, i + 10) if i % 2 else '%d.5 - %d.5' % (i, i + 10)
+        for i in range(SIZE)
+    ]
+
+    def factory():
+        for b in bounds:
+            Interval(b)
+
+    def factory_from_string():
+        for string in strings:
+            Interval.from_string(string)
+
+    return [
+        ('Interval()', factory),
+        ('Interval.from_string()', factory_from_string),
+    ]
+
+
+def _supported(func):
+    try:
+        func()
+    except (IntervalException, TypeError, ValueError):
+        return False
+    return True
+
+
+def _module_benchmarks():
+    """
+    Return the benchmarks of :data:`MODULES` as ``(name, func, size,
+    number)`` tuples, where number is the limit of runs per timing or
+    ``None``.
+    """
+    benchmarks = []
+    for module_name in MODULES:
+        module = importlib.import_module('benchmarks.' + module_name)
+        number = getattr(module, 'NUMBER', None)
+        for name, func, size in module.benchmarks():
+            benchmarks.append(
+                ('%s.%s' % (module_name, name), func, size, number)
+            )
+    return benchmarks
+
+
+def collect(pattern=None):
+    """
+    Return the benchmarks whose names contain given pattern as ``(name,
+    func, size, number)`` tuples, where func runs an operation size times
+    and number is the limit of runs per timing or ``None``. Benchmarks of
+    operations that the interval class does not support are left out.
+    """
+    benchmarks = []
+    for interval_class, make_bounds in CLASSES:
+        for operation, func in _benchmarks(interval_class, make_bounds):
+            benchmarks.append((
+                '%s.%s' % (interval_class.__name__, operation),
+                func,
+                SIZE,
+                None
+            ))
+    for operation, func in _mixed_benchmarks():
+        benchmarks.append(('mixed.%s' % operation, func, SIZE, None))
+    benchmarks = [
+        benchmark
+        for benchmark in benchmarks
+        if (pattern is None or pattern in benchmark[0]) and
+        _supported(benchmark[1])
+    ]
+    return benchmarks + [
+        benchmark
+        for benchmark in _module_benchmarks()
+        if pattern is None or pattern in benchmark[0]
+    ]
+
+
+def measure(func, number=20, repeat=5, size=SIZE, setup='pass'):
+    """
+    Return the best time per operation of given benchmark in microseconds.
+
+    :param func: function running the operation ``size`` times
+    :param number: number of runs per timing
+    :param repeat: number of timings, of which the best is used
+    :param size: number of operations per run
+    :param setup: function called before each timing, but not timed
+    """
+    timer = timeit.Timer(func, setup=setup)
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return best / number / size * 1e6
+
+
+def run(pattern=None, number=20, repeat=5):
+    """
+    Run the benchmarks whose names contain given pattern and return their
+    results as a dict of names and microseconds per operation, along with
+    the bytes per instance of the matching ``memory.<class>`` entries.
+    """
+    from benchmarks import memory
+
+    results = {
+        name: measure(
+            func,
+            number if limit is None else min(number, limit),
+            repeat,
+            size
+        )
+        for name, func, size, limit in collect(pattern)
+    }
+    for name, func in memory.measurements():
+        name = 'memory.%s' % name
+        if pattern is None or pattern in name:
+            results[name] = func()
+    return results
+
+
+def dump(results, fp):
+    """
+    Write given results to given file as JSON along with the Python
+    version.
+    """
+    json.dump(
+        {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'results': results
+        },
+        fp,
+        indent=2,
+        sort_keys=True
+    )
+    fp.write('\n')
+
+
+def load(fp):
+    """
+    Read results written with :func:`dump` from given file.
+    """
+    return json.load(fp)['results']
+
+
+def compare(results, baseline, threshold):
+    """
+    Return ``(name, baseline, result, ratio)`` tuples of the benchmarks
+    that are slower than in the baseline by more than given threshold.
+    Benchmarks missing from either side are not compared, see
+    :func:`missing`.
+
+    :param results: dict of benchmark names and times
+    :param baseline: dict of benchmark names and times
+    :param threshold:
+        allowed relative slowdown, for example ``0.2`` for 20 percent
+    """
+    regressions = []
+    for name, time in sorted(results.items()):
+        if name not in baseline:
+            continue
+        ratio = time / baseline[name]
+        if ratio > 1 + threshold:
+            regressions.append((name, baseline[name], time, ratio))
+    return regressions
+
+
+def missing(results, baseline):
+    """
+    Return the sorted names of the benchmarks of given baseline that have
+    no result, for example because they were renamed or started failing.
+    """
+    return sorted(name for name in baseline if name not in results)
+
+
+def report(results, baseline=None, file=sys.stdout):
+    """
+    Print given results as a table, along with the baseline times and
+    their ratios if a baseline is given.
+    """
+    if baseline is None:
+        print('%-48s %12s' % ('benchmark', 'result'), file=file)
+        for name, time in sorted(results.items()):
+            print('%-48s %12.3f' % (name, time), file=file)
+        return
+    print('%-48s %12s %12s %8s' % (
+        'benchmark', 'baseline', 'result', 'ratio'
+    ), file=file)
+    for name, time in sorted(results.items()):
+        if name in baseline:
+            print('%-48s %12.3f %12.3f %7.2fx' % (
+                name, baseline[name], time, time / baseline[name]
+            ), file=file)
+        else:
+            print('%-48s %12s %12.3f %8s' % (name, '-', time, '-'), file=file)
+    for name in missing(results, baseline):
+        print('%-48s %12.3f %12s %8s' % (
+            name, baseline[name], '-', '-'
+        ), file=file)
@@ -0,0 +1,10 @@
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+collect_ignore = []
+if numpy is None:
+    # The doctests of IntervalArray require NumPy.
+    collect_ignore.append('intervals/array.py')
@@ -1,5 +1,10 @@
 # -*- coding: utf-8 -*-
+from . import instrumentation
+from .array import IntervalArray
+from .cache import LRUCache
+from .discrete_range import DiscreteRange
 from .exc import IllegalArgument, IntervalException, RangeBoundsException
+from .index import IntervalIndex, MutableIntervalIndex
 from .interval import (
     AbstractInterval,
     canonicalize,
@@ -13,22 +18,42 @@ from .interval import (
     IntInterval,
     NumberInterval
 )
+from .interval_map import IntervalMap
+from .interval_set import IntervalSet
+from .parallel import parallel_overlap_join
+from .parser import parse_many
+from .segment_tree import SegmentTree
+from .sweep import coverage, merge, overlap_join
 
 __all__ = (
     'AbstractInterval',
     'CharacterInterval',
     'canonicalize',
+    'coverage',
     'DateInterval',
     'DateTimeInterval',
     'DecimalInterval',
+    'DiscreteRange',
     'FloatInterval',
     'Interval',
+    'IntervalArray',
     'IntervalException',
     'IntervalFactory',
+    'IntervalIndex',
+    'IntervalMap',
+    'IntervalSet',
     'IntInterval',
     'IllegalArgument',
+    'instrumentation',
+    'LRUCache',
+    'merge',
+    'MutableIntervalIndex',
     'NumberInterval',
-    'RangeBoundsException'
+    'overlap_join',
+    'parallel_overlap_join',
+    'parse_many',
+    'RangeBoundsException',
+    'SegmentTree'
 )
 
 
@@ -0,0 +1,547 @@
+import warnings
+from datetime import timedelta
+
+from infinity import inf, Infinity, is_infinite
+
+from .encoding import iso_datetime_pattern
+from .exc import IllegalArgument, RangeBoundsException
+from .interval import AbstractInterval, FloatInterval, IntInterval
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError('IntervalArray requires NumPy.')
+
+
+def _dtype(interval_class):
+    if issubclass(interval_class, IntInterval):
+        return np.dtype('int64')
+    elif issubclass(interval_class, FloatInterval):
+        return np.dtype('float64')
+    elif interval_class.codec is not None:
+        return np.dtype('datetime64[%s]' % interval_class.codec.unit)
+    return np.dtype(object)
+
+
+def _infinities(dtype):
+    """
+    Return the values used for representing -inf and inf in arrays of given
+    dtype.
+
+    Integer and datetime arrays can not hold infinities, so the extremes of
+    the int64 range are used instead. For datetimes the smallest int64 is
+    NaT, hence the next value.
+    """
+    if dtype.kind == 'i':
+        info = np.iinfo(np.int64)
+        return np.int64(info.min), np.int64(info.max)
+    elif dtype.kind == 'M':
+        info = np.iinfo(np.int64)
+        return (
+            np.datetime64(int(info.min) + 1, np.datetime_data(dtype)[0]),
+            np.datetime64(int(info.max), np.datetime_data(dtype)[0])
+        )
+    elif dtype.kind == 'f':
+        return np.float64('-inf'), np.float64('inf')
+    return -inf, inf
+
+
+def _encode(values, dtype, codec=None):
+    """
+    Return given bounds as an array of given dtype. Given the codec of the
+    interval class, datetime bounds are encoded as integers first, which is
+    much faster than letting NumPy convert the objects.
+    """
+    if codec is not None and dtype.kind == 'M':
+        return _encode_integers(values, dtype, codec)
+    negative, positive = _infinities(dtype)
+    encoded = []
+    for value in values:
+        if is_infinite(value):
+            value = negative if value < 0 else positive
+        elif dtype.kind == 'i' and not negative < value < positive:
+            # The extremes of the range stand for infinities, so storing
+            # them as finite bounds would not round trip.
+            raise ValueError(
+                'Integer bounds of an IntervalArray must be greater than %d '
+                'and less than %d, got %r.' % (negative, positive, value)
+            )
+        elif dtype.kind == 'M' and getattr(value, 'tzinfo', None) is not None:
+            raise ValueError(
+                'Timezone aware datetimes can not be stored in an '
+                'IntervalArray.'
+            )
+        encoded.append(value)
+    array = np.empty(len(encoded), dtype=dtype)
+    array[:] = encoded
+    return array
+
+
+def _encode_integers(values, dtype, codec):
+    info = np.iinfo(np.int64)
+    negative, positive = int(info.min) + 1, int(info.max)
+    encode = codec.encode
+    epoch = codec.epoch
+    encoded = []
+    for value in values:
+        # Checking the type is much faster than comparing against infinity.
+        if isinstance(value, Infinity):
+            encoded.append(negative if value < 0 else positive)
+            continue
+        if getattr(value, 'tzinfo', None) is not None:
+            raise ValueError(
+                'Timezone aware datetimes can not be stored in an '
+                'IntervalArray.'
+            )
+        encoded.append(encode(value) - epoch)
+    return np.array(encoded, dtype=np.int64).view(dtype)
+
+
+def _parse_strings(values, dtype, infinity):
+    """
+    Parse given ISO 8601 strings into an array of given datetime dtype.
+    Empty strings are parsed as given infinity.
+    """
+    strings = np.array(values, dtype=str)
+    lengths = np.char.str_len(strings)
+    # NumPy accepts partial dates such as '2000-01' and special strings such
+    # as 'today', and silently truncates datetimes to dates, so strings are
+    # checked against the grammar of the scalar parsers. The date part is
+    # checked for the whole column at once and only the rarer strings with
+    # a time part are matched one by one.
+    present = lengths != 0
+    chars = strings.astype('U11').reshape(-1, 1).view('U1')
+    valid = (
+        (lengths >= 10) &
+        (chars[:, 4] == '-') &
+        (chars[:, 7] == '-') &
+        np.all(np.char.isdigit(chars[:, [0, 1, 2, 3, 5, 6, 8, 9]]), axis=1)
+    )
+    if np.datetime_data(dtype)[0] == 'D':
+        valid &= lengths == 10
+    else:
+        for index in np.flatnonzero(valid & (lengths > 10)).tolist():
+            if iso_datetime_pattern.fullmatch(strings[index]) is None:
+                valid[index] = False
+    invalid = np.flatnonzero(present & ~valid)
+    if len(invalid):
+        raise ValueError(
+            'Invalid isoformat string: %r' % values[invalid[0]]
+        )
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        try:
+            array = strings.astype(dtype)
+        except Warning:
+            raise ValueError(
+                'Timezone aware datetimes can not be stored in an '
+                'IntervalArray.'
+            )
+    missing = np.isnat(array)
+    if np.any(missing & present):
+        raise ValueError('NaT is not a valid bound.')
+    array[missing] = infinity
+    return array
+
+
+def _decode(array):
+    negative, positive = _infinities(array.dtype)
+    values = array.tolist()
+    if array.dtype.kind != 'O':
+        for index in np.flatnonzero(array == negative).tolist():
+            values[index] = -inf
+        for index in np.flatnonzero(array == positive).tolist():
+            values[index] = inf
+    return values
+
+
+def _step(step, dtype):
+    if step is None:
+        return None
+    if isinstance(step, timedelta):
+        return np.timedelta64(step).astype(
+            'timedelta64[%s]' % np.datetime_data(dtype)[0]
+        )
+    return step
+
+
+class IntervalArray(object):
+    """
+    A columnar array of intervals backed by NumPy arrays.
+
+    The lower and upper bounds are stored as NumPy arrays of a dtype matching
+    the interval class (``int64`` for :class:`IntInterval`, ``float64`` for
+    :class:`FloatInterval`, ``datetime64`` for :class:`DateInterval` and
+    :class:`DateTimeInterval` and ``object`` for others) and the
+    inclusivity flags as boolean arrays. Infinite bounds of integer and
+    datetime arrays are represented by the extremes of the int64 range, so
+    finite integer bounds must lie strictly between them.
+    Datetime arrays hold the integer encoding of the ``codec`` of their
+    interval class, offset to the Unix epoch, see :mod:`intervals.encoding`.
+
+    ::
+
+        >>> from intervals import IntInterval, IntervalArray
+        >>> array = IntervalArray.from_intervals([
+        ...     IntInterval([1, 5]),
+        ...     IntInterval.closed_open(4, 8)
+        ... ])
+        >>> array.contains(5).tolist()
+        [True, True]
+        >>> array.contains(8).tolist()
+        [False, False]
+
+    NumPy is required for using this class.
+    """
+
+    def __init__(
+        self,
+        lower,
+        upper,
+        lower_inc=True,
+        upper_inc=True,
+        interval_class=FloatInterval,
+        step=None
+    ):
+        _require_numpy()
+        self.interval_class = interval_class
+        dtype = _dtype(interval_class)
+        self.lower = np.asarray(lower, dtype=dtype)
+        self.upper = np.asarray(upper, dtype=dtype)
+        self.lower_inc = np.broadcast_to(
+            np.asarray(lower_inc, dtype=bool), self.lower.shape
+        ).copy()
+        self.upper_inc = np.broadcast_to(
+            np.asarray(upper_inc, dtype=bool), self.upper.shape
+        ).copy()
+        self.step = step
+        if self.step is None:
+            self.step = interval_class.step
+
+    @classmethod
+    def from_intervals(cls, intervals, interval_class=None):
+        """
+        Create an IntervalArray from given sequence of intervals.
+
+        :param intervals: sequence of :class:`AbstractInterval` objects
+        :param interval_class:
+            Interval class of the array. If not given, the class of the first
+            interval is used.
+        """
+        _require_numpy()
+        intervals = list(intervals)
+        if interval_class is None:
+            if not intervals:
+                raise TypeError(
+                    'interval_class must be given for empty sequences.'
+                )
+            interval_class = type(intervals[0])
+        dtype = _dtype(interval_class)
+        codec = interval_class.codec
+        step = intervals[0].step if intervals else None
+        return cls(
+            _encode([interval.lower for interval in intervals], dtype, codec),
+            _encode([interval.upper for interval in intervals], dtype, codec),
+            [interval.lower_inc for interval in intervals],
+            [interval.upper_inc for interval in intervals],
+            interval_class=interval_class,
+            step=step
+        )
+
+    @classmethod
+    def from_strings(cls, strings, interval_class):
+        """
+        Create an IntervalArray by parsing given interval strings::
+
+            >>> from intervals import DateInterval
+            >>> array = IntervalArray.from_strings(
+            ...     ['[2000-01-01, 2000-02-01)', '2000-03-01 - 2000-03-31'],
+            ...     DateInterval
+            ... )
+            >>> array.lower
+            array(['2000-01-01', '2000-03-01'], dtype='datetime64[D]')
+
+        The ISO 8601 bounds of date and datetime intervals are parsed by
+        NumPy in bulk, directly into the integer encoding of the array,
+        without creating date or datetime objects. Other bounds are coerced
+        by the interval class one interval at a time.
+
+        :param strings: iterable of interval strings
+        :param interval_class: interval class of the array
+        """
+        _require_numpy()
+        parse_string = interval_class.string_parser.parse_string
+        lowers = []
+        uppers = []
+        lower_incs = []
+        upper_incs = []
+        for string in strings:
+            (lower, upper), lower_inc, upper_inc = parse_string(string)
+            lowers.append(lower)
+            uppers.append(upper)
+            lower_incs.append(lower_inc)
+            upper_incs.append(upper_inc)
+        dtype = _dtype(interval_class)
+        if dtype.kind != 'M':
+            return cls.from_intervals(
+                [
+                    interval_class([lower, upper], lower_inc, upper_inc)
+                    for lower, upper, lower_inc, upper_inc in zip(
+                        lowers, uppers, lower_incs, upper_incs
+                    )
+                ],
+                interval_class
+            )
+        negative, positive = _infinities(dtype)
+        lower = _parse_strings(lowers, dtype, negative)
+        upper = _parse_strings(uppers, dtype, positive)
+        invalid = np.flatnonzero(lower > upper)
+        if len(invalid):
+            raise RangeBoundsException(
+                lowers[invalid[0]], uppers[invalid[0]]
+            )
+        lower_inc = np.array(lower_incs, dtype=bool)
+        upper_inc = np.array(upper_incs, dtype=bool)
+        if np.any((lower == upper) & ~lower_inc & ~upper_inc):
+            raise IllegalArgument(
+                'The bounds may be equal only if at least one of the bounds '
+                'is closed.'
+            )
+        return cls(
+            lower,
+            upper,
+            lower_inc,
+            upper_inc,
+            interval_class=interval_class
+        )
+
+    def _interval(self, lower, upper, lower_inc, upper_inc):
+        kwargs = {}
+        if self.step != self.interval_class.step:
+            kwargs['step'] = self.step
+        return self.interval_class(
+            [lower, upper],
+            lower_inc=lower_inc,
+            upper_inc=upper_inc,
+            **kwargs
+        )
+
+    def to_intervals(self):
+        """
+        Return the intervals of this array as a list of interval objects.
+        """
+        return [
+            self._interval(*bounds)
+            for bounds in zip(
+                _decode(self.lower),
+                _decode(self.upper),
+                self.lower_inc.tolist(),
+                self.upper_inc.tolist()
+            )
+        ]
+
+    def _new(self, lower, upper, lower_inc, upper_inc):
+        return self.__class__(
+            lower,
+            upper,
+            lower_inc,
+            upper_inc,
+            interval_class=self.interval_class,
+            step=self.step
+        )
+
+    def __len__(self):
+        return len(self.lower)
+
+    def __iter__(self):
+        return iter(self.to_intervals())
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return self._new(
+                self.lower[index:index + 1 or None],
+                self.upper[index:index + 1 or None],
+                self.lower_inc[index:index + 1 or None],
+                self.upper_inc[index:index + 1 or None]
+            ).to_intervals()[0]
+        return self._new(
+            self.lower[index],
+            self.upper[index],
+            self.lower_inc[index],
+            self.upper_inc[index]
+        )
+
+    def __repr__(self):
+        return '%s(%r)' % (
+            self.__class__.__name__,
+            [str(interval) for interval in self]
+        )
+
+    def _coerce(self, other):
+        """
+        Return the bounds of given interval, IntervalArray or point as a
+        ``(lower, upper, lower_inc, upper_inc)`` tuple of broadcastable
+        values.
+        """
+        if isinstance(other, IntervalArray):
+            return other.lower, other.upper, other.lower_inc, other.upper_inc
+        dtype = self.lower.dtype
+        if not isinstance(other, AbstractInterval):
+            if isinstance(other, np.ndarray):
+                other = other.astype(dtype)
+                return other, other, np.True_, np.True_
+            other = self.interval_class(other)
+        lower, upper = _encode(
+            [other.lower, other.upper], dtype, self.interval_class.codec
+        )
+        return (
+            lower,
+            upper,
+            np.bool_(other.lower_inc),
+            np.bool_(other.upper_inc)
+        )
+
+    def contains(self, other):
+        """
+        Return a boolean array telling whether or not each interval of this
+        array contains given value, following the rules of
+        :meth:`AbstractInterval.__contains__`.
+
+        :param other:
+            A point, an array of points, an interval or an IntervalArray of
+            the same length.
+        """
+        lower, upper, lower_inc, upper_inc = self._coerce(other)
+        return (
+            (self.lower < lower) |
+            ((self.lower == lower) & (self.lower_inc | ~lower_inc))
+        ) & (
+            (self.upper > upper) |
+            ((self.upper == upper) & (self.upper_inc | ~upper_inc))
+        )
+
+    def is_connected(self, other):
+        """
+        Return a boolean array telling whether or not each interval of this
+        array is connected to given interval, following the rules of
+        :meth:`AbstractInterval.is_connected`.
+
+        :param other: An interval or an IntervalArray of the same length.
+        """
+        lower, upper, lower_inc, upper_inc = self._coerce(other)
+        return (
+            (self.upper > lower) & (upper > self.lower)
+        ) | (
+            (self.upper == lower) & (self.upper_inc | lower_inc)
+        ) | (
+            (self.lower == upper) & (self.lower_inc | upper_inc)
+        )
+
+    def __and__(self, other):
+        """
+        Return the elementwise intersection of this array and given interval
+        or IntervalArray.
+
+        Like :meth:`AbstractInterval.__and__`, this raises
+        :class:`IllegalArgument` if any of the intervals are not connected.
+        Use :meth:`is_connected` for selecting the intersecting intervals
+        first.
+        """
+        if not self.is_connected(other).all():
+            raise IllegalArgument(
+                'Intersection is only supported for connected intervals.'
+            )
+        lower, upper, lower_inc, upper_inc = self._coerce(other)
+        lower_inc = np.where(
+            self.lower < lower,
+            lower_inc,
+            np.where(
+                self.lower > lower,
+                self.lower_inc,
+                self.lower_inc & lower_inc
+            )
+        )
+        upper_inc = np.where(
+            self.upper > upper,
+            upper_inc,
+            np.where(
+                self.upper < upper,
+                self.upper_inc,
+                self.upper_inc & upper_inc
+            )
+        )
+        return self._new(
+            np.maximum(self.lower, lower),
+            np.minimum(self.upper, upper),
+            lower_inc,
+            upper_inc
+        )
+
+    def _bounded(self):
+        negative, positive = _infinities(self.lower.dtype)
+        return (self.lower != negative) & (self.upper != positive)
+
+    @property
+    def discrete(self):
+        return self.step is not None
+
+    @property
+    def empty(self):
+        """
+        Return a boolean array telling whether or not each interval of this
+        array is empty.
+        """
+        empty = (self.upper == self.lower) & ~(self.lower_inc & self.upper_inc)
+        if self.discrete:
+            step = _step(self.step, self.lower.dtype)
+            empty |= (
+                (self.upper - self.lower == step) &
+                ~(self.upper_inc | self.lower_inc)
+            )
+        return empty
+
+    @property
+    def length(self):
+        """
+        Return the lengths of the intervals of this array. Lengths of
+        unbounded intervals are inf for float arrays, the largest int64 for
+        integer arrays, like infinite bounds, and NaT for datetime arrays.
+        """
+        lower = self.lower
+        upper = self.upper
+        if self.discrete:
+            step = _step(self.step, self.lower.dtype)
+            lower = np.where(self.lower_inc, lower, lower + step)
+            upper = np.where(self.upper_inc, upper, upper - step)
+        length = upper - lower
+        if self.discrete:
+            length = np.where(self.empty, length - length, length)
+        bounded = self._bounded()
+        if length.dtype.kind == 'i':
+            return np.where(bounded, length, _infinities(length.dtype)[1])
+        if length.dtype.kind == 'm':
+            return np.where(bounded, length, np.timedelta64('NaT'))
+        if length.dtype.kind == 'O':
+            return np.where(bounded, length, inf)
+        return np.where(bounded, length.astype(np.float64), np.inf)
+
+    @property
+    def centre(self):
+        """
+        Return the centres of the intervals of this array as a float array.
+        """
+        if self.lower.dtype.kind == 'M':
+            raise TypeError('Centre is not supported for datetime intervals.')
+        negative, positive = _infinities(self.lower.dtype)
+        lower = np.where(
+            self.lower == negative, -np.inf, self.lower.astype(np.float64)
+        )
+        upper = np.where(
+            self.upper == positive, np.inf, self.upper.astype(np.float64)
+        )
+        return (lower + upper) / 2
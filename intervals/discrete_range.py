@@ -0,0 +1,96 @@
+import operator
+
+
+class DiscreteRange(object):
+    """
+    A lazy sequence of evenly spaced values, returned when slicing a
+    discrete interval with a slice step::
+
+        >>> from intervals import IntInterval
+        >>> values = IntInterval([1, 10])[2:8:2]
+        >>> values
+        DiscreteRange(3, 3, 2)
+        >>> list(values), len(values)
+        ([3, 5, 7], 3)
+        >>> 5 in values, 4 in values
+        (True, False)
+
+    Unlike an interval, which contains every value between its bounds, a
+    range contains only the values it produces, like a ``range``. Values can
+    be of any type supporting addition of the step, such as dates with a
+    ``timedelta`` step.
+
+    :param start: the first value
+    :param count: the number of values
+    :param step: the difference between consecutive values
+    """
+
+    __slots__ = ('start', 'count', 'step')
+
+    def __init__(self, start, count, step):
+        self.start = start
+        self.count = count
+        self.step = step
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        start, step = self.start, self.step
+        if isinstance(start, int) and isinstance(step, int):
+            return iter(range(start, start + self.count * step, step))
+        return (start + index * step for index in range(self.count))
+
+    def __reversed__(self):
+        start, step = self.start, self.step
+        return (start + index * step for index in reversed(range(self.count)))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            indexes = range(self.count)[index]
+            return DiscreteRange(
+                self.start + indexes.start * self.step,
+                len(indexes),
+                self.step * indexes.step
+            )
+        index = operator.index(index)
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError('DiscreteRange index out of range.')
+        return self.start + index * self.step
+
+    def __contains__(self, value):
+        try:
+            quotient, remainder = divmod(value - self.start, self.step)
+        except TypeError:
+            return False
+        return not remainder and 0 <= quotient < self.count
+
+    def _key(self):
+        # Like ranges, sequences of equal values are equal regardless of
+        # the start of empty ranges and the step of single value ranges.
+        if not self.count:
+            return 0, None, None
+        if self.count == 1:
+            return 1, self.start, None
+        return self.count, self.start, self.step
+
+    def __eq__(self, other):
+        if not isinstance(other, DiscreteRange):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        return '%s(%r, %r, %r)' % (
+            self.__class__.__name__,
+            self.start,
+            self.count,
+            self.step
+        )
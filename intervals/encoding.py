@@ -0,0 +1,180 @@
+"""
+Integer encoding of date and datetime bounds.
+
+Dates are encoded as proleptic Gregorian ordinals, where January 1 of year 1
+is 1, and datetimes as microseconds since the Unix epoch::
+
+    >>> from datetime import date, datetime
+    >>> from intervals.encoding import date_codec, datetime_codec
+    >>> date_codec.encode(date(2000, 1, 1))
+    730120
+    >>> datetime_codec.encode(datetime(1970, 1, 2))
+    86400000000
+    >>> datetime_codec.decode(946728000000000)
+    datetime.datetime(2000, 1, 1, 12, 0)
+
+The codec of an interval class is available as its ``codec`` attribute, or
+``None`` for classes whose bounds have no integer encoding. Columnar
+structures such as :class:`~intervals.IntervalArray` use the codecs for
+converting bounds in bulk. Infinite bounds are not encoded, so callers have
+to handle them separately.
+
+Codecs also parse ISO 8601 strings, which is how :class:`DateInterval` and
+:class:`DateTimeInterval` coerce string bounds::
+
+    >>> date_codec.parse('2000-01-01')
+    datetime.date(2000, 1, 1)
+"""
+import re
+from datetime import date, datetime, timedelta, timezone
+
+EPOCH = datetime(1970, 1, 1)
+UTC_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Digits are matched with [0-9] since \d also matches non-ASCII digits.
+iso_date_pattern = re.compile(r'([0-9]{4})-([0-9]{2})-([0-9]{2})')
+iso_datetime_pattern = re.compile(
+    r'([0-9]{4})-([0-9]{2})-([0-9]{2})'
+    r'(?:[T ]([0-9]{2}):([0-9]{2})'
+    r'(?::([0-9]{2})(?:\.([0-9]{1,6}))?)?'
+    r'(Z|[+-][0-9]{2}:[0-9]{2})?)?'
+)
+
+
+def _match(pattern, value):
+    match = pattern.fullmatch(value)
+    if match is None:
+        raise ValueError('Invalid isoformat string: %r' % value)
+    return match
+
+
+def _parse_date(value):
+    """
+    Parse dates in ``YYYY-MM-DD`` format, for Pythons without
+    ``date.fromisoformat``.
+    """
+    return date(*map(int, _match(iso_date_pattern, value).groups()))
+
+
+def _parse_datetime(value):
+    """
+    Parse datetimes in ``YYYY-MM-DD[THH:MM[:SS[.ffffff]][+HH:MM]]`` format,
+    for Pythons without ``datetime.fromisoformat``. A ``Z`` or a UTC offset
+    returns a timezone aware datetime.
+    """
+    return _datetime(_match(iso_datetime_pattern, value))
+
+
+def _datetime(match):
+    fraction = match.group(7) or '0'
+    offset = match.group(8)
+    tzinfo = None
+    if offset == 'Z':
+        tzinfo = timezone.utc
+    elif offset is not None:
+        delta = timedelta(hours=int(offset[1:3]), minutes=int(offset[4:]))
+        tzinfo = timezone(-delta if offset[0] == '-' else delta)
+    return datetime(
+        *[int(part or 0) for part in match.groups()[:6]],
+        microsecond=int(fraction.ljust(6, '0')),
+        tzinfo=tzinfo
+    )
+
+
+if hasattr(datetime, 'fromisoformat'):
+    # The C implementations of fromisoformat are much faster than building
+    # the values from the groups of the match. The strings are still
+    # matched against the patterns first, since the formats accepted by
+    # fromisoformat differ between Python versions.
+    def parse_date(value):
+        _match(iso_date_pattern, value)
+        return date.fromisoformat(value)
+
+    def parse_datetime(value):
+        match = _match(iso_datetime_pattern, value)
+        fraction = match.group(7)
+        if (
+            match.group(8) == 'Z' or
+            fraction is not None and len(fraction) not in (3, 6)
+        ):
+            # Not supported by fromisoformat before Python 3.11
+            return _datetime(match)
+        return datetime.fromisoformat(value)
+else:
+    parse_date = _parse_date
+    parse_datetime = _parse_datetime
+
+
+class DateCodec(object):
+    """
+    Encode dates as proleptic Gregorian ordinals.
+    """
+
+    #: NumPy datetime64 unit of the encoded values
+    unit = 'D'
+
+    #: Encoded value of the Unix epoch, which is zero in NumPy
+    epoch = EPOCH.toordinal()
+
+    def encode(self, value):
+        return value.toordinal()
+
+    def decode(self, number):
+        return date.fromordinal(number)
+
+    def parse(self, value):
+        """
+        Return the date of given ISO 8601 string.
+        """
+        return parse_date(value)
+
+
+class DateTimeCodec(object):
+    """
+    Encode datetimes as microseconds since the Unix epoch.
+
+    Timezone aware datetimes are encoded as the microseconds of their UTC
+    time, so equal instants have equal encodings regardless of their
+    timezones.
+    """
+
+    #: NumPy datetime64 unit of the encoded values
+    unit = 'us'
+
+    #: Encoded value of the Unix epoch, which is zero in NumPy
+    epoch = 0
+
+    def encode(self, value):
+        if value.tzinfo is None:
+            delta = value - EPOCH
+        else:
+            delta = value - UTC_EPOCH
+        return (
+            (delta.days * 86400 + delta.seconds) * 1000000 +
+            delta.microseconds
+        )
+
+    def decode(self, number, tzinfo=None):
+        """
+        Return the datetime of given encoded value.
+
+        :param number: microseconds since the Unix epoch
+        :param tzinfo:
+            Timezone of the returned datetime. If not given, a naive
+            datetime is returned.
+        """
+        delta = timedelta(microseconds=number)
+        if tzinfo is None:
+            return EPOCH + delta
+        return (UTC_EPOCH + delta).astimezone(tzinfo)
+
+    def parse(self, value):
+        """
+        Return the datetime of given ISO 8601 string. Strings of dates
+        return datetimes at midnight.
+        """
+        return parse_datetime(value)
+
+
+date_codec = DateCodec()
+datetime_codec = DateTimeCodec()
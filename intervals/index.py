@@ -0,0 +1,478 @@
+from itertools import count
+from operator import itemgetter
+
+from infinity import is_infinite
+
+
+def _bounds(interval):
+    return (
+        interval.lower,
+        interval.lower_inc,
+        interval.upper,
+        interval.upper_inc,
+        interval
+    )
+
+
+def _contains_point(bounds, point):
+    lower, lower_inc, upper, upper_inc = bounds[:4]
+    return (
+        (lower < point or (lower == point and lower_inc)) and
+        (point < upper or (point == upper and upper_inc))
+    )
+
+
+def _is_connected(bounds, other):
+    """
+    Return whether or not given bounds are connected, following the rules of
+    :meth:`AbstractInterval.is_connected`.
+    """
+    lower, lower_inc, upper, upper_inc = bounds[:4]
+    other_lower, other_lower_inc, other_upper, other_upper_inc = other[:4]
+    return upper > other_lower and other_upper > lower or (
+        upper == other_lower and (upper_inc or other_lower_inc)
+    ) or (
+        lower == other_upper and (lower_inc or other_upper_inc)
+    )
+
+
+def _lower_key(bounds):
+    return bounds[0], not bounds[1]
+
+
+_upper_key = itemgetter(2)
+
+
+class _Node(object):
+    __slots__ = ('center', 'by_lower', 'by_upper', 'left', 'right')
+
+    def __init__(self, center, by_lower, left, right):
+        self.center = center
+        self.by_lower = by_lower
+        self.by_upper = sorted(by_lower, key=_upper_key, reverse=True)
+        self.left = left
+        self.right = right
+
+
+def _build(items):
+    """
+    Build a centered interval tree from given bounds sorted by lower bound.
+
+    The center of each node is the lower bound of the median item, so every
+    node holds at least one item and the tree has O(log n) depth.
+    """
+    if not items:
+        return None
+    center = items[len(items) // 2][0]
+    left = []
+    middle = []
+    right = []
+    for item in items:
+        if item[2] < center:
+            left.append(item)
+        elif item[0] > center:
+            right.append(item)
+        else:
+            middle.append(item)
+    return _Node(center, middle, _build(left), _build(right))
+
+
+class IntervalIndex(object):
+    """
+    A static index over a collection of intervals, implemented as a centered
+    interval tree. Stabbing and overlap queries take O(log n + k) time,
+    where k is the number of reported intervals.
+
+    ::
+
+        >>> from intervals import IntInterval, IntervalIndex
+        >>> index = IntervalIndex([
+        ...     IntInterval([1, 5]),
+        ...     IntInterval.closed_open(4, 8),
+        ...     IntInterval([10, 12])
+        ... ])
+        >>> sorted(index.containing(4), key=lambda i: i.upper)
+        [IntInterval('[1, 5]'), IntInterval('[4, 8)')]
+        >>> index.overlapping(IntInterval([9, 10]))
+        [IntInterval('[10, 12]')]
+
+    The order of the reported intervals is unspecified.
+
+    :param intervals: iterable of :class:`AbstractInterval` objects
+    """
+
+    def __init__(self, intervals=()):
+        self._intervals = list(intervals)
+        self._root = _build(
+            sorted(map(_bounds, self._intervals), key=_lower_key)
+        )
+
+    def __len__(self):
+        return len(self._intervals)
+
+    def __iter__(self):
+        return iter(self._intervals)
+
+    def containing(self, point):
+        """
+        Return all intervals that contain given point.
+
+        :param point: a value comparable with the bounds of the intervals
+        """
+        result = []
+        node = self._root
+        while node is not None:
+            if point < node.center:
+                for item in node.by_lower:
+                    if item[0] > point:
+                        break
+                    if _contains_point(item, point):
+                        result.append(item[4])
+                node = node.left
+            elif point > node.center:
+                for item in node.by_upper:
+                    if item[2] < point:
+                        break
+                    if _contains_point(item, point):
+                        result.append(item[4])
+                node = node.right
+            else:
+                for item in node.by_lower:
+                    if _contains_point(item, point):
+                        result.append(item[4])
+                node = None
+        return result
+
+    def overlapping(self, interval):
+        """
+        Return all intervals connected to given interval. Inclusivity of the
+        bounds is handled the same way as in
+        :meth:`AbstractInterval.is_connected`.
+
+        :param interval: :class:`AbstractInterval` object
+        """
+        query = _bounds(interval)
+        lower, upper = query[0], query[2]
+        result = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            if upper < node.center:
+                for item in node.by_lower:
+                    if item[0] > upper:
+                        break
+                    if _is_connected(item, query):
+                        result.append(item[4])
+            elif lower > node.center:
+                for item in node.by_upper:
+                    if item[2] < lower:
+                        break
+                    if _is_connected(item, query):
+                        result.append(item[4])
+            else:
+                for item in node.by_lower:
+                    if _is_connected(item, query):
+                        result.append(item[4])
+            if lower < node.center:
+                stack.append(node.left)
+            if upper > node.center:
+                stack.append(node.right)
+        return result
+
+
+class _TreeNode(object):
+    __slots__ = ('key', 'item', 'left', 'right', 'height', 'max_upper')
+
+    def __init__(self, key, item):
+        self.key = key
+        self.item = item
+        self.left = None
+        self.right = None
+        self.height = 1
+        self.max_upper = item[2]
+
+
+def _height(node):
+    return 0 if node is None else node.height
+
+
+def _update(node):
+    """
+    Update the height and the maximum upper bound of the subtree of given
+    node from its children.
+    """
+    left, right = node.left, node.right
+    node.height = 1 + max(_height(left), _height(right))
+    max_upper = node.item[2]
+    if left is not None and left.max_upper > max_upper:
+        max_upper = left.max_upper
+    if right is not None and right.max_upper > max_upper:
+        max_upper = right.max_upper
+    node.max_upper = max_upper
+
+
+def _rotate_left(node):
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rotate_right(node):
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rebalance(node):
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
+def _insert(node, new):
+    if node is None:
+        return new
+    if new.key < node.key:
+        node.left = _insert(node.left, new)
+    else:
+        node.right = _insert(node.right, new)
+    return _rebalance(node)
+
+
+def _delete_min(node):
+    """
+    Remove the leftmost node of given subtree and return the new root of
+    the subtree along with the removed node.
+    """
+    if node.left is None:
+        return node.right, node
+    node.left, removed = _delete_min(node.left)
+    return _rebalance(node), removed
+
+
+def _delete(node, key):
+    if key < node.key:
+        node.left = _delete(node.left, key)
+    elif key > node.key:
+        node.right = _delete(node.right, key)
+    else:
+        if node.left is None:
+            return node.right
+        if node.right is None:
+            return node.left
+        right, successor = _delete_min(node.right)
+        successor.left = node.left
+        successor.right = right
+        node = successor
+    return _rebalance(node)
+
+
+def _equal_bounds(interval):
+    """
+    Return the bounds of the intervals equal to given interval. Discrete
+    intervals equal each other when their canonical bounds are equal, so
+    each finite bound can be either inclusive or exclusive of the
+    neighbouring value.
+    """
+    bounds = _bounds(interval)[:4]
+    if not interval.discrete or interval.empty:
+        return [bounds]
+    lower, _, upper, _ = interval.canonical_bounds()
+    step = interval.step
+    lowers = [(lower, True), _neighbour(lower, -step, False)]
+    uppers = [(upper, False), _neighbour(upper, -step, True)]
+    return [lower + upper for lower in lowers for upper in uppers]
+
+
+def _neighbour(value, step, inc):
+    """
+    Return the other form of given canonical bound as a ``(value, inc)``
+    pair.
+    """
+    if is_infinite(value):
+        return value, inc
+    try:
+        return value + step, inc
+    except OverflowError:
+        # The bound is at the limit of its type, so it has only one form.
+        return value, not inc
+
+
+class MutableIntervalIndex(object):
+    """
+    A mutable index over a collection of intervals with payloads,
+    implemented as an AVL tree ordered by lower bounds and augmented with
+    the maximum upper bound of each subtree::
+
+        >>> from intervals import IntInterval, MutableIntervalIndex
+        >>> index = MutableIntervalIndex()
+        >>> index.add(IntInterval.closed_open(9, 12), 'alice')
+        >>> index.add(IntInterval.closed_open(9, 12), 'bob')
+        >>> index.add(IntInterval.closed_open(13, 15), 'alice')
+        >>> index.containing(10)
+        [(IntInterval('[9, 12)'), 'alice'), (IntInterval('[9, 12)'), 'bob')]
+        >>> index.remove(IntInterval.closed_open(9, 12), 'alice')
+        >>> index.overlapping(IntInterval([11, 14]))
+        [(IntInterval('[9, 12)'), 'bob'), (IntInterval('[13, 15)'), 'alice')]
+
+    Intervals are added and removed in O(log n) time, and stabbing and
+    overlap queries take O(log n) time per reported interval. The same
+    interval can be added several times, with equal or different payloads.
+    Queries report ``(interval, payload)`` pairs sorted by their bounds,
+    with equal intervals in insertion order.
+
+    :param intervals: iterable of :class:`AbstractInterval` objects
+    :param payloads:
+        Optional iterable of the payloads of the intervals. Each interval
+        has a payload of ``None`` by default.
+    """
+
+    def __init__(self, intervals=(), payloads=None):
+        self._root = None
+        self._size = 0
+        self._counter = count()
+        if payloads is None:
+            for interval in intervals:
+                self.add(interval)
+        else:
+            for interval, payload in zip(intervals, payloads):
+                self.add(interval, payload)
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        """
+        Return an iterator of the ``(interval, payload)`` pairs of this
+        index, sorted by lower bound.
+        """
+        stack = []
+        node = self._root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.item[4:]
+            node = node.right
+
+    def add(self, interval, payload=None):
+        """
+        Add given interval with given payload to this index.
+
+        :param interval: :class:`AbstractInterval` object
+        :param payload: value reported along with the interval
+        """
+        item = _bounds(interval) + (payload,)
+        key = (item[0], not item[1], item[2], item[3], next(self._counter))
+        self._root = _insert(self._root, _TreeNode(key, item))
+        self._size += 1
+
+    def remove(self, interval, payload=None):
+        """
+        Remove given interval with given payload from this index. Intervals
+        are matched by equality, so for example ``IntInterval([5, 11])``
+        removes an added ``IntInterval.closed_open(5, 12)``. If the interval
+        has been added several times with equal payloads, the earliest added
+        one is removed. :exc:`KeyError` is raised if the index does not
+        contain the interval.
+
+        Entries are ordered by their bounds, so the removal takes O(log n)
+        time plus the number of entries of the interval with other
+        payloads.
+
+        :param interval: :class:`AbstractInterval` object
+        :param payload: payload the interval was added with
+        """
+        found = None
+        for bounds in _equal_bounds(interval):
+            key = bounds[0], not bounds[1], bounds[2], bounds[3]
+            stack = [self._root]
+            while stack:
+                node = stack.pop()
+                if node is None:
+                    continue
+                node_key = node.key[:4]
+                if node_key < key:
+                    stack.append(node.right)
+                elif node_key > key:
+                    stack.append(node.left)
+                else:
+                    if (
+                        node.item[5] == payload and
+                        (found is None or node.key < found.key) and
+                        node.item[4] == interval
+                    ):
+                        found = node
+                    stack.append(node.left)
+                    stack.append(node.right)
+        if found is None:
+            raise KeyError(interval)
+        self._root = _delete(self._root, found.key)
+        self._size -= 1
+
+    def _search(self, lower, upper, test):
+        """
+        Return the ``(interval, payload)`` pairs of the items passing given
+        test, visiting only the subtrees that may contain items connected
+        to the bounds from given lower value to given upper value.
+        """
+        result = []
+        stack = []
+        node = self._root
+        while True:
+            while node is not None and not node.max_upper < lower:
+                stack.append(node)
+                node = node.left
+            if not stack:
+                return result
+            node = stack.pop()
+            if node.item[0] > upper:
+                return result
+            if test(node.item):
+                result.append(node.item[4:])
+            node = node.right
+
+    def containing(self, point):
+        """
+        Return the ``(interval, payload)`` pairs of all intervals that
+        contain given point.
+
+        :param point: a value comparable with the bounds of the intervals
+        """
+        return self._search(
+            point,
+            point,
+            lambda item: _contains_point(item, point)
+        )
+
+    def overlapping(self, interval):
+        """
+        Return the ``(interval, payload)`` pairs of all intervals connected
+        to given interval. Inclusivity of the bounds is handled the same way
+        as in :meth:`AbstractInterval.is_connected`.
+
+        :param interval: :class:`AbstractInterval` object
+        """
+        query = _bounds(interval)
+        return self._search(
+            query[0],
+            query[2],
+            lambda item: _is_connected(item, query)
+        )
@@ -0,0 +1,164 @@
+"""
+Opt-in counters for the hot paths of intervals.
+
+Instrumentation is disabled by default. It can be enabled for the whole
+process by setting the ``INTERVALS_STATS`` environment variable to ``1``,
+or to ``timing`` for also timing constructions, or for a block of code::
+
+    >>> from intervals import IntInterval, instrumentation
+    >>> with instrumentation.collect() as stats:
+    ...     interval = IntInterval.from_string('[1, 5]')
+    ...     interval == IntInterval([1, 5])
+    True
+    >>> stats['constructions']
+    {'IntInterval': 2}
+
+The following events are counted:
+
+``constructions``
+    Intervals created with the full constructor, by class.
+``construction_time``
+    Seconds spent in the full constructor, by class. Only recorded when
+    timing is enabled.
+``trusted_constructions``
+    Intervals created with :meth:`AbstractInterval.from_bounds`, by class.
+``coercions``
+    Operands of interval operators that had to be coerced into intervals of
+    the class of the other operand, by class.
+``string_parses``
+    Interval strings parsed.
+``canonicalizations``
+    Canonical bounds computed for discrete intervals, by class. Canonical
+    bounds are cached, so each interval is counted at most once.
+``factory_fallbacks``
+    Interval classes tried by :class:`IntervalFactory` that could not
+    create the interval, by class.
+
+When instrumentation is disabled, the hot paths only check the module level
+``enabled`` flag. Counters are not synchronized between threads, so counts
+of concurrent threads may be slightly off.
+"""
+import os
+import time
+from contextlib import contextmanager
+
+enabled = False
+_timing = False
+_stats = {}
+
+
+def enable(timing=False):
+    """
+    Enable counting of events.
+
+    :param timing: whether or not to also time constructions
+    """
+    global enabled, _timing
+    enabled = True
+    _timing = timing
+
+
+def disable():
+    """
+    Disable counting of events. Collected stats are kept.
+    """
+    global enabled, _timing
+    enabled = False
+    _timing = False
+
+
+def reset():
+    """
+    Clear all collected stats.
+    """
+    _stats.clear()
+
+
+def get_stats():
+    """
+    Return the collected stats as a plain dict.
+    """
+    return {
+        event: dict(value) if isinstance(value, dict) else value
+        for event, value in _stats.items()
+    }
+
+
+def record(event, key=None):
+    """
+    Count an event.
+
+    :param event: name of the event
+    :param key: optional key, such as a class name, for grouping the counts
+    """
+    if key is None:
+        _stats[event] = _stats.get(event, 0) + 1
+    else:
+        counts = _stats.setdefault(event, {})
+        counts[key] = counts.get(key, 0) + 1
+
+
+def started():
+    """
+    Return the start time of a construction if timing is enabled.
+    """
+    if _timing:
+        return time.perf_counter()
+
+
+def record_construction(interval_class, started):
+    """
+    Count a construction of given interval class and add the time elapsed
+    since given start time, if any, to its construction time.
+    """
+    key = interval_class.__name__
+    record('constructions', key)
+    if started is not None:
+        times = _stats.setdefault('construction_time', {})
+        times[key] = times.get(key, 0.0) + time.perf_counter() - started
+
+
+def _difference(after, before):
+    difference = {}
+    for event, value in after.items():
+        if isinstance(value, dict):
+            previous = before.get(event, {})
+            counts = {
+                key: count - previous.get(key, 0)
+                for key, count in value.items()
+                if count != previous.get(key, 0)
+            }
+            if counts:
+                difference[event] = counts
+        elif value != before.get(event, 0):
+            difference[event] = value - before.get(event, 0)
+    return difference
+
+
+@contextmanager
+def collect(timing=False):
+    """
+    Enable instrumentation for a block of code, yielding a dict that is
+    filled with the stats collected within the block when it exits.
+
+    :param timing: whether or not to also time constructions
+    """
+    previous = enabled, _timing
+    before = get_stats()
+    stats = {}
+    enable(timing=timing)
+    try:
+        yield stats
+    finally:
+        if previous[0]:
+            enable(timing=previous[1])
+        else:
+            disable()
+        stats.update(_difference(get_stats(), before))
+
+
+_setting = os.environ.get('INTERVALS_STATS', '').strip().lower()
+if _setting == 'timing':
+    enable(timing=True)
+elif _setting not in ('', '0', 'false', 'no', 'off'):
+    enable()
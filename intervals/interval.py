@@ -7,15 +7,19 @@ https://en.wikipedia.org/wiki/Interval_(mathematics)
 """
 
 # -*- coding: utf-8 -*-
+import itertools
 import operator
 from datetime import date, datetime, timedelta
-from decimal import Decimal
+from decimal import Decimal, ROUND_HALF_UP
 from math import ceil, floor
 
 from infinity import inf, is_infinite
 
+from . import instrumentation
+from .discrete_range import DiscreteRange
+from .encoding import date_codec, datetime_codec
 from .exc import IllegalArgument, IntervalException, RangeBoundsException
-from .parser import IntervalParser, IntervalStringParser
+from .parser import IntervalParser, string_parser
 
 
 def is_number(number):
@@ -40,6 +44,14 @@ def py2round(value):
         return float(ceil(float(value)-0.5))
 
 
+def _floor_divide(value, size):
+    quotient = value // size
+    if quotient * size > value:
+        # Decimal division truncates towards zero.
+        quotient -= 1
+    return quotient
+
+
 def canonicalize_lower(interval, inc=True):
     if not interval.lower_inc and inc:
         return interval.lower + interval.step, True
@@ -68,18 +80,29 @@ def canonicalize(interval, lower_inc=True, upper_inc=False):
     if interval.empty:
         return interval
 
-    lower, lower_inc = canonicalize_lower(interval, lower_inc)
-    upper, upper_inc = canonicalize_upper(interval, upper_inc)
+    if lower_inc and not upper_inc:
+        lower, lower_inc, upper, upper_inc = interval.canonical_bounds()
+    else:
+        lower, lower_inc = canonicalize_lower(interval, lower_inc)
+        upper, upper_inc = canonicalize_upper(interval, upper_inc)
 
-    return interval.__class__(
-        [lower, upper],
-        lower_inc=lower_inc,
-        upper_inc=upper_inc,
-    )
+    return interval.__class__.from_bounds(lower, upper, lower_inc, upper_inc)
+
+
+def validate_open_bounds(lower, upper, lower_inc, upper_inc):
+    if lower == upper and not lower_inc and not upper_inc:
+        raise IllegalArgument(
+            'The bounds may be equal only if at least one of the bounds '
+            'is closed.'
+        )
 
 
 def coerce_interval(func):
     def wrapper(self, arg):
+        if arg.__class__ is self.__class__:
+            return func(self, arg)
+        if instrumentation.enabled:
+            instrumentation.record('coercions', self.__class__.__name__)
         if (
             isinstance(arg, list) or
             isinstance(arg, tuple) or
@@ -101,10 +124,58 @@ def coerce_interval(func):
     return wrapper
 
 
-class AbstractInterval(object):
-    step = None
+class Step(object):
+    """
+    Descriptor for the step of an interval.
+
+    Intervals use ``__slots__``, so the step of each instance is stored in
+    the ``_step`` slot. Accessing the step through the class returns the
+    default step of the class. Like the bounds, the step of an interval can
+    not be changed after initialization.
+    """
+
+    def __get__(self, interval, interval_class):
+        if interval is None:
+            return interval_class._default_step
+        return interval._step
+
+    def __set__(self, interval, value):
+        raise AttributeError('Intervals are immutable.')
+
+
+class IntervalMeta(type):
+    """
+    Metaclass of interval classes, which turns the ``step`` class attribute
+    of subclasses into their default step, so that the step of each
+    instance can still be overridden.
+    """
+
+    def __init__(cls, name, bases, attrs):
+        super(IntervalMeta, cls).__init__(name, bases, attrs)
+        step = attrs.get('step')
+        if 'step' in attrs and not isinstance(step, Step):
+            cls._default_step = step
+            delattr(cls, 'step')
+
+
+class AbstractInterval(object, metaclass=IntervalMeta):
+    __slots__ = (
+        '_lower',
+        '_upper',
+        '_lower_inc',
+        '_upper_inc',
+        '_step',
+        '_canonical',
+        '_hash'
+    )
+
+    _default_step = None
+    step = Step()
     type = None
     parser = IntervalParser()
+    string_parser = string_parser
+    string_cache = None
+    codec = None
 
     def __init__(
         self,
@@ -173,26 +244,80 @@ class AbstractInterval(object):
                 'method.'
             )
 
-        if step is not None:
-            self.step = step
-        self.lower, self.upper, self.lower_inc, self.upper_inc = (
+        instrumented = instrumentation.enabled
+        if instrumented:
+            started = instrumentation.started()
+        self._step = self._default_step if step is None else step
+        self._canonical = None
+        self._hash = None
+        lower, upper, self._lower_inc, self._upper_inc = (
             self.parser(bounds, lower_inc, upper_inc)
         )
+        self._lower = self.coerce_bound(lower, -inf)
+        self._upper = self.coerce_bound(upper, inf)
 
         if self.lower > self.upper:
             raise RangeBoundsException(
                 self.lower,
                 self.upper
             )
-        if (
-            self.lower == self.upper and
-            not self.lower_inc and
-            not self.upper_inc
-        ):
-            raise IllegalArgument(
-                'The bounds may be equal only if at least one of the bounds '
-                'is closed.'
-            )
+        validate_open_bounds(
+            self.lower,
+            self.upper,
+            self.lower_inc,
+            self.upper_inc
+        )
+        if instrumented:
+            instrumentation.record_construction(self.__class__, started)
+
+    @classmethod
+    def from_bounds(
+        cls,
+        lower,
+        upper,
+        lower_inc=True,
+        upper_inc=True,
+        step=None
+    ):
+        """
+        Create an interval from bounds that are already of the type of this
+        interval class and rounded by its step.
+
+        Unlike the constructor, this skips parsing, coercion and rounding of
+        the bounds, so it should only be used for bounds known to be valid,
+        such as the bounds of existing intervals::
+
+            >>> IntInterval.from_bounds(1, 5, upper_inc=False)
+            IntInterval('[1, 5)')
+
+        :param lower: lower bound
+        :param upper: upper bound
+        :param lower_inc: whether or not the lower bound is inclusive
+        :param upper_inc: whether or not the upper bound is inclusive
+        :param step: step of the interval, defaults to the step of the class
+        """
+        if instrumentation.enabled:
+            instrumentation.record('trusted_constructions', cls.__name__)
+        validate_open_bounds(lower, upper, lower_inc, upper_inc)
+        interval = cls.__new__(cls)
+        interval._step = cls._default_step if step is None else step
+        interval._canonical = None
+        interval._hash = None
+        interval._lower = lower
+        interval._upper = upper
+        interval._lower_inc = lower_inc
+        interval._upper_inc = upper_inc
+        return interval
+
+    def __reduce__(self):
+        """
+        Pickle intervals by their bounds only. Unpickling goes through
+        :meth:`from_bounds`, so the bounds are not parsed or coerced again.
+        """
+        args = (self._lower, self._upper, self._lower_inc, self._upper_inc)
+        if self._step != self._default_step:
+            args += (self._step,)
+        return self.__class__.from_bounds, args
 
     @classmethod
     def open(cls, lower_bound, upper_bound, **kwargs):
@@ -277,17 +402,42 @@ class AbstractInterval(object):
 
     @classmethod
     def from_string(cls, bounds_string, **kwargs):
-        return cls(
-            *IntervalStringParser().parse_string(bounds_string),
-            **kwargs
-        )
+        """
+        Create an interval from given string::
+
+            >>> IntInterval.from_string('[1, 5)')
+            IntInterval('[1, 5)')
 
-    def copy_args(self, interval):
-        self.lower_inc = interval.lower_inc
-        self.upper_inc = interval.upper_inc
-        self.lower = interval.lower
-        self.upper = interval.upper
-        self.type = interval.type
+        Repeated strings can be cached by assigning an :class:`LRUCache` to
+        the ``string_cache`` attribute of the interval class. Cached
+        intervals are shared, which is safe as intervals are immutable::
+
+            >>> from intervals import LRUCache
+            >>> class CachedInterval(IntInterval):
+            ...     string_cache = LRUCache(maxsize=1000)
+            >>> CachedInterval.from_string('[1, 5)') is (
+            ...     CachedInterval.from_string('[1, 5)')
+            ... )
+            True
+
+        :param bounds_string: interval string such as ``'[1, 5)'``
+        :param kwargs: additional keyword arguments for the interval class
+        """
+        cache = cls.string_cache
+        if cache is None:
+            return cls(
+                *cls.string_parser.parse_string(bounds_string),
+                **kwargs
+            )
+        key = (cls, bounds_string, tuple(sorted(kwargs.items())))
+        interval = cache.get(key)
+        if interval is None:
+            interval = cls(
+                *cls.string_parser.parse_string(bounds_string),
+                **kwargs
+            )
+            cache.set(key, interval)
+        return interval
 
     def coerce_value(self, value):
         if value is None or value == '':
@@ -307,29 +457,33 @@ class AbstractInterval(object):
     def coerce_obj(self, obj):
         return self.type(obj)
 
-    @property
-    def lower(self):
-        return self._lower
+    def coerce_bound(self, value, default):
+        """
+        Coerce given bound value and round it by the step of this interval.
 
-    @lower.setter
-    def lower(self, value):
+        :param value: bound value
+        :param default: value returned for ``None`` and empty strings
+        """
         value = self.coerce_value(value)
         if value is None:
-            self._lower = -inf
-        else:
-            self._lower = self.round_value_by_step(value)
+            return default
+        return self.round_value_by_step(value)
+
+    @property
+    def lower(self):
+        return self._lower
 
     @property
     def upper(self):
         return self._upper
 
-    @upper.setter
-    def upper(self, value):
-        value = self.coerce_value(value)
-        if value is None:
-            self._upper = inf
-        else:
-            self._upper = self.round_value_by_step(value)
+    @property
+    def lower_inc(self):
+        return self._lower_inc
+
+    @property
+    def upper_inc(self):
+        return self._upper_inc
 
     def round_value_by_step(self, value):
         return value
@@ -387,23 +541,87 @@ class AbstractInterval(object):
             self.type == other.type
         )
 
+    def canonical_bounds(self):
+        """
+        Return the bounds of the canonical ``[lower, upper)`` form of this
+        discrete interval as a ``(lower, lower_inc, upper, upper_inc)`` tuple.
+        Empty intervals are returned as is, like in :func:`canonicalize`.
+
+        The bounds are computed once and cached on the instance::
+
+            >>> IntInterval([1, 4]).canonical_bounds()
+            (1, True, 5, False)
+        """
+        return self._canonicalized()[:4]
+
+    def _canonicalized(self):
+        """
+        Return the cached canonical bounds of this discrete interval along
+        with whether or not it is empty.
+        """
+        canonical = self._canonical
+        if canonical is None:
+            if self._step is None:
+                raise TypeError('Only discrete ranges can be canonicalized')
+            if instrumentation.enabled:
+                instrumentation.record(
+                    'canonicalizations', self.__class__.__name__
+                )
+            lower = self._lower
+            upper = self._upper
+            lower_inc = self._lower_inc
+            upper_inc = self._upper_inc
+            if lower == upper:
+                empty = not (lower_inc and upper_inc)
+            else:
+                empty = (
+                    upper - lower == self._step and
+                    not (lower_inc or upper_inc)
+                )
+            if not empty:
+                if not lower_inc:
+                    lower, lower_inc = lower + self._step, True
+                if upper_inc:
+                    upper, upper_inc = upper + self._step, False
+            canonical = self._canonical = (
+                lower, lower_inc, upper, upper_inc, empty
+            )
+        return canonical
+
     @coerce_interval
     def __eq__(self, other):
         try:
             if self.discrete:
-                return canonicalize(self).equals(canonicalize(other))
+                return (
+                    self._canonicalized()[:4] == other._canonicalized()[:4] and
+                    self.type == other.type
+                )
             return self.equals(other)
         except AttributeError:
             return NotImplemented
 
     def __hash__(self):
-        return (
-            self.upper,
-            self.lower,
-            self.upper_inc,
-            self.lower_inc,
-            self.type
-        ).__hash__()
+        """
+        Return the hash of this interval. Discrete intervals are hashed by
+        their canonical bounds, so that equal intervals have equal hashes::
+
+            >>> interval = IntInterval.closed_open(1, 4)
+            >>> hash(IntInterval([1, 3])) == hash(interval)
+            True
+
+        The hash is computed once and cached on the instance.
+        """
+        value = self._hash
+        if value is None:
+            if self._step is not None:
+                lower, lower_inc, upper, upper_inc = self._canonicalized()[:4]
+            else:
+                lower, lower_inc = self._lower, self._lower_inc
+                upper, upper_inc = self._upper, self._upper_inc
+            value = self._hash = hash(
+                (upper, lower, upper_inc, lower_inc, self.type)
+            )
+        return value
 
     def __ne__(self, other):
         return not (self == other)
@@ -424,8 +642,40 @@ class AbstractInterval(object):
     def __le__(self, other):
         return self == other or self < other
 
-    @coerce_interval
+    def contains_point(self, value):
+        """
+        Return whether or not given point is contained in this interval.
+
+        The value is compared directly against the bounds of this interval
+        without any coercion, hence it should be of the type of this
+        interval::
+
+            >>> IntInterval.closed_open(1, 5).contains_point(5)
+            False
+
+        :param value: value to check
+        """
+        lower = self._lower
+        upper = self._upper
+        return (
+            (lower < value or (self.lower_inc and lower == value)) and
+            (value < upper or (self.upper_inc and upper == value))
+        )
+
+    def _is_point(self, value):
+        """
+        Return whether or not given value can be compared directly against
+        the bounds of this interval.
+        """
+        return isinstance(value, self.type)
+
     def __contains__(self, other):
+        if self._is_point(other):
+            return self.contains_point(other)
+        return self._contains(other)
+
+    @coerce_interval
+    def _contains(self, other):
         lower_op = (
             operator.le
             if self.lower_inc or (not self.lower_inc and not other.lower_inc)
@@ -447,15 +697,15 @@ class AbstractInterval(object):
         """
         Return whether or not this interval is discrete.
         """
-        return self.step is not None
+        return self._step is not None
 
     @property
     def length(self):
         if self.discrete:
-            if not self:
+            lower, _, upper, _, empty = self._canonicalized()
+            if empty:
                 return 0
-            if not self.lower_inc or not self.upper_inc:
-                return canonicalize(self, lower_inc=True, upper_inc=True).length
+            return abs(upper - self._step - lower)
         return abs(self.upper - self.lower)
 
     @property
@@ -474,14 +724,11 @@ class AbstractInterval(object):
 
     @property
     def empty(self):
-        if self.discrete and not self.degenerate:
-            return (
-                self.upper - self.lower == self.step
-                and not (self.upper_inc or self.lower_inc)
-            )
+        if self._step is not None:
+            return self._canonicalized()[4]
         return (
-            self.upper == self.lower
-            and not (self.lower_inc and self.upper_inc)
+            self._upper == self._lower
+            and not (self._lower_inc and self._upper_inc)
         )
 
     def __bool__(self):
@@ -490,6 +737,301 @@ class AbstractInterval(object):
     def __nonzero__(self):
         return not self.empty
 
+    def _range(self):
+        """
+        Return the first value, the number of values and the step of this
+        discrete interval. The number of values is ``None`` for intervals
+        without an upper bound.
+        """
+        step = self._step
+        if step is None:
+            raise TypeError('Only discrete intervals can be iterated.')
+        lower = self._lower
+        if lower == -inf:
+            raise TypeError(
+                'Intervals without a lower bound can not be iterated.'
+            )
+        if not self._lower_inc:
+            lower += step
+        upper = self._upper
+        if upper == inf:
+            return lower, None, step
+        if upper < lower:
+            return lower, 0, step
+        if isinstance(lower, float) or isinstance(step, float):
+            # Bounds are rounded by the step, so the quotient is integral
+            # up to floating point errors.
+            quotient = int(round((upper - lower) / step))
+            exact = True
+        else:
+            quotient = int((upper - lower) // step)
+            exact = lower + quotient * step == upper
+        if self._upper_inc or not exact:
+            quotient += 1
+        return lower, quotient, step
+
+    def _bounded_range(self):
+        lower, count, step = self._range()
+        if count is None:
+            raise TypeError('Intervals without an upper bound have no length.')
+        return lower, count, step
+
+    def __len__(self):
+        """
+        Return the number of values of this discrete interval, like ``len``
+        of a ``range``::
+
+            >>> len(IntInterval.closed_open(1, 5))
+            4
+            >>> len(IntInterval([0, 10], step=5))
+            3
+        """
+        return self._bounded_range()[1]
+
+    def __iter__(self):
+        """
+        Lazily iterate over the values of this discrete interval from the
+        lower bound to the upper bound by the step of this interval::
+
+            >>> interval = DateInterval([date(2000, 1, 30), date(2000, 2, 1)])
+            >>> [day.day for day in interval]
+            [30, 31, 1]
+
+        Intervals without an upper bound are iterated endlessly. Like other
+        discrete intervals, continuous intervals with a step, such as
+        ``FloatInterval([0, 1], step=0.5)``, can be iterated as well.
+        """
+        lower, count, step = self._range()
+        if isinstance(lower, int) and isinstance(step, int):
+            if count is None:
+                return itertools.count(lower, step)
+            return iter(range(lower, lower + count * step, step))
+        indexes = itertools.count() if count is None else range(count)
+        return (lower + index * step for index in indexes)
+
+    def __reversed__(self):
+        """
+        Lazily iterate over the values of this discrete interval from the
+        upper bound to the lower bound.
+        """
+        lower, count, step = self._bounded_range()
+        return (lower + index * step for index in reversed(range(count)))
+
+    def __getitem__(self, index):
+        """
+        Return the value at given index of this discrete interval, or a
+        discrete interval of the values of given slice::
+
+            >>> interval = IntInterval([1, 10])
+            >>> interval[2], interval[-1]
+            (3, 10)
+            >>> interval[2:8]
+            IntInterval('[3, 8]')
+            >>> interval[2:8:2]
+            DiscreteRange(3, 3, 2)
+            >>> list(interval[2:8:2])
+            [3, 5, 7]
+
+        Slices without a slice step are returned as intervals. The values of
+        slices with a slice step are not all the values between their
+        bounds, so they are returned as a :class:`DiscreteRange`. Negative
+        slice steps are not supported.
+        """
+        if isinstance(index, slice):
+            return self._slice(index)
+        index = operator.index(index)
+        if index < 0:
+            lower, count, step = self._bounded_range()
+            index += count
+        else:
+            lower, count, step = self._range()
+        if index < 0 or count is not None and index >= count:
+            raise IndexError('Interval index out of range.')
+        return lower + index * step
+
+    def _slice(self, index):
+        if index.step is not None and index.step <= 0:
+            raise ValueError('Interval slice steps must be positive.')
+        lower, count, step = self._bounded_range()
+        start, stop, stride = index.indices(count)
+        count = len(range(start, stop, stride))
+        lower += start * step
+        if stride != 1:
+            return DiscreteRange(lower, count, step * stride)
+        if not count:
+            return self.from_bounds(lower, lower, True, False, step=step)
+        return self.from_bounds(
+            lower,
+            lower + (count - 1) * step,
+            True,
+            True,
+            step=step
+        )
+
+    def split(self, n):
+        """
+        Lazily split this interval into ``n`` disjoint intervals that
+        exactly cover it::
+
+            >>> [str(piece) for piece in IntInterval([1, 10]).split(3)]
+            ['[1, 4]', '[5, 7]', '[8, 10]']
+            >>> [str(piece) for piece in FloatInterval([0, 1]).split(2)]
+            ['[0.0, 0.5)', '[0.5, 1.0]']
+
+        Discrete intervals are split into closed intervals of consecutive
+        values of their step, with the numbers of values differing by at
+        most one. Fewer than ``n`` intervals are returned if this interval
+        has fewer than ``n`` values.
+
+        :param n: number of intervals
+        """
+        n = operator.index(n)
+        if n < 1:
+            raise ValueError('Number of pieces must be positive.')
+        if self._step is not None:
+            lower, count, step = self._range()
+            if count is None:
+                raise TypeError(
+                    'Intervals without an upper bound can not be split.'
+                )
+            return self._split_values(lower, count, step, n)
+        if self._lower == -inf or self._upper == inf:
+            raise TypeError('Unbounded intervals can not be split.')
+        return self._split_bounds(n)
+
+    def chunks(self, size):
+        """
+        Lazily split this interval into disjoint intervals of given size,
+        starting from the lower bound, that exactly cover it::
+
+            >>> interval = DateTimeInterval.closed_open(
+            ...     datetime(2000, 1, 1, 9, 30),
+            ...     datetime(2000, 1, 1, 11)
+            ... )
+            >>> for piece in interval.chunks(timedelta(hours=1)):
+            ...     print(piece)
+            [2000-01-01 09:30:00, 2000-01-01 10:30:00)
+            [2000-01-01 10:30:00, 2000-01-01 11:00:00)
+
+        The last interval may be shorter than given size. Discrete intervals
+        are split into closed intervals of the values within each size.
+        Intervals without an upper bound are split endlessly.
+
+        :param size: size of the intervals, for example ``timedelta`` for
+            date and datetime intervals
+        """
+        return self._windows(size, None)
+
+    def align(self, size, origin):
+        """
+        Lazily split this interval into disjoint intervals that exactly cover
+        it, at multiples of given size from given origin::
+
+            >>> interval = IntInterval([3, 21])
+            >>> [str(piece) for piece in interval.align(10, 0)]
+            ['[3, 9]', '[10, 19]', '[20, 21]']
+
+        Each interval lies within one ``[origin + k * size, origin + (k + 1)
+        * size)`` window, so a closed interval ending at a multiple of the
+        size ends with an interval containing only its upper bound.
+
+        :param size: size of the windows
+        :param origin: any bound of the windows
+        """
+        return self._windows(size, origin)
+
+    def _split_values(self, lower, count, step, n):
+        size, extra = divmod(count, n)
+        start = 0
+        for piece in range(min(n, count)):
+            stop = start + size + (piece < extra)
+            yield self._values(lower, start, stop, step)
+            start = stop
+
+    def _split_bounds(self, n):
+        lower = self._lower
+        upper = self._upper
+        if self.empty:
+            return
+        width = upper - lower
+        start, start_inc = lower, self._lower_inc
+        for piece in range(1, n):
+            boundary = lower + width * piece / n
+            if boundary >= upper:
+                break
+            if boundary > start:
+                yield self.from_bounds(start, boundary, start_inc, False)
+                start, start_inc = boundary, True
+        yield self.from_bounds(start, upper, start_inc, self._upper_inc)
+
+    def _windows(self, size, origin):
+        if not size > size * 0:
+            raise ValueError('Size must be positive.')
+        if self._lower == -inf:
+            raise TypeError(
+                'Intervals without a lower bound can not be split.'
+            )
+        if self._step is not None:
+            lower, count, step = self._range()
+            if origin is None:
+                origin = lower
+            return self._window_values(lower, count, step, size, origin)
+        return self._window_bounds(size, origin)
+
+    def _window_values(self, lower, count, step, size, origin):
+        index = 0
+        while count is None or index < count:
+            value = lower + index * step
+            try:
+                end = origin + (_floor_divide(value - origin, size) + 1) * size
+            except OverflowError:
+                if count is None:
+                    raise
+                stop = count
+            else:
+                stop = index - _floor_divide(value - end, step)
+                if count is not None:
+                    stop = min(stop, count)
+            yield self._values(lower, index, stop, step)
+            index = stop
+
+    def _window_bounds(self, size, origin):
+        lower = self._lower
+        upper = self._upper
+        if self.empty:
+            return
+        chunked = origin is None
+        if chunked:
+            origin, index = lower, 0
+        else:
+            index = _floor_divide(lower - origin, size)
+        start, start_inc = lower, self._lower_inc
+        while True:
+            index += 1
+            try:
+                boundary = origin + index * size
+            except OverflowError:
+                break
+            if boundary > upper or boundary == upper and (
+                chunked or not self._upper_inc
+            ):
+                break
+            if boundary > start:
+                yield self.from_bounds(start, boundary, start_inc, False)
+                start, start_inc = boundary, True
+        yield self.from_bounds(start, upper, start_inc, self._upper_inc)
+
+    def _values(self, lower, start, stop, step):
+        """
+        Return a closed interval of the values of this discrete interval
+        from index ``start`` up to index ``stop``.
+        """
+        return self.from_bounds(
+            lower + start * step,
+            lower + (stop - 1) * step,
+            step=self._step
+        )
+
     @property
     def centre(self):
         return float((self.lower + self.upper)) / 2
@@ -501,25 +1043,28 @@ class AbstractInterval(object):
     def hyphenized(self):
         if not self.discrete:
             raise TypeError('Only discrete intervals have hyphenized format.')
-        c = canonicalize(self, True, True)
+        lower, _, upper, _, empty = self._canonicalized()
+        if empty:
+            lower, upper = self._lower, self._upper
+        else:
+            upper -= self._step
 
-        if c.lower != c.upper:
+        if lower != upper:
             return '%s -%s' % (
-                str(c.lower) if not is_infinite(c.lower) else '',
-                ' ' + str(c.upper) if not is_infinite(c.upper) else ''
+                str(lower) if not is_infinite(lower) else '',
+                ' ' + str(upper) if not is_infinite(upper) else ''
             )
-        return str(c.lower)
+        return str(lower)
 
     @coerce_interval
     def __add__(self, other):
         """
         [a, b] + [c, d] = [a + c, b + d]
         """
-        return self.__class__(
-            [
-                self.lower + other.lower,
-                self.upper + other.upper
-            ],
+        return self._derive(
+            other,
+            self.lower + other.lower,
+            self.upper + other.upper,
             lower_inc=self.lower_inc if self < other else other.lower_inc,
             upper_inc=self.upper_inc if self > other else other.upper_inc,
         )
@@ -533,10 +1078,11 @@ class AbstractInterval(object):
 
         [a, b] - [c, d] = [a - d, b - c]
         """
-        return self.__class__([
+        return self._derive(
+            other,
             self.lower - other.upper,
             self.upper - other.lower
-        ])
+        )
 
     @coerce_interval
     def glb(self, other):
@@ -545,11 +1091,10 @@ class AbstractInterval(object):
 
         :param other: AbstractInterval instance
         """
-        return self.__class__(
-            [
-                min(self.lower, other.lower),
-                min(self.upper, other.upper)
-            ],
+        return self._derive(
+            other,
+            min(self.lower, other.lower),
+            min(self.upper, other.upper),
             lower_inc=self.lower_inc if self < other else other.lower_inc,
             upper_inc=self.upper_inc if self > other else other.upper_inc,
         )
@@ -561,11 +1106,10 @@ class AbstractInterval(object):
 
         :param other: AbstractInterval instance
         """
-        return self.__class__(
-            [
-                max(self.lower, other.lower),
-                max(self.upper, other.upper),
-            ],
+        return self._derive(
+            other,
+            max(self.lower, other.lower),
+            max(self.upper, other.upper),
             lower_inc=self.lower_inc if self < other else other.lower_inc,
             upper_inc=self.upper_inc if self > other else other.upper_inc,
         )
@@ -591,10 +1135,11 @@ class AbstractInterval(object):
 
     @coerce_interval
     def __rsub__(self, other):
-        return self.__class__([
+        return self._derive(
+            other,
             other.lower - self.upper,
             other.upper - self.lower
-        ])
+        )
 
     def __and__(self, other):
         """
@@ -622,11 +1167,7 @@ class AbstractInterval(object):
         else:
             upper_inc = self.upper_inc and other.upper_inc
 
-        return self.__class__(
-            [lower, upper],
-            lower_inc=lower_inc,
-            upper_inc=upper_inc
-        )
+        return self._derive(other, lower, upper, lower_inc, upper_inc)
 
     def __or__(self, other):
         """
@@ -651,6 +1192,21 @@ class AbstractInterval(object):
         else:
             upper_inc = self.upper_inc or other.upper_inc
 
+        return self._derive(other, lower, upper, lower_inc, upper_inc)
+
+    def _derive(self, other, lower, upper, lower_inc=True, upper_inc=True):
+        """
+        Return a new interval of this class with given bounds computed from
+        this interval and other. The bounds are coerced only if other is an
+        interval of a different class or if the computation changed their
+        type.
+        """
+        if (
+            other.__class__ is self.__class__ and
+            (isinstance(lower, self.type) or is_infinite(lower)) and
+            (isinstance(upper, self.type) or is_infinite(upper))
+        ):
+            return self.from_bounds(lower, upper, lower_inc, upper_inc)
         return self.__class__(
             [lower, upper],
             lower_inc=lower_inc,
@@ -679,8 +1235,12 @@ class AbstractInterval(object):
 
 
 class NumberInterval(AbstractInterval):
+    __slots__ = ()
     rounding_type = Decimal
 
+    def _is_point(self, value):
+        return isinstance(value, (self.type, int))
+
     def round_value_by_step(self, value):
         if self.step and not is_infinite(value):
             return self.type(
@@ -697,6 +1257,7 @@ class NumberInterval(AbstractInterval):
 
 
 class IntInterval(NumberInterval):
+    __slots__ = ()
     step = 1
     type = int
 
@@ -710,6 +1271,20 @@ class IntInterval(NumberInterval):
             return int(obj)
         return obj
 
+    def round_value_by_step(self, value):
+        """
+        Round given value to the nearest multiple of the step, halfway
+        values away from zero, using integer arithmetic only.
+        """
+        step = self._step
+        if not step or step == 1 and type(value) is int:
+            return value
+        if type(value) is not int or type(step) is not int or step < 0:
+            return super(IntInterval, self).round_value_by_step(value)
+        if value >= 0:
+            return (2 * value + step) // (2 * step) * step
+        return -((-2 * value + step) // (2 * step) * step)
+
     def __int__(self):
         if self.empty:
             raise TypeError('Empty intervals cannot be coerced to integers')
@@ -722,32 +1297,51 @@ class IntInterval(NumberInterval):
 
 
 class DateInterval(AbstractInterval):
+    __slots__ = ()
     step = timedelta(days=1)
     type = date
+    codec = date_codec
+
+    def coerce_string(self, value):
+        return self.codec.parse(value)
 
 
 class DateTimeInterval(AbstractInterval):
+    __slots__ = ()
     type = datetime
+    codec = datetime_codec
+
+    def coerce_string(self, value):
+        return self.codec.parse(value)
 
 
 class FloatInterval(NumberInterval):
+    __slots__ = ()
     type = float
     rounding_type = float
 
 
 class DecimalInterval(NumberInterval):
+    __slots__ = ()
     type = Decimal
 
     def round_value_by_step(self, value):
-        if self.step and not is_infinite(value):
-            return self.type(str(
-                float(self.step) *
-                py2round(1.0 / float(self.step) * float(value))
-            ))
-        return value
+        """
+        Round given value to the nearest multiple of the step, halfway
+        values away from zero, without converting it to float.
+        """
+        step = self._step
+        if not step or not isinstance(value, Decimal):
+            return value
+        if isinstance(step, float):
+            step = Decimal(repr(step))
+        else:
+            step = Decimal(step)
+        return (value / step).to_integral_value(ROUND_HALF_UP) * step
 
 
 class CharacterInterval(AbstractInterval):
+    __slots__ = ()
     type = str
 
     def coerce_obj(self, obj):
@@ -766,8 +1360,105 @@ class IntervalFactory(object):
         DateInterval,
     ]
 
+    #: Mapping of bound types to the interval classes tried for them, in
+    #: order. For the built-in types these are the first classes of
+    #: :attr:`interval_classes` that accept bounds of the type, so the
+    #: classes skipped before them would fail anyway. Decimals are tried as
+    #: integers first and then as floats, the same way as in the cascade.
+    type_registry = {
+        str: [CharacterInterval],
+        int: [IntInterval],
+        float: [FloatInterval],
+        Decimal: [IntInterval, FloatInterval],
+        datetime: [DateTimeInterval],
+        date: [DateInterval],
+    }
+
+    @classmethod
+    def register(cls, interval_class, types=None):
+        """
+        Register an interval class for given bound types. Registered classes
+        take precedence over the classes previously registered for the same
+        types::
+
+            from fractions import Fraction
+
+            class FractionInterval(NumberInterval):
+                type = Fraction
+
+            IntervalFactory.register(FractionInterval)
+            Interval([Fraction(1, 3), Fraction(1, 2)])  # FractionInterval
+
+        :param interval_class: :class:`AbstractInterval` subclass
+        :param types:
+            Bound types for which to use given class. Defaults to the type of
+            the interval class.
+        """
+        if types is None:
+            types = (interval_class.type, )
+        for type_ in types:
+            cls.type_registry[type_] = [interval_class] + [
+                registered
+                for registered in cls.type_registry.get(type_, [])
+                if registered is not interval_class
+            ]
+        if interval_class not in cls.interval_classes:
+            cls.interval_classes.append(interval_class)
+        return interval_class
+
+    @classmethod
+    def lookup(cls, bound_type):
+        """
+        Return the interval classes registered for given bound type or its
+        closest registered base class.
+        """
+        for base in bound_type.__mro__:
+            try:
+                return cls.type_registry[base]
+            except KeyError:
+                pass
+        return []
+
+    @classmethod
+    def classify(cls, bounds):
+        """
+        Return the interval classes registered for the type of given bounds
+        or an empty list if the bounds are of different types.
+        """
+        if isinstance(bounds, (list, tuple)):
+            values = bounds
+        elif hasattr(bounds, 'lower') and hasattr(bounds, 'upper'):
+            values = (bounds.lower, bounds.upper)
+        else:
+            values = (bounds, )
+        bound_type = None
+        for value in values:
+            if value is None or is_infinite(value):
+                continue
+            if bound_type is None:
+                bound_type = type(value)
+            elif type(value) is not bound_type:
+                return []
+        if bound_type is None:
+            return []
+        return cls.lookup(bound_type)
+
+    def _candidates(self, bounds):
+        """
+        Return the interval classes to try for given bounds: the classes
+        registered for their type followed by the rest of the cascade.
+        """
+        classes = self.classify(bounds)
+        if not classes:
+            return self.interval_classes
+        return classes + [
+            interval_class
+            for interval_class in self.interval_classes
+            if interval_class not in classes
+        ]
+
     def __call__(self, bounds, lower_inc=None, upper_inc=None, step=None):
-        for interval_class in self.interval_classes:
+        for interval_class in self._candidates(bounds):
             try:
                 return interval_class(
                     bounds,
@@ -776,20 +1467,29 @@ class IntervalFactory(object):
                     step=step
                 )
             except (IntervalException, TypeError):
-                pass
+                if instrumentation.enabled:
+                    instrumentation.record(
+                        'factory_fallbacks', interval_class.__name__
+                    )
         raise IntervalException(
             'Could not initialize interval.'
         )
 
     @classmethod
     def from_string(self, value):
+        # Bound types are not classified here, since CharacterInterval comes
+        # first in the cascade and accepts the bounds of any valid string.
         for interval_class in self.interval_classes:
             try:
                 return interval_class.from_string(value)
             except (IntervalException, TypeError):
-                pass
+                if instrumentation.enabled:
+                    instrumentation.record(
+                        'factory_fallbacks', interval_class.__name__
+                    )
         raise IntervalException(
             'Could not initialize interval.'
         )
 
+
 Interval = IntervalFactory()
@@ -0,0 +1,304 @@
+from bisect import bisect_left, bisect_right
+
+from .interval import AbstractInterval
+from .interval_set import _normalize_bounds, IntervalSet
+
+
+def _start(lower, lower_inc):
+    """
+    Return the position of given lower bound. Positions are ordered so that
+    ``(value, 0)`` is the point value itself and ``(value, 1)`` the open
+    segment right after it.
+    """
+    return lower, 0 if lower_inc else 1
+
+
+def _end(upper, upper_inc):
+    """
+    Return the position right after given upper bound.
+    """
+    return upper, 1 if upper_inc else 0
+
+
+class IntervalMap(object):
+    """
+    A mapping of disjoint intervals to values, such as rate tiers or pricing
+    periods::
+
+        >>> from intervals import IntInterval, IntervalMap
+        >>> tiers = IntervalMap()
+        >>> tiers[IntInterval([0, 99])] = 'basic'
+        >>> tiers[IntInterval([100, 999])] = 'plus'
+        >>> tiers[IntInterval([50, 149])] = 'plus'
+        >>> for interval, tier in tiers.items():
+        ...     print(interval, tier)
+        [0, 50) basic
+        [50, 1000) plus
+        >>> tiers[120]
+        'plus'
+
+    Assigning a value to an interval replaces the values of the overlapped
+    parts of existing entries, splitting them when needed. Connected entries
+    with equal values are coalesced, and so are adjacent discrete entries
+    such as ``[0, 49]`` and ``[50, 149]`` above, since discrete intervals are
+    stored in canonical form.
+
+    The entries are stored sorted in parallel lists of bounds, inclusivity
+    flags and values. Point lookups and slicing with an interval use
+    bisection in O(log n) time, plus the number of sliced entries.
+    Assignment and deletion take O(log n) time plus the time of updating
+    the lists, which is constant when entries are appended in order.
+
+    :param items:
+        Iterable of ``(interval, value)`` pairs or a mapping of intervals to
+        values, assigned in order. Intervals that are not intervals are
+        passed to the constructor of ``interval_class``.
+    :param interval_class:
+        The class of the intervals of this map. If not given, the class of
+        the first interval is used.
+    :param step:
+        Step used for intervals of this map. Defaults to the step of the
+        first interval if ``interval_class`` is not given, otherwise to the
+        step of the interval class. Intervals with another step raise
+        :exc:`IllegalArgument`.
+    """
+
+    def __init__(self, items=(), interval_class=None, step=None):
+        self.interval_class = interval_class
+        self.step = step
+        self._set_entries([])
+        if hasattr(items, 'items'):
+            items = items.items()
+        for interval, value in items:
+            self[interval] = value
+
+    _coerce = IntervalSet._coerce
+    _check_step = IntervalSet._check_step
+    _interval = IntervalSet._interval
+
+    def _set_entries(self, entries):
+        self._lowers = []
+        self._lower_incs = []
+        self._uppers = []
+        self._upper_incs = []
+        self._values = []
+        self._replace(0, 0, entries)
+
+    def _replace(self, start, stop, entries):
+        """
+        Replace the entries within given range of indices with given
+        ``(lower, lower_inc, upper, upper_inc, value)`` tuples.
+        """
+        columns = list(zip(*entries)) or [()] * 5
+        self._lowers[start:stop] = columns[0]
+        self._lower_incs[start:stop] = columns[1]
+        self._uppers[start:stop] = columns[2]
+        self._upper_incs[start:stop] = columns[3]
+        self._values[start:stop] = columns[4]
+
+    def _entry(self, index):
+        return (
+            self._lowers[index],
+            self._lower_incs[index],
+            self._uppers[index],
+            self._upper_incs[index],
+            self._values[index]
+        )
+
+    def _entries(self):
+        return zip(
+            self._lowers,
+            self._lower_incs,
+            self._uppers,
+            self._upper_incs,
+            self._values
+        )
+
+    def _new(self, entries):
+        interval_map = self.__class__(
+            interval_class=self.interval_class,
+            step=self.step
+        )
+        interval_map._set_entries(entries)
+        return interval_map
+
+    def _start(self, index):
+        return _start(self._lowers[index], self._lower_incs[index])
+
+    def _end(self, index):
+        return _end(self._uppers[index], self._upper_incs[index])
+
+    def _span(self, start, end):
+        """
+        Return the range of indices of the entries overlapping or touching
+        the positions from given start up to given end.
+        """
+        count = len(self._lowers)
+        first = bisect_left(self._uppers, start[0])
+        while first < count and self._end(first) < start:
+            first += 1
+        last = bisect_right(self._lowers, end[0])
+        while last > first and self._start(last - 1) > end:
+            last -= 1
+        return first, last
+
+    def _index(self, value):
+        """
+        Return the index of the entry containing given point or -1 if there
+        is no such entry.
+        """
+        index = bisect_right(self._lowers, value) - 1
+        if (
+            index >= 0 and
+            self._lowers[index] == value and
+            not self._lower_incs[index]
+        ):
+            index -= 1
+        if index >= 0:
+            upper = self._uppers[index]
+            if value < upper or (value == upper and self._upper_incs[index]):
+                return index
+        return -1
+
+    def _assign(self, interval, value, delete=False):
+        bounds = _normalize_bounds(self._coerce(interval))
+        if bounds is None:
+            return
+        lower, lower_inc, upper, upper_inc = bounds
+        start = _start(lower, lower_inc)
+        end = _end(upper, upper_inc)
+        first, last = self._span(start, end)
+        entries = []
+        if first < last and self._start(first) < start:
+            if not delete and self._values[first] == value:
+                lower = self._lowers[first]
+                lower_inc = self._lower_incs[first]
+            else:
+                entries.append(self._entry(first)[:2] + (
+                    bounds[0], not bounds[1], self._values[first]
+                ))
+        right = None
+        if first < last and self._end(last - 1) > end:
+            if not delete and self._values[last - 1] == value:
+                upper = self._uppers[last - 1]
+                upper_inc = self._upper_incs[last - 1]
+            else:
+                right = (bounds[2], not bounds[3]) + self._entry(last - 1)[2:]
+        if not delete:
+            entries.append((lower, lower_inc, upper, upper_inc, value))
+        if right is not None:
+            entries.append(right)
+        self._replace(first, last, entries)
+
+    def __setitem__(self, interval, value):
+        """
+        Assign given value to given interval.
+        """
+        self._assign(interval, value)
+
+    def __delitem__(self, interval):
+        """
+        Remove the values of given interval, splitting the entries
+        overlapping it when needed.
+        """
+        self._assign(interval, None, delete=True)
+
+    def __getitem__(self, key):
+        """
+        Return the value of given point, or with an interval, a new map of
+        the entries within the interval.
+        """
+        if isinstance(key, AbstractInterval):
+            return self.slice(key)
+        index = self._index(key)
+        if index < 0:
+            raise KeyError(key)
+        return self._values[index]
+
+    def get(self, point, default=None):
+        """
+        Return the value of given point or ``default`` if the point has no
+        value.
+        """
+        index = self._index(point)
+        if index < 0:
+            return default
+        return self._values[index]
+
+    def slice(self, interval):
+        """
+        Return a new map of the entries of this map within given interval.
+        Entries overlapping the bounds of the interval are cut at the bounds.
+
+            >>> from intervals import FloatInterval, IntervalMap
+            >>> prices = IntervalMap([
+            ...     (FloatInterval.closed_open(0, 10), 5),
+            ...     (FloatInterval.closed_open(10, 20), 8)
+            ... ])
+            >>> prices.slice(FloatInterval([5, 15]))[15]
+            8
+            >>> len(prices.slice(FloatInterval([12, 30])))
+            1
+        """
+        bounds = _normalize_bounds(self._coerce(interval))
+        if bounds is None:
+            return self._new([])
+        lower, lower_inc, upper, upper_inc = bounds
+        start = _start(lower, lower_inc)
+        end = _end(upper, upper_inc)
+        first, last = self._span(start, end)
+        if first < last and self._end(first) == start:
+            first += 1
+        if first < last and self._start(last - 1) == end:
+            last -= 1
+        entries = [self._entry(index) for index in range(first, last)]
+        if entries and self._start(first) < start:
+            entries[0] = (lower, lower_inc) + entries[0][2:]
+        if entries and self._end(last - 1) > end:
+            entries[-1] = entries[-1][:2] + (upper, upper_inc, entries[-1][4])
+        return self._new(entries)
+
+    def __iter__(self):
+        for entry in self._entries():
+            yield self._interval(*entry[:4])
+
+    def items(self):
+        """
+        Return an iterator of the ``(interval, value)`` pairs of this map,
+        sorted by interval.
+        """
+        for entry in self._entries():
+            yield self._interval(*entry[:4]), entry[4]
+
+    def values(self):
+        """
+        Return an iterator of the values of this map, sorted by interval.
+        """
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._lowers)
+
+    def __bool__(self):
+        return bool(self._lowers)
+
+    __nonzero__ = __bool__
+
+    def __contains__(self, point):
+        return self._index(point) >= 0
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, list(self.items()))
+
+    def __eq__(self, other):
+        if not isinstance(other, IntervalMap):
+            return NotImplemented
+        return (
+            self.interval_class is other.interval_class and
+            list(self._entries()) == list(other._entries())
+        )
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    __hash__ = None
@@ -0,0 +1,376 @@
+# -*- coding: utf-8 -*-
+import heapq
+from bisect import bisect_right
+
+from infinity import inf, is_infinite
+
+from .exc import IllegalArgument
+from .interval import AbstractInterval
+
+
+def _normalize_bounds(interval):
+    """
+    Return the bounds of given interval as a ``(lower, lower_inc, upper,
+    upper_inc)`` tuple or ``None`` if the interval is empty.
+
+    Discrete intervals are canonicalized to ``[lower, upper)`` form so that
+    adjacent discrete intervals such as ``[1, 3]`` and ``[4, 6]`` become
+    connected. Infinite bounds are always exclusive.
+    """
+    if interval.empty:
+        return None
+    if interval.discrete:
+        lower, lower_inc, upper, upper_inc = interval.canonical_bounds()
+    else:
+        lower, lower_inc = interval.lower, interval.lower_inc
+        upper, upper_inc = interval.upper, interval.upper_inc
+    if is_infinite(lower):
+        lower_inc = False
+    if is_infinite(upper):
+        upper_inc = False
+    return lower, lower_inc, upper, upper_inc
+
+
+def _sort_key(bounds):
+    return bounds[0], not bounds[1]
+
+
+def _coalesce(sorted_bounds):
+    """
+    Merge connected bounds of given sorted iterable into disjoint bounds.
+    """
+    current = None
+    for lower, lower_inc, upper, upper_inc in sorted_bounds:
+        if current is None:
+            current = [lower, lower_inc, upper, upper_inc]
+            continue
+        if lower < current[2] or (
+            lower == current[2] and (lower_inc or current[3])
+        ):
+            if upper > current[2]:
+                current[2], current[3] = upper, upper_inc
+            elif upper == current[2]:
+                current[3] = current[3] or upper_inc
+        else:
+            yield tuple(current)
+            current = [lower, lower_inc, upper, upper_inc]
+    if current is not None:
+        yield tuple(current)
+
+
+class IntervalSet(object):
+    """
+    A set of disjoint intervals, such as ``[1, 5] ∪ [10, 20]``.
+
+    The intervals are stored normalized, sorted and non-overlapping in
+    parallel lists of bounds and inclusivity flags. Connected intervals are
+    merged on initialization::
+
+        >>> from intervals import IntInterval, IntervalSet
+        >>> interval_set = IntervalSet([
+        ...     IntInterval([10, 20]),
+        ...     IntInterval([1, 5]),
+        ...     IntInterval([4, 7])
+        ... ])
+        >>> interval_set
+        IntervalSet([IntInterval('[1, 8)'), IntInterval('[10, 21)')])
+        >>> 6 in interval_set
+        True
+        >>> 9 in interval_set
+        False
+
+    :param intervals:
+        Iterable of intervals. Items that are not intervals are passed to the
+        constructor of ``interval_class``.
+    :param interval_class:
+        The class of the intervals of this set. If not given, the class of
+        the first interval is used.
+    :param step:
+        Step used for intervals of this set. Defaults to the step of the
+        first interval if ``interval_class`` is not given, otherwise to the
+        step of the interval class. Intervals with another step raise
+        :exc:`IllegalArgument`.
+    """
+
+    def __init__(self, intervals=(), interval_class=None, step=None):
+        self.interval_class = interval_class
+        self.step = step
+        bounds = []
+        for interval in intervals:
+            interval = self._coerce(interval)
+            normalized = _normalize_bounds(interval)
+            if normalized is not None:
+                bounds.append(normalized)
+        bounds.sort(key=_sort_key)
+        self._set_bounds(_coalesce(bounds))
+
+    def _coerce(self, interval):
+        if not isinstance(interval, AbstractInterval):
+            if self.interval_class is None:
+                raise TypeError(
+                    'interval_class must be given when initializing '
+                    '%s with non-interval items.' % self.__class__.__name__
+                )
+            return self.interval_class(interval, step=self.step)
+        if self.interval_class is None:
+            self.interval_class = type(interval)
+            if self.step is None:
+                self.step = interval.step
+        elif not isinstance(interval, self.interval_class):
+            raise TypeError(
+                '%s of %s can not contain %s.' % (
+                    self.__class__.__name__,
+                    self.interval_class.__name__,
+                    type(interval).__name__
+                )
+            )
+        self._check_step(interval.step)
+        return interval
+
+    def _check_step(self, step):
+        expected = self.interval_class.step if self.step is None else self.step
+        if step != expected:
+            raise IllegalArgument(
+                '%s with step %r can not contain intervals with step %r.' % (
+                    self.__class__.__name__,
+                    expected,
+                    step
+                )
+            )
+
+    def _set_bounds(self, bounds):
+        self._lowers = []
+        self._lower_incs = []
+        self._uppers = []
+        self._upper_incs = []
+        for lower, lower_inc, upper, upper_inc in bounds:
+            self._lowers.append(lower)
+            self._lower_incs.append(lower_inc)
+            self._uppers.append(upper)
+            self._upper_incs.append(upper_inc)
+
+    def _bounds(self):
+        return zip(
+            self._lowers,
+            self._lower_incs,
+            self._uppers,
+            self._upper_incs
+        )
+
+    def _new(self, bounds):
+        interval_set = self.__class__(
+            interval_class=self.interval_class,
+            step=self.step
+        )
+        interval_set._set_bounds(bounds)
+        return interval_set
+
+    def _coerce_other(self, other):
+        if not isinstance(other, IntervalSet):
+            if isinstance(other, AbstractInterval):
+                other = [other]
+            other = self.__class__(
+                other,
+                interval_class=self.interval_class,
+                step=self.step
+            )
+        if (
+            self.interval_class is not None and
+            other.interval_class is not None and
+            self.interval_class is not other.interval_class
+        ):
+            raise TypeError(
+                'Can not combine IntervalSet of %s with IntervalSet of %s.' % (
+                    self.interval_class.__name__,
+                    other.interval_class.__name__
+                )
+            )
+        if self.interval_class is None:
+            return other._new(self._bounds()), other
+        if other.interval_class is not None:
+            self._check_step(
+                other.interval_class.step if other.step is None else
+                other.step
+            )
+        return self, other
+
+    def _interval(self, lower, lower_inc, upper, upper_inc):
+        return self.interval_class.from_bounds(
+            lower,
+            upper,
+            lower_inc,
+            upper_inc,
+            step=self.step
+        )
+
+    def __iter__(self):
+        for bounds in self._bounds():
+            yield self._interval(*bounds)
+
+    def __len__(self):
+        return len(self._lowers)
+
+    def __bool__(self):
+        return bool(self._lowers)
+
+    __nonzero__ = __bool__
+
+    def __getitem__(self, index):
+        return self._interval(
+            self._lowers[index],
+            self._lower_incs[index],
+            self._uppers[index],
+            self._upper_incs[index]
+        )
+
+    def __repr__(self):
+        return '%s([%s])' % (
+            self.__class__.__name__,
+            ', '.join(repr(interval) for interval in self)
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return (
+            self.interval_class is other.interval_class and
+            self._lowers == other._lowers and
+            self._lower_incs == other._lower_incs and
+            self._uppers == other._uppers and
+            self._upper_incs == other._upper_incs
+        )
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    __hash__ = None
+
+    def _find(self, value, inc=True):
+        """
+        Return the index of the only interval that may contain given lower
+        bound or -1 if there is no such interval.
+
+        :param value: the lower bound value
+        :param inc: whether or not the lower bound is inclusive
+        """
+        index = bisect_right(self._lowers, value) - 1
+        if (
+            index >= 0 and
+            self._lowers[index] == value and
+            not self._lower_incs[index] and
+            inc
+        ):
+            return -1
+        return index
+
+    def contains_point(self, value):
+        index = self._find(value)
+        if index < 0:
+            return False
+        upper = self._uppers[index]
+        return value < upper or (value == upper and self._upper_incs[index])
+
+    def contains_interval(self, interval):
+        bounds = _normalize_bounds(interval)
+        if bounds is None:
+            return True
+        lower, lower_inc, upper, upper_inc = bounds
+        index = self._find(lower, lower_inc)
+        if index < 0:
+            return False
+        set_upper = self._uppers[index]
+        return upper < set_upper or (
+            upper == set_upper and (self._upper_incs[index] or not upper_inc)
+        )
+
+    def __contains__(self, other):
+        """
+        Return whether or not given point or interval is contained in this
+        set. Membership is resolved by bisection in O(log n) time.
+        """
+        if isinstance(other, AbstractInterval):
+            return self.contains_interval(other)
+        return self.contains_point(other)
+
+    def union(self, other):
+        """
+        Return the union of this set and given set or interval.
+        """
+        self, other = self._coerce_other(other)
+        return self._new(_coalesce(heapq.merge(
+            self._bounds(),
+            other._bounds(),
+            key=_sort_key
+        )))
+
+    def intersection(self, other):
+        """
+        Return the intersection of this set and given set or interval.
+        """
+        self, other = self._coerce_other(other)
+        return self._new(_intersect(
+            list(self._bounds()),
+            list(other._bounds())
+        ))
+
+    def complement(self):
+        """
+        Return the complement of this set. The interval class of an empty
+        set must be known, since its complement contains all values.
+        """
+        if self.interval_class is None:
+            raise TypeError(
+                'interval_class must be given for the complement of an '
+                'empty %s.' % self.__class__.__name__
+            )
+        return self._new(_complement(self._bounds()))
+
+    def difference(self, other):
+        """
+        Return the difference of this set and given set or interval.
+        """
+        self, other = self._coerce_other(other)
+        return self._new(_intersect(
+            list(self._bounds()),
+            list(_complement(other._bounds()))
+        ))
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+    __invert__ = complement
+
+
+def _intersect(bounds, other_bounds):
+    i = j = 0
+    while i < len(bounds) and j < len(other_bounds):
+        a = bounds[i]
+        b = other_bounds[j]
+        if a[0] > b[0]:
+            lower, lower_inc = a[0], a[1]
+        elif a[0] < b[0]:
+            lower, lower_inc = b[0], b[1]
+        else:
+            lower, lower_inc = a[0], a[1] and b[1]
+
+        if a[2] < b[2] or (a[2] == b[2] and not a[3]):
+            upper, upper_inc = a[2], a[3]
+            i += 1
+        else:
+            upper, upper_inc = b[2], b[3]
+            j += 1
+            if a[2] == b[2]:
+                i += 1
+
+        if lower < upper or (lower == upper and lower_inc and upper_inc):
+            yield lower, lower_inc, upper, upper_inc
+
+
+def _complement(bounds):
+    lower, lower_inc = -inf, False
+    for bound in bounds:
+        if not is_infinite(bound[0]):
+            yield lower, lower_inc, bound[0], not bound[1]
+        lower, lower_inc = bound[2], not bound[3]
+    if lower != inf:
+        yield lower, lower_inc, inf, False
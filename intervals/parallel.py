@@ -0,0 +1,165 @@
+import os
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+
+from .array import IntervalArray
+from .sweep import _key_bounds, overlap_join
+
+
+def _lower(interval):
+    return _key_bounds(interval)[0]
+
+
+def _boundaries(lowers, partitions):
+    """
+    Return at most ``partitions - 1`` increasing values splitting given lower
+    bounds into partitions of roughly equal size.
+    """
+    lowers = sorted(lowers)
+    boundaries = []
+    if not lowers:
+        return boundaries
+    for partition in range(1, partitions):
+        value = lowers[len(lowers) * partition // partitions]
+        if not boundaries or value > boundaries[-1]:
+            boundaries.append(value)
+    return boundaries
+
+
+def _partition(intervals, boundaries):
+    """
+    Split given intervals into ``(index, interval)`` lists, one for each
+    range between the boundaries. Intervals spanning several ranges are put
+    into each of them.
+    """
+    partitions = [[] for _ in range(len(boundaries) + 1)]
+    for index, interval in enumerate(intervals):
+        if interval.empty:
+            continue
+        lower, _, upper, _ = _key_bounds(interval)
+        first = bisect_right(boundaries, lower)
+        last = bisect_right(boundaries, upper)
+        for partition in partitions[first:last + 1]:
+            partition.append((index, interval))
+    return partitions
+
+
+def _join_partition(left, right, lower, upper, adjacent):
+    """
+    Join the intervals of one partition, returning the index pairs whose
+    reference point lies within ``[lower, upper)``.
+
+    The reference point of a pair is the greater of the two lower bounds,
+    which both intervals reach. Since it lies in exactly one partition, each
+    pair is reported exactly once even though intervals spanning several
+    partitions are joined in each of them.
+    """
+    pairs = []
+    for i, j in overlap_join(
+        [interval for _, interval in left],
+        [interval for _, interval in right],
+        adjacent=adjacent,
+        indices=True
+    ):
+        point = max(_lower(left[i][1]), _lower(right[j][1]))
+        if (
+            (lower is None or point >= lower) and
+            (upper is None or point < upper)
+        ):
+            pairs.append((left[i][0], right[j][0]))
+    return pairs
+
+
+def parallel_overlap_join(
+    left,
+    right,
+    *,
+    workers=None,
+    partitions=None,
+    adjacent=False,
+    indices=False
+):
+    """
+    Join two sequences of intervals on overlap like :func:`overlap_join`,
+    using a pool of worker processes.
+
+    Both inputs are partitioned into ranges of bound values of roughly equal
+    size. Intervals spanning several ranges are copied into each of them and
+    every range is joined in a separate process. Each pair is reported by
+    the range containing the greater of its lower bounds only, so the result
+    contains no duplicates::
+
+        >>> from intervals import IntInterval, parallel_overlap_join
+        >>> sorted(parallel_overlap_join(
+        ...     [IntInterval([1, 4]), IntInterval([10, 12])],
+        ...     [IntInterval.closed_open(4, 8), IntInterval([5, 10])],
+        ...     workers=2,
+        ...     indices=True
+        ... ))
+        [(0, 0), (1, 1)]
+
+    The pairs are returned as a list in unspecified order. Intervals are
+    pickled for the workers, so they must be instances of importable
+    classes. Long intervals spanning many ranges reduce the benefit of
+    partitioning.
+
+    :param left: iterable of intervals or an :class:`IntervalArray`
+    :param right: iterable of intervals or an :class:`IntervalArray`
+    :param workers:
+        Number of worker processes, defaults to the number of CPUs. With one
+        worker the join runs in the current process.
+    :param partitions:
+        Number of ranges the inputs are split into, defaults to the number
+        of workers.
+    :param adjacent:
+        Whether or not to also join intervals that touch without
+        overlapping.
+    :param indices:
+        If ``True``, pairs of indices to the inputs are returned instead of
+        pairs of intervals.
+    """
+    left, right = [
+        intervals.to_intervals() if isinstance(intervals, IntervalArray)
+        else list(intervals)
+        for intervals in (left, right)
+    ]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if partitions is None:
+        partitions = workers
+    if workers == 1 and partitions == 1:
+        return list(
+            overlap_join(left, right, adjacent=adjacent, indices=indices)
+        )
+
+    boundaries = _boundaries(
+        [
+            _lower(interval)
+            for interval in left + right
+            if not interval.empty
+        ],
+        partitions
+    )
+    limits = [None] + boundaries + [None]
+    pairs = []
+    with ProcessPoolExecutor(workers) as executor:
+        futures = [
+            executor.submit(
+                _join_partition,
+                left_part,
+                right_part,
+                limits[partition],
+                limits[partition + 1],
+                adjacent
+            )
+            for partition, (left_part, right_part) in enumerate(zip(
+                _partition(left, boundaries),
+                _partition(right, boundaries)
+            ))
+            if left_part and right_part
+        ]
+        for future in futures:
+            pairs.extend(future.result())
+    if indices:
+        return pairs
+    return [(left[i], right[j]) for i, j in pairs]
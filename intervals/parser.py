@@ -1,56 +1,107 @@
+import re
+
+from . import instrumentation
 from .exc import IntervalException
 
-strip = lambda a: a.strip()
+bounded_range_pattern = re.compile(r'\s*([\[(])([^,]*),([^,]*)([\])])\s*$')
+hyphen_range_pattern = re.compile(r'\s*(-?[^-]*)(?:-\s*(-?[^-]*))?$')
+spaced_hyphen_pattern = re.compile(r'\s+-\s+')
 
 
 class IntervalStringParser(object):
     def parse_string(self, value):
+        if instrumentation.enabled:
+            instrumentation.record('string_parses')
         if ',' not in value:
             return self.parse_hyphen_range(value)
         else:
             return self.parse_bounded_range(value)
 
     def parse_bounded_range(self, value):
-        values = value.strip()[1:-1].split(',')
-        lower, upper = map(strip, values)
+        """
+        Parse bounded ranges such as: [1, 5), (, 3], [2,)
+        """
+        match = bounded_range_pattern.match(value)
+        if match is None:
+            raise IntervalException('Unknown interval format given.')
+        lower_bracket, lower, upper, upper_bracket = match.groups()
         return (
-            [lower, upper],
-            value[0] == '[',
-            value[-1] == ']'
+            [lower.strip(), upper.strip()],
+            lower_bracket == '[',
+            upper_bracket == ']'
         )
 
     def parse_hyphen_range(self, value):
         """
         Parse hyphen ranges such as: 2 - 5, -2 - -1, -3 - 5
-        """
-        values = value.strip().split('-')
-        values = list(map(strip, values))
-        if len(values) == 1:
-            lower = upper = value.strip()
-        elif len(values) == 2:
-            lower, upper = values
-            if lower == '':
-                # Parse range such as '-3'
-                upper = '-' + upper
-                lower = upper
-        else:
-            if len(values) > 4:
-                raise IntervalException(
-                    'Unknown interval format given.'
-                )
-            values_copy = []
-            for key, value in enumerate(values):
-                if value != '':
-                    try:
-                        if values[key - 1] == '':
-                            value = '-' + value
-                    except IndexError:
-                        pass
-                    values_copy.append(value)
-            lower, upper = values_copy
 
+        Bounds containing hyphens themselves, such as ISO dates, are
+        supported when the bounds are separated by a hyphen surrounded by
+        whitespace: 2000-01-01 - 2000-01-31
+        """
+        match = hyphen_range_pattern.match(value)
+        if match is None:
+            return self.parse_spaced_hyphen_range(value)
+        lower, upper = match.groups()
+        lower = lower.strip()
+        upper = lower if upper is None else upper.strip()
         return [lower, upper], True, True
 
+    def parse_spaced_hyphen_range(self, value):
+        bounds = spaced_hyphen_pattern.split(value.strip())
+        if len(bounds) == 1:
+            bounds.append(bounds[0])
+        elif len(bounds) != 2:
+            raise IntervalException('Unknown interval format given.')
+        return bounds, True, True
+
+
+string_parser = IntervalStringParser()
+
+parse_errors = (IntervalException, ArithmeticError, TypeError, ValueError)
+
+
+def parse_many(strings, interval_class, errors=None, **kwargs):
+    """
+    Parse given interval strings into intervals of given class, yielding
+    one interval for each string::
+
+        >>> from intervals import IntInterval, parse_many
+        >>> errors = {}
+        >>> strings = ['[1, 3)', '4 - 6', '[a, b]']
+        >>> list(parse_many(strings, IntInterval, errors))
+        [IntInterval('[1, 3)'), IntInterval('[4, 6]'), None]
+        >>> errors
+        {2: ValueError("invalid literal for int() with base 10: 'a'")}
+
+    Strings are parsed lazily, so large inputs such as the rows of a CSV
+    file can be streamed. Strings that can not be parsed do not raise an
+    exception. Instead ``None`` is yielded for them and the exception is
+    stored into ``errors`` by the index of the string.
+
+    :param strings: iterable of interval strings
+    :param interval_class: interval class of the intervals
+    :param errors:
+        Optional dict for collecting the exceptions of failed strings by
+        their index.
+    :param kwargs: additional keyword arguments for the interval class
+    """
+    parse_string = string_parser.parse_string
+    for index, value in enumerate(strings):
+        try:
+            bounds, lower_inc, upper_inc = parse_string(value)
+            interval = interval_class(
+                bounds,
+                lower_inc=lower_inc,
+                upper_inc=upper_inc,
+                **kwargs
+            )
+        except parse_errors as e:
+            if errors is not None:
+                errors[index] = e
+            interval = None
+        yield interval
+
 
 class IntervalParser(object):
     def parse_object(self, obj):
@@ -0,0 +1,429 @@
+from bisect import bisect_left
+from collections import Counter
+
+from infinity import inf, is_infinite
+
+
+def _bounds(interval):
+    """
+    Return the bounds of given interval as a ``(lower, lower_inc, upper,
+    upper_inc)`` tuple. Discrete intervals are given in canonical form, so
+    that every elementary segment between two bounds is covered by the
+    same intervals as the bound it starts from.
+    """
+    if interval.discrete:
+        return interval.canonical_bounds()
+    return (
+        interval.lower,
+        interval.lower_inc,
+        interval.upper,
+        interval.upper_inc
+    )
+
+
+class SegmentTree(object):
+    """
+    A coordinate compressed segment tree over weighted intervals, answering
+    aggregate coverage queries in O(log n) time::
+
+        >>> from intervals import IntInterval, SegmentTree
+        >>> tree = SegmentTree(
+        ...     [IntInterval([1, 5]), IntInterval([4, 8]),
+        ...      IntInterval([7, 9])],
+        ...     weights=[1, 2, 1]
+        ... )
+        >>> tree.depth(4)
+        3
+        >>> tree.max()
+        (3, IntInterval('[4, 6)'))
+        >>> tree.weight(IntInterval([6, 7]))
+        3
+
+    The bounds of the intervals split the line into elementary segments:
+    the bounds themselves and the open segments between them. Each interval
+    covers a contiguous range of elementary segments, which respects the
+    inclusivity of its bounds, so ``[1, 4)`` and ``[4, 8]`` do not overlap
+    at 4. Discrete intervals are stored in canonical form. Empty intervals
+    are ignored.
+
+    Intervals can be added and removed in O(log n) time as long as their
+    bounds are bounds of intervals already in the tree. Adding an interval
+    with new bounds rebuilds the tree in O(n log n) time, so large
+    collections should be given to the constructor at once.
+
+    :param intervals: iterable of :class:`AbstractInterval` objects
+    :param weights:
+        Optional iterable of weights of the intervals. Each interval has a
+        weight of 1 by default.
+    :param interval_class:
+        Interval class of the intervals returned by :meth:`max`. Defaults
+        to the class of the first interval.
+    """
+
+    def __init__(self, intervals=(), weights=None, interval_class=None):
+        self.interval_class = interval_class
+        self._counts = Counter()
+        self._size = 0
+        intervals = list(intervals)
+        if weights is None:
+            weights = [1] * len(intervals)
+        else:
+            weights = list(weights)
+            if len(weights) != len(intervals):
+                raise ValueError(
+                    'Intervals and weights must be of the same length.'
+                )
+        for interval, weight in zip(intervals, weights):
+            self._count(interval, weight, 1)
+        self._build()
+
+    def __len__(self):
+        return self._size
+
+    def _count(self, interval, weight, count):
+        """
+        Count given interval with given weight and return its key, or
+        ``None`` for empty intervals.
+        """
+        if self.interval_class is None:
+            self.interval_class = type(interval)
+        if interval.empty:
+            return None
+        key = (_bounds(interval), weight)
+        if count < 0 and not self._counts[key]:
+            raise KeyError(interval)
+        self._counts[key] += count
+        if not self._counts[key]:
+            del self._counts[key]
+        self._size += count
+        return key
+
+    def _build(self):
+        points = set()
+        for (lower, _, upper, _), _ in self._counts:
+            if not is_infinite(lower):
+                points.add(lower)
+            if not is_infinite(upper):
+                points.add(upper)
+        self._points = points = sorted(points)
+        self._zero = points[0] - points[0] if points else 0
+        self._slots = slots = 2 * len(points) + 1
+        lengths = [self._zero] * slots
+        for index in range(1, len(points)):
+            lengths[2 * index] = points[index] - points[index - 1]
+        nodes = 4 * slots
+        self._add = [0] * nodes
+        self._max = [0] * nodes
+        self._min = [0] * nodes
+        self._sum = [self._zero] * nodes
+        self._length = [self._zero] * nodes
+        self._build_lengths(1, 0, slots - 1, lengths)
+        self._starts = [0] * (slots + 1)
+        self._ends = [0] * (slots + 1)
+        for (bounds, weight), count in self._counts.items():
+            self._apply(bounds, weight * count)
+
+    def _build_lengths(self, node, lo, hi, lengths):
+        if lo == hi:
+            self._length[node] = lengths[lo]
+            return
+        mid = (lo + hi) // 2
+        self._build_lengths(2 * node, lo, mid, lengths)
+        self._build_lengths(2 * node + 1, mid + 1, hi, lengths)
+        self._length[node] = (
+            self._length[2 * node] + self._length[2 * node + 1]
+        )
+
+    def _slot(self, value, inc, lower):
+        """
+        Return the elementary segment of given bound along with whether or
+        not the bound is one of the bounds of the tree. Bounds falling
+        between two bounds of the tree are given the open segment
+        containing them.
+        """
+        if is_infinite(value):
+            return (0 if lower else self._slots - 1), True
+        points = self._points
+        index = bisect_left(points, value)
+        if index < len(points) and points[index] == value:
+            if inc:
+                return 2 * index + 1, True
+            return 2 * index + (2 if lower else 0), True
+        return 2 * index, False
+
+    def _range(self, bounds):
+        lower, lower_inc, upper, upper_inc = bounds
+        start, _ = self._slot(lower, lower_inc, True)
+        end, _ = self._slot(upper, upper_inc, False)
+        return start, end
+
+    def _apply(self, bounds, weight):
+        start, end = self._range(bounds)
+        self._update(1, 0, self._slots - 1, start, end, weight)
+        self._fenwick_add(self._starts, start, weight)
+        self._fenwick_add(self._ends, end, weight)
+
+    def add(self, interval, weight=1):
+        """
+        Add given interval to this tree.
+
+        :param interval: :class:`AbstractInterval` object
+        :param weight: weight of the interval
+        """
+        key = self._count(interval, weight, 1)
+        if key is None:
+            return
+        lower, lower_inc, upper, upper_inc = key[0]
+        if (
+            self._slot(lower, lower_inc, True)[1] and
+            self._slot(upper, upper_inc, False)[1]
+        ):
+            self._apply(key[0], weight)
+        else:
+            self._build()
+
+    def remove(self, interval, weight=1):
+        """
+        Remove given interval, added with given weight, from this tree.
+        :exc:`KeyError` is raised if the tree does not contain the interval.
+
+        :param interval: :class:`AbstractInterval` object
+        :param weight: weight the interval was added with
+        """
+        key = self._count(interval, weight, -1)
+        if key is not None:
+            self._apply(key[0], -weight)
+
+    def _update(self, node, lo, hi, start, end, weight):
+        if start <= lo and hi <= end:
+            self._add[node] += weight
+            self._max[node] += weight
+            self._min[node] += weight
+            self._sum[node] += weight * self._length[node]
+            return
+        mid = (lo + hi) // 2
+        left = 2 * node
+        right = left + 1
+        if start <= mid:
+            self._update(left, lo, mid, start, end, weight)
+        if end > mid:
+            self._update(right, mid + 1, hi, start, end, weight)
+        add = self._add[node]
+        self._max[node] = add + max(self._max[left], self._max[right])
+        self._min[node] = add + min(self._min[left], self._min[right])
+        self._sum[node] = (
+            add * self._length[node] + self._sum[left] + self._sum[right]
+        )
+
+    def _fenwick_add(self, tree, index, weight):
+        index += 1
+        while index < len(tree):
+            tree[index] += weight
+            index += index & -index
+
+    def _fenwick_sum(self, tree, index):
+        """
+        Return the sum of the weights up to and including given index.
+        """
+        total = 0
+        index += 1
+        while index > 0:
+            total += tree[index]
+            index -= index & -index
+        return total
+
+    def _depth(self, slot):
+        node, lo, hi = 1, 0, self._slots - 1
+        depth = 0
+        while True:
+            depth += self._add[node]
+            if lo == hi:
+                return depth
+            mid = (lo + hi) // 2
+            if slot <= mid:
+                node, hi = 2 * node, mid
+            else:
+                node, lo = 2 * node + 1, mid + 1
+
+    def depth(self, point):
+        """
+        Return the total weight of the intervals containing given point.
+
+        :param point: a value comparable with the bounds of the intervals
+        """
+        return self._depth(self._slot(point, True, True)[0])
+
+    def weight(self, interval):
+        """
+        Return the total weight of the intervals sharing at least one point
+        with given interval.
+
+        :param interval: :class:`AbstractInterval` object
+        """
+        if interval.empty:
+            return 0
+        start, end = self._range(_bounds(interval))
+        if start > end:
+            return 0
+        return (
+            self._fenwick_sum(self._starts, end) -
+            self._fenwick_sum(self._ends, start - 1)
+        )
+
+    def _sum_query(self, node, lo, hi, start, end):
+        if start <= lo and hi <= end:
+            return self._sum[node], self._length[node]
+        mid = (lo + hi) // 2
+        total = length = self._zero
+        if start <= mid:
+            child_sum, child_length = self._sum_query(
+                2 * node, lo, mid, start, end
+            )
+            total += child_sum
+            length += child_length
+        if end > mid:
+            child_sum, child_length = self._sum_query(
+                2 * node + 1, mid + 1, hi, start, end
+            )
+            total += child_sum
+            length += child_length
+        return total + self._add[node] * length, length
+
+    def integral(self, interval):
+        """
+        Return the integral of the depth over given bounded interval, which
+        is the sum of the weights of the intervals multiplied by the lengths
+        of their overlaps with given interval. For example, the integral
+        over a day of reservations weighted by seats is in seat hours::
+
+            >>> from intervals import FloatInterval, SegmentTree
+            >>> tree = SegmentTree(
+            ...     [FloatInterval([0, 10]), FloatInterval([5, 20])],
+            ...     weights=[1, 2]
+            ... )
+            >>> tree.integral(FloatInterval([0, 8]))
+            14.0
+
+        Discrete intervals are integrated in canonical form, so each value
+        counts as one step.
+
+        :param interval: :class:`AbstractInterval` object
+        """
+        if interval.empty:
+            return self._zero
+        lower, lower_inc, upper, upper_inc = _bounds(interval)
+        if is_infinite(lower) or is_infinite(upper):
+            raise TypeError('Only bounded intervals can be integrated.')
+        points = self._points
+        start, start_exact = self._slot(lower, lower_inc, True)
+        end, end_exact = self._slot(upper, upper_inc, False)
+        if start > end:
+            return self._zero
+        total = self._zero
+        if not start_exact:
+            # The lower bound falls within an open segment.
+            segment_upper = upper if start == end else points[start // 2]
+            total += self._depth(start) * (segment_upper - lower)
+            start += 1
+        if not end_exact and start <= end:
+            total += self._depth(end) * (upper - points[end // 2 - 1])
+            end -= 1
+        if start <= end:
+            total += self._sum_query(1, 0, self._slots - 1, start, end)[0]
+        return total
+
+    def _max_query(self, node, lo, hi, start, end):
+        """
+        Return the maximum depth within given range of this node, excluding
+        the weights of its ancestors, along with its first segment.
+        """
+        if start <= lo and hi <= end:
+            # The maximum of a node includes its own weight, so the descent
+            # only has to pick the child holding the first maximum.
+            value = self._max[node]
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if self._max[2 * node] >= self._max[2 * node + 1]:
+                    node, hi = 2 * node, mid
+                else:
+                    node, lo = 2 * node + 1, mid + 1
+            return value, lo
+        mid = (lo + hi) // 2
+        best = None
+        if start <= mid:
+            best = self._max_query(2 * node, lo, mid, start, end)
+        if end > mid:
+            result = self._max_query(2 * node + 1, mid + 1, hi, start, end)
+            if best is None or result[0] > best[0]:
+                best = result
+        return best[0] + self._add[node], best[1]
+
+    def _first_below(self, node, lo, hi, start, threshold, depth):
+        """
+        Return the first segment at or after given start whose depth is
+        below given threshold, or ``None``.
+        """
+        if hi < start or depth + self._min[node] >= threshold:
+            return None
+        if lo == hi:
+            return lo
+        depth += self._add[node]
+        mid = (lo + hi) // 2
+        result = self._first_below(2 * node, lo, mid, start, threshold, depth)
+        if result is None:
+            result = self._first_below(
+                2 * node + 1, mid + 1, hi, start, threshold, depth
+            )
+        return result
+
+    def _interval(self, start, end):
+        """
+        Return the interval covering given range of segments.
+        """
+        points = self._points
+        if start % 2:
+            lower, lower_inc = points[start // 2], True
+        elif start == 0:
+            lower, lower_inc = -inf, False
+        else:
+            lower, lower_inc = points[start // 2 - 1], False
+        if end % 2:
+            upper, upper_inc = points[end // 2], True
+        elif end == self._slots - 1:
+            upper, upper_inc = inf, False
+        else:
+            upper, upper_inc = points[end // 2], False
+        return self.interval_class.from_bounds(
+            lower, upper, lower_inc, upper_inc
+        )
+
+    def max(self, interval=None):
+        """
+        Return the maximum depth within given interval, or on the whole line
+        if no interval is given, along with the first interval where the
+        depth is at its maximum, as a ``(depth, interval)`` tuple.
+
+        ``(0, None)`` is returned for empty intervals and for trees whose
+        interval class is not known, since no interval has been added.
+
+        :param interval: :class:`AbstractInterval` object
+        """
+        if self.interval_class is None:
+            return 0, None
+        last = self._slots - 1
+        if interval is None:
+            start, end = 0, last
+        elif interval.empty:
+            return 0, None
+        else:
+            start, end = self._range(_bounds(interval))
+            if start > end:
+                return 0, None
+        depth, first = self._max_query(1, 0, last, start, end)
+        below = self._first_below(1, 0, last, first, depth, 0)
+        if below is None or below > end:
+            below = end + 1
+        where = self._interval(first, below - 1)
+        if interval is not None:
+            where = where & interval
+        return depth, where
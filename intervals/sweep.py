@@ -0,0 +1,430 @@
+import heapq
+from itertools import chain, count, repeat
+
+from .array import _decode, IntervalArray
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _key_bounds(interval):
+    """
+    Return the bounds used for comparing given interval with its neighbours
+    as a ``(lower, lower_inc, upper, upper_inc)`` tuple. Discrete intervals
+    are compared in canonical form, so that for example ``[1, 3]`` and
+    ``[4, 6]`` touch and ``[1, 2)`` and ``(1, 3)`` do not overlap.
+    """
+    if interval.discrete:
+        return interval.canonical_bounds()
+    return (
+        interval.lower,
+        interval.lower_inc,
+        interval.upper,
+        interval.upper_inc
+    )
+
+
+def _precedes(bounds, other):
+    """
+    Return whether or not given bounds sort after other bounds.
+    """
+    return bounds[0] > other[0] or (
+        bounds[0] == other[0] and other[1] and not bounds[1]
+    )
+
+
+def merge(intervals, *, adjacent=True, presorted=False):
+    """
+    Merge given intervals into a minimal sequence of disjoint intervals,
+    using one sort and a linear sweep::
+
+        >>> from intervals import IntInterval, merge
+        >>> list(merge([
+        ...     IntInterval([4, 6]),
+        ...     IntInterval([1, 3]),
+        ...     IntInterval([10, 12])
+        ... ]))
+        [IntInterval('[1, 6]'), IntInterval('[10, 12]')]
+
+    Intervals are merged when they are connected, following the rules of
+    :meth:`AbstractInterval.is_connected`. Discrete intervals are also
+    merged when they are adjacent, like ``[1, 3]`` and ``[4, 6]`` above.
+    Empty intervals are skipped. Intervals that are not merged with any
+    other interval are yielded as is.
+
+    :param intervals: iterable of intervals of the same class
+    :param adjacent:
+        Whether or not to merge intervals that touch without overlapping,
+        such as ``[1, 3)`` and ``[3, 5]``. If ``False``, only intervals
+        sharing at least one point are merged.
+    :param presorted:
+        Whether or not given intervals are already sorted by their lower
+        bounds, inclusive lower bounds first. Sorted intervals are merged
+        lazily using constant memory. :exc:`ValueError` is raised if the
+        intervals turn out not to be sorted.
+    """
+    def key(interval):
+        bounds = _key_bounds(interval)
+        return bounds[0], not bounds[1]
+
+    if not presorted:
+        intervals = sorted(intervals, key=key)
+
+    first = last = None
+    for interval in intervals:
+        if interval.empty:
+            continue
+        bounds = _key_bounds(interval)
+        if first is None:
+            first = last = interval
+            lower_bounds = upper_bounds = bounds
+            continue
+        if presorted and _precedes(lower_bounds, bounds):
+            raise ValueError('Intervals are not sorted.')
+        lower_bounds = bounds
+        upper, upper_inc = upper_bounds[2], upper_bounds[3]
+        if bounds[0] < upper or bounds[0] == upper and (
+            (bounds[1] or upper_inc) if adjacent
+            else (bounds[1] and upper_inc)
+        ):
+            if bounds[2] > upper or (
+                bounds[2] == upper and bounds[3] and not upper_inc
+            ):
+                last = interval
+                upper_bounds = bounds
+        else:
+            yield _join(first, last)
+            first = last = interval
+            upper_bounds = bounds
+    if first is not None:
+        yield _join(first, last)
+
+
+def _join(first, last):
+    """
+    Return an interval from the lower bound of first interval to the upper
+    bound of last interval.
+    """
+    if first is last:
+        return first
+    return first.from_bounds(
+        first.lower,
+        last.upper,
+        first.lower_inc,
+        last.upper_inc,
+        step=first.step
+    )
+
+
+def _canonical(lower, lower_inc, upper, upper_inc, step):
+    """
+    Return given bounds of a non-empty discrete interval in canonical form.
+    """
+    if not lower_inc:
+        lower, lower_inc = lower + step, True
+    if upper_inc:
+        upper, upper_inc = upper + step, False
+    return lower, lower_inc, upper, upper_inc
+
+
+def _interval_items(intervals, presorted):
+    """
+    Yield ``(lower, lower_inc, upper, upper_inc, index, interval)`` items of
+    the non-empty intervals of given iterable, sorted by lower bound.
+    Discrete intervals are given in canonical form.
+    """
+    def items():
+        for index, interval in enumerate(intervals):
+            if not interval.empty:
+                yield _key_bounds(interval) + (index, interval)
+
+    if not presorted:
+        return iter(sorted(items(), key=_lower_key))
+    return _check_sorted(items())
+
+
+def _array_items(array, presorted, objects):
+    """
+    Yield the items of given IntervalArray the same way as
+    :func:`_interval_items`. Intervals are only created if ``objects`` is
+    true.
+    """
+    lowers = _decode(array.lower)
+    uppers = _decode(array.upper)
+    lower_incs = array.lower_inc.tolist()
+    upper_incs = array.upper_inc.tolist()
+    empty = array.empty.tolist()
+    if presorted:
+        indices = range(len(array))
+    elif array.lower.dtype.kind != 'O':
+        indices = np.lexsort((~array.lower_inc, array.lower)).tolist()
+    else:
+        indices = sorted(
+            range(len(array)),
+            key=lambda index: (lowers[index], not lower_incs[index])
+        )
+
+    def items():
+        interval_class = array.interval_class
+        step = array.step
+        for index in indices:
+            if empty[index]:
+                continue
+            bounds = (
+                lowers[index],
+                lower_incs[index],
+                uppers[index],
+                upper_incs[index]
+            )
+            interval = None
+            if objects:
+                interval = interval_class.from_bounds(
+                    bounds[0], bounds[2], bounds[1], bounds[3], step=step
+                )
+            if step is not None:
+                bounds = _canonical(*bounds, step=step)
+            yield bounds + (index, interval)
+
+    if presorted:
+        return _check_sorted(items())
+    return items()
+
+
+def _lower_key(item):
+    return item[0], not item[1]
+
+
+def _check_sorted(items):
+    previous = None
+    for item in items:
+        if previous is not None and _precedes(previous, item):
+            raise ValueError('Intervals are not sorted.')
+        previous = item
+        yield item
+
+
+def _overlaps(bounds, other, adjacent):
+    """
+    Return whether or not given bounds share at least one point, or with
+    ``adjacent``, whether or not they are connected.
+    """
+    lower, lower_inc, upper, upper_inc = bounds[:4]
+    other_lower, other_lower_inc, other_upper, other_upper_inc = other[:4]
+    if upper > other_lower and other_upper > lower:
+        return True
+    if adjacent:
+        return (
+            upper == other_lower and (upper_inc or other_lower_inc) or
+            lower == other_upper and (lower_inc or other_upper_inc)
+        )
+    return (
+        upper == other_lower and upper_inc and other_lower_inc or
+        lower == other_upper and lower_inc and other_upper_inc
+    )
+
+
+def overlap_join(
+    left,
+    right,
+    *,
+    adjacent=False,
+    presorted=False,
+    indices=False
+):
+    """
+    Join two sequences of intervals on overlap, yielding a ``(left, right)``
+    pair for every interval of ``left`` that overlaps an interval of
+    ``right``::
+
+        >>> from intervals import IntInterval, overlap_join
+        >>> list(overlap_join(
+        ...     [IntInterval([1, 4]), IntInterval([10, 12])],
+        ...     [IntInterval.closed_open(4, 8), IntInterval([5, 10])],
+        ...     indices=True
+        ... ))
+        [(0, 0), (1, 1)]
+
+    Both sequences are sorted and merged in a single sweep, keeping only the
+    intervals that may still overlap coming intervals in memory. The join
+    takes O(n log n + m log m + k) time, where k is the number of reported
+    pairs, or O(n + m + k) if the inputs are presorted. Pairs are yielded in
+    the order of the lower bound of their later interval.
+
+    Inclusivity of the bounds is respected, so ``[1, 4)`` and ``[4, 8]`` do
+    not overlap, and discrete intervals are compared in canonical form.
+    Empty intervals never overlap anything.
+
+    :param left:
+        iterable of intervals or an :class:`IntervalArray`
+    :param right:
+        iterable of intervals or an :class:`IntervalArray`
+    :param adjacent:
+        Whether or not to also join intervals that touch without
+        overlapping, such as ``[1, 4)`` and ``[4, 8]``.
+    :param presorted:
+        Whether or not both inputs are already sorted by their lower bounds,
+        inclusive lower bounds first. Sorted iterables are joined lazily.
+        :exc:`ValueError` is raised if the intervals turn out not to be
+        sorted.
+    :param indices:
+        If ``True``, pairs of indices to the inputs are yielded instead of
+        pairs of intervals.
+    """
+    sides = []
+    for intervals in (left, right):
+        if isinstance(intervals, IntervalArray):
+            sides.append(_array_items(intervals, presorted, not indices))
+        else:
+            sides.append(_interval_items(intervals, presorted))
+    value = 4 if indices else 5
+    active = ([], [])
+    counter = count()
+    for side, item in heapq.merge(
+        ((0, item) for item in sides[0]),
+        ((1, item) for item in sides[1]),
+        key=lambda pair: _lower_key(pair[1])
+    ):
+        lower = item[0]
+        for heap in active:
+            while heap and heap[0][0] < lower:
+                heapq.heappop(heap)
+        for _, _, other in active[1 - side]:
+            if _overlaps(item, other, adjacent):
+                if side:
+                    yield other[value], item[value]
+                else:
+                    yield item[value], other[value]
+        heapq.heappush(active[side], (item[2], next(counter), item))
+
+
+def _weighted_items(intervals, weights, presorted):
+    """
+    Yield ``(lower, lower_inc, upper, upper_inc, weight, interval)`` items
+    of the non-empty intervals of given iterable, sorted by lower bound.
+    Discrete intervals are given in canonical form.
+    """
+    if isinstance(intervals, IntervalArray):
+        items = _array_items(intervals, presorted, False)
+        if weights is None:
+            return (item[:4] + (1, None) for item in items)
+        weights = list(weights)
+        return (item[:4] + (weights[item[4]], None) for item in items)
+
+    def items():
+        for interval, weight in zip(intervals, weights):
+            if not interval.empty:
+                yield _key_bounds(interval) + (weight, interval)
+
+    if weights is None:
+        weights = repeat(1)
+    if not presorted:
+        return iter(sorted(items(), key=_lower_key))
+    return _check_sorted(items())
+
+
+def coverage(intervals, weights=None, *, presorted=False):
+    """
+    Yield the coverage profile of given intervals as ``(interval, depth)``
+    pairs, where depth is the number of intervals containing the points of
+    the interval::
+
+        >>> from intervals import FloatInterval, coverage
+        >>> for segment in coverage([
+        ...     FloatInterval([1, 4]),
+        ...     FloatInterval.open(2, 6),
+        ...     FloatInterval([8, 9])
+        ... ]):
+        ...     print(segment)
+        (FloatInterval('[1.0, 2.0]'), 1)
+        (FloatInterval('(2.0, 4.0]'), 2)
+        (FloatInterval('(4.0, 6.0)'), 1)
+        (FloatInterval('[6.0, 8.0)'), 0)
+        (FloatInterval('[8.0, 9.0]'), 1)
+
+    The profile is a run-length encoded step function: the yielded
+    intervals are disjoint, sorted and together cover the span from the
+    first lower bound to the last upper bound, gaps included, and the
+    depths of consecutive intervals differ. Inclusivity of the bounds is
+    respected, so the depth can change at a single point. Discrete
+    intervals are counted in canonical form and the profile is given in
+    canonical form too. Empty intervals are skipped.
+
+    The intervals are sorted once and swept, keeping only the upper bounds
+    of the intervals containing the current point in memory. Presorted
+    intervals are swept lazily, so the profile of intervals streamed from a
+    file or a database cursor is computed in bounded memory.
+
+    :param intervals:
+        iterable of intervals of the same class or an :class:`IntervalArray`
+    :param weights:
+        Optional iterable of weights of the intervals, in which case depth
+        is the total weight of the intervals containing the points instead.
+        Each interval has a weight of 1 by default.
+    :param presorted:
+        Whether or not given intervals are already sorted by their lower
+        bounds, inclusive lower bounds first. :exc:`ValueError` is raised if
+        the intervals turn out not to be sorted.
+    """
+    items = _weighted_items(intervals, weights, presorted)
+    if isinstance(intervals, IntervalArray):
+        interval_class = intervals.interval_class
+        step = intervals.step
+    else:
+        first = next(items, None)
+        if first is None:
+            return
+        interval_class = type(first[5])
+        step = first[5].step
+        items = chain([first], items)
+    depth = change = 0
+    start = position = None
+    for key, delta in _coverage_events(items):
+        if key != position:
+            if change:
+                if start is not None:
+                    yield _segment(
+                        interval_class, step, start, position, depth
+                    )
+                start = position
+                depth += change
+            position, change = key, 0
+        change += delta
+    if change and start is not None:
+        yield _segment(interval_class, step, start, position, depth)
+
+
+def _coverage_events(items):
+    """
+    Yield the ``(position, delta)`` depth changes of given sorted items in
+    the order of their positions.
+
+    Bounds are mapped to positions, where ``(value, 0)`` is the point value
+    itself and ``(value, 1)`` the open segment right after it. An interval
+    adds its weight to the depth from the position of its lower bound and
+    removes it from the position right after its upper bound.
+    """
+    ends = []
+    counter = count()
+    for item in items:
+        lower = (item[0], 0 if item[1] else 1)
+        while ends and ends[0][0] <= lower:
+            key, _, delta = heapq.heappop(ends)
+            yield key, delta
+        yield lower, item[4]
+        upper = (item[2], 1 if item[3] else 0)
+        heapq.heappush(ends, (upper, next(counter), -item[4]))
+    while ends:
+        key, _, delta = heapq.heappop(ends)
+        yield key, delta
+
+
+def _segment(interval_class, step, start, end, depth):
+    """
+    Return the ``(interval, depth)`` pair of the segment between given
+    positions.
+    """
+    return interval_class.from_bounds(
+        start[0], end[0], not start[1], bool(end[1]), step=step
+    ), depth
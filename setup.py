@@ -22,11 +22,13 @@ def get_version():
 
 
 extras_require = {
+    'numpy': ['numpy'],
     'test': [
         'pytest>=2.2.3',
         'Pygments>=1.2',
         'flake8>=2.4.0',
         'isort>=4.2.2',
+        'numpy',
     ],
 }
 
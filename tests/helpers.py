@@ -0,0 +1,36 @@
+from intervals import FloatInterval
+
+
+def random_intervals(
+    rnd,
+    count,
+    interval_class=FloatInterval,
+    span=100,
+    lengths=range(11),
+    empty=False
+):
+    """
+    Return a list of random intervals for comparing against brute force
+    results.
+
+    :param rnd: :class:`random.Random` instance used for the intervals
+    :param count: number of intervals
+    :param interval_class: class of the intervals
+    :param span: largest lower bound, the smallest is 0
+    :param lengths: sequence of distances between the bounds to choose from
+    :param empty:
+        Whether or not intervals with equal bounds may be half-open and
+        thus empty. Otherwise they are closed.
+    """
+    intervals = []
+    for _ in range(count):
+        lower = rnd.randint(0, span)
+        upper = lower + rnd.choice(lengths)
+        lower_inc = lower == upper or rnd.random() < 0.5
+        upper_inc = rnd.random() < 0.5 or lower == upper and not empty
+        intervals.append(interval_class(
+            [lower, upper],
+            lower_inc=lower_inc,
+            upper_inc=upper_inc
+        ))
+    return intervals
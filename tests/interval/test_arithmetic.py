@@ -1,6 +1,8 @@
-from pytest import mark
+from datetime import date
 
-from intervals import IntInterval
+from pytest import mark, raises
+
+from intervals import DateInterval, FloatInterval, IllegalArgument, IntInterval
 
 
 class TestArithmeticOperators(object):
@@ -60,3 +62,37 @@ class TestArithmeticFunctions(object):
     ))
     def test_sup(self, first, second, result):
         assert first.sup(second) == IntInterval(result)
+
+
+class TestDerivedIntervals(object):
+    @mark.parametrize('operation', (
+        lambda a, b: a & b,
+        lambda a, b: a | b,
+        lambda a, b: a + b,
+        lambda a, b: a - b,
+        lambda a, b: a.glb(b),
+        lambda a, b: a.lub(b),
+    ))
+    def test_preserves_class(self, operation):
+        result = operation(IntInterval([1, 5]), IntInterval([3, 8]))
+        assert type(result) is IntInterval
+        assert type(result.lower) is int
+        assert type(result.upper) is int
+
+    def test_coerces_bounds_of_other_interval_classes(self):
+        result = FloatInterval([1, 5]) & IntInterval([3, 8])
+        assert type(result) is FloatInterval
+        assert result.lower == 3.0
+        assert type(result.lower) is float
+
+    def test_changed_bound_types_are_coerced(self):
+        interval = DateInterval([date(2000, 1, 1), date(2000, 1, 2)])
+        with raises(TypeError):
+            interval - interval
+
+    def test_intersection_of_empty_intervals(self):
+        with raises(IllegalArgument):
+            (
+                IntInterval.from_string('(3, 3]') &
+                IntInterval.from_string('[3, 3)')
+            )
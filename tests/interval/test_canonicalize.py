@@ -1,6 +1,8 @@
 from datetime import date
 
-from intervals import canonicalize, DateInterval, IntInterval
+from pytest import mark, raises
+
+from intervals import canonicalize, DateInterval, FloatInterval, IntInterval
 
 
 def test_canonicalize_integer_intervals():
@@ -16,3 +18,42 @@ def test_canonicalize_integer_intervals():
 def test_canonicalize_date_intervals():
     interval = canonicalize(DateInterval([date(2000, 2, 2), date(2000, 2, 6)]))
     assert interval.upper.day == 7
+
+
+class TestCanonicalBounds(object):
+    @mark.parametrize(('interval', 'bounds'), (
+        (IntInterval([1, 4]), (1, True, 5, False)),
+        (IntInterval((1, 4)), (2, True, 4, False)),
+        (IntInterval.from_string('(1, 4]'), (2, True, 5, False)),
+        (IntInterval.from_string('[2, 2)'), (2, True, 2, False)),
+        (IntInterval((2, 3)), (2, False, 3, False)),
+        (IntInterval([0, 6], step=3), (0, True, 9, False)),
+    ))
+    def test_canonical_bounds(self, interval, bounds):
+        assert interval.canonical_bounds() == bounds
+
+    def test_non_discrete_intervals(self):
+        with raises(TypeError):
+            FloatInterval([1, 2]).canonical_bounds()
+
+    def test_bounds_can_not_be_assigned(self):
+        interval = IntInterval([1, 4])
+        assert interval.canonical_bounds() == (1, True, 5, False)
+        for attr in ('lower', 'upper', 'lower_inc', 'upper_inc', 'step'):
+            with raises(AttributeError):
+                setattr(interval, attr, 2)
+        assert interval.canonical_bounds() == (1, True, 5, False)
+
+    def test_comparison_does_not_construct_intervals(self, monkeypatch):
+        first = IntInterval([1, 3])
+        second = IntInterval.closed_open(1, 4)
+
+        def fail(*args, **kwargs):
+            raise AssertionError('Interval was constructed.')
+
+        monkeypatch.setattr(IntInterval, '__init__', fail)
+        monkeypatch.setattr(IntInterval, 'from_bounds', fail)
+        assert first == second
+        assert first.length == second.length == 2
+        assert not first.empty
+        assert first.hyphenized == second.hyphenized == '1 - 3'
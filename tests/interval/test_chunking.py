@@ -0,0 +1,232 @@
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from itertools import islice
+
+from pytest import mark, raises
+
+from intervals import (
+    CharacterInterval,
+    DateInterval,
+    DateTimeInterval,
+    DecimalInterval,
+    FloatInterval,
+    IntInterval
+)
+
+
+def covered_values(pieces):
+    values = []
+    for piece in pieces:
+        values.extend(piece)
+    return values
+
+
+def assert_covers(interval, pieces):
+    """
+    Assert that given continuous pieces are disjoint, ordered and exactly
+    cover given interval.
+    """
+    assert pieces[0].lower == interval.lower
+    assert pieces[0].lower_inc == interval.lower_inc
+    assert pieces[-1].upper == interval.upper
+    assert pieces[-1].upper_inc == interval.upper_inc
+    for piece, following in zip(pieces, pieces[1:]):
+        assert piece.upper == following.lower
+        assert not piece.upper_inc
+        assert following.lower_inc
+
+
+class TestSplit(object):
+    @mark.parametrize(('interval', 'n', 'expected'), (
+        (IntInterval([1, 10]), 3, ['[1, 4]', '[5, 7]', '[8, 10]']),
+        (IntInterval((0, 10)), 4, ['[1, 3]', '[4, 5]', '[6, 7]', '[8, 9]']),
+        (IntInterval([1, 3]), 5, ['[1, 1]', '[2, 2]', '[3, 3]']),
+        (IntInterval([1, 10]), 1, ['[1, 10]']),
+        (IntInterval([0, 20], step=2), 3, ['[0, 6]', '[8, 14]', '[16, 20]']),
+        (IntInterval.open(1, 2), 3, []),
+        (FloatInterval([0, 1]), 2, ['[0.0, 0.5)', '[0.5, 1.0]']),
+        (FloatInterval((0, 1)), 2, ['(0.0, 0.5)', '[0.5, 1.0)']),
+        (FloatInterval([1, 1]), 3, ['[1.0, 1.0]']),
+        (FloatInterval.closed_open(1, 1), 3, []),
+    ))
+    def test_split(self, interval, n, expected):
+        assert [str(piece) for piece in interval.split(n)] == expected
+
+    def test_split_keeps_step(self):
+        pieces = list(IntInterval([0, 20], step=2).split(3))
+        assert [piece.step for piece in pieces] == [2, 2, 2]
+
+    def test_split_discrete_values(self):
+        interval = DateInterval([date(2000, 1, 1), date(2000, 3, 1)])
+        pieces = list(interval.split(7))
+        assert len(pieces) == 7
+        assert covered_values(pieces) == list(interval)
+        assert max(map(len, pieces)) - min(map(len, pieces)) <= 1
+
+    @mark.parametrize('interval', (
+        FloatInterval.closed_open(0, 10),
+        DecimalInterval.open(Decimal(0), Decimal(1)),
+        DateTimeInterval([datetime(2000, 1, 1), datetime(2000, 1, 2)]),
+    ))
+    def test_split_continuous(self, interval):
+        pieces = list(interval.split(3))
+        assert len(pieces) == 3
+        assert_covers(interval, pieces)
+
+    def test_split_skips_empty_pieces(self):
+        interval = DateTimeInterval([
+            datetime(2000, 1, 1),
+            datetime(2000, 1, 1, 0, 0, 0, 2)
+        ])
+        pieces = list(interval.split(5))
+        assert len(pieces) == 2
+        assert_covers(interval, pieces)
+
+    @mark.parametrize('n', (0, -1))
+    def test_non_positive_number_of_pieces(self, n):
+        with raises(ValueError):
+            IntInterval([1, 10]).split(n)
+
+    @mark.parametrize('interval', (
+        IntInterval.at_least(1),
+        IntInterval.at_most(1),
+        FloatInterval.at_least(1),
+        FloatInterval.at_most(1),
+    ))
+    def test_unbounded_intervals(self, interval):
+        with raises(TypeError):
+            interval.split(2)
+
+    def test_split_characters(self):
+        with raises(TypeError):
+            list(CharacterInterval(['a', 'c']).split(2))
+
+
+class TestChunks(object):
+    @mark.parametrize(('interval', 'size', 'expected'), (
+        (IntInterval([1, 25]), 10, ['[1, 10]', '[11, 20]', '[21, 25]']),
+        (IntInterval((0, 10)), 3, ['[1, 3]', '[4, 6]', '[7, 9]']),
+        (IntInterval([0, 20], step=5), 10, ['[0, 5]', '[10, 15]', '[20, 20]']),
+        (IntInterval([0, 20], step=5), 7, [
+            '[0, 5]', '[10, 10]', '[15, 20]'
+        ]),
+        (IntInterval([1, 2]), 3, ['[1, 2]']),
+        (IntInterval.open(1, 2), 3, []),
+        (FloatInterval([0, 10]), 5, ['[0.0, 5.0)', '[5.0, 10.0]']),
+        (FloatInterval((0, 10)), 3, [
+            '(0.0, 3.0)', '[3.0, 6.0)', '[6.0, 9.0)', '[9.0, 10.0)'
+        ]),
+        (FloatInterval([1, 1]), 3, ['[1.0, 1.0]']),
+    ))
+    def test_chunks(self, interval, size, expected):
+        assert [str(piece) for piece in interval.chunks(size)] == expected
+
+    def test_date_chunks(self):
+        interval = DateInterval([date(2000, 1, 1), date(2000, 1, 10)])
+        assert [str(p) for p in interval.chunks(timedelta(days=4))] == [
+            '[2000-01-01, 2000-01-04]',
+            '[2000-01-05, 2000-01-08]',
+            '[2000-01-09, 2000-01-10]',
+        ]
+
+    def test_datetime_chunks(self):
+        interval = DateTimeInterval.closed_open(
+            datetime(2000, 1, 1, 9, 30),
+            datetime(2000, 1, 1, 12, 45)
+        )
+        pieces = list(interval.chunks(timedelta(hours=1)))
+        assert [piece.lower.hour for piece in pieces] == [9, 10, 11, 12]
+        assert_covers(interval, pieces)
+
+    def test_chunks_near_maximum_date(self):
+        interval = DateInterval([date(9999, 12, 20), date(9999, 12, 31)])
+        assert covered_values(interval.chunks(timedelta(days=7))) == (
+            list(interval)
+        )
+
+    def test_chunks_near_maximum_datetime(self):
+        interval = DateTimeInterval([datetime(9999, 12, 31), datetime.max])
+        pieces = list(interval.chunks(timedelta(hours=10)))
+        assert len(pieces) == 3
+        assert_covers(interval, pieces)
+
+    def test_unbounded_upper_bound(self):
+        pieces = islice(IntInterval.at_least(3).chunks(10), 3)
+        assert [str(piece) for piece in pieces] == [
+            '[3, 12]', '[13, 22]', '[23, 32]'
+        ]
+
+    @mark.parametrize('interval', (
+        IntInterval.at_most(1),
+        FloatInterval.at_most(1),
+    ))
+    def test_unbounded_lower_bound(self, interval):
+        with raises(TypeError):
+            interval.chunks(1)
+
+    @mark.parametrize('size', (0, -1))
+    def test_non_positive_size(self, size):
+        with raises(ValueError):
+            IntInterval([1, 10]).chunks(size)
+
+    def test_non_positive_timedelta(self):
+        interval = DateInterval([date(2000, 1, 1), date(2000, 1, 10)])
+        with raises(ValueError):
+            interval.chunks(timedelta(0))
+
+
+class TestAlign(object):
+    @mark.parametrize(('interval', 'size', 'origin', 'expected'), (
+        (IntInterval([3, 21]), 10, 0, ['[3, 9]', '[10, 19]', '[20, 21]']),
+        (IntInterval([-7, 7]), 5, 0, [
+            '[-7, -6]', '[-5, -1]', '[0, 4]', '[5, 7]'
+        ]),
+        (IntInterval([3, 21]), 10, 3, ['[3, 12]', '[13, 21]']),
+        (IntInterval([3, 21]), 10, 1000, ['[3, 9]', '[10, 19]', '[20, 21]']),
+        (FloatInterval([0, 10]), 5, 0, [
+            '[0.0, 5.0)', '[5.0, 10.0)', '[10.0, 10.0]'
+        ]),
+        (
+            FloatInterval.closed_open(0, 10),
+            5,
+            0,
+            ['[0.0, 5.0)', '[5.0, 10.0)']
+        ),
+        (FloatInterval((1, 9)), 5, 0, ['(1.0, 5.0)', '[5.0, 9.0)']),
+        (
+            DecimalInterval.closed_open(Decimal(-3), Decimal(4)),
+            Decimal(2),
+            Decimal(0),
+            ['[-3, -2)', '[-2, 0)', '[0, 2)', '[2, 4)']
+        ),
+    ))
+    def test_align(self, interval, size, origin, expected):
+        pieces = interval.align(size, origin)
+        assert [str(piece) for piece in pieces] == expected
+
+    def test_align_dates_to_weeks(self):
+        interval = DateInterval([date(2000, 1, 1), date(2000, 1, 10)])
+        pieces = interval.align(timedelta(days=7), date(1999, 12, 27))
+        assert [str(piece) for piece in pieces] == [
+            '[2000-01-01, 2000-01-02]',
+            '[2000-01-03, 2000-01-09]',
+            '[2000-01-10, 2000-01-10]',
+        ]
+
+    def test_align_datetimes_to_hours(self):
+        interval = DateTimeInterval.closed_open(
+            datetime(2000, 1, 1, 9, 30),
+            datetime(2000, 1, 1, 12, 15)
+        )
+        pieces = list(interval.align(timedelta(hours=1), datetime(2000, 1, 1)))
+        assert [(p.lower.hour, p.lower.minute) for p in pieces] == [
+            (9, 30), (10, 0), (11, 0), (12, 0)
+        ]
+        assert_covers(interval, pieces)
+
+    def test_align_keeps_values(self):
+        interval = IntInterval([0, 100], step=3)
+        pieces = list(interval.align(10, 5))
+        assert covered_values(pieces) == list(interval)
+        for piece in pieces:
+            assert (piece.lower - 5) // 10 == (piece.upper - 5) // 10
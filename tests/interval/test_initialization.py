@@ -1,16 +1,24 @@
-from datetime import date
+import pickle
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
+from fractions import Fraction
 
 from infinity import inf
-from pytest import mark, raises
+from pytest import fixture, mark, raises
 
 from intervals import (
     CharacterInterval,
+    DateInterval,
+    DateTimeInterval,
     DecimalInterval,
+    encoding,
     FloatInterval,
     IllegalArgument,
     Interval,
+    IntervalException,
+    IntervalFactory,
     IntInterval,
+    NumberInterval,
     RangeBoundsException
 )
 
@@ -187,6 +195,166 @@ class TestIntervalInit(object):
             constructor(number_range)
 
 
+class TestFromBounds(object):
+    def test_assigns_bounds(self):
+        interval = IntInterval.from_bounds(1, 5, upper_inc=False)
+        assert interval.lower == 1
+        assert interval.upper == 5
+        assert interval.lower_inc
+        assert not interval.upper_inc
+        assert interval.step == 1
+
+    def test_step(self):
+        interval = IntInterval.from_bounds(0, 6, step=3)
+        assert interval.step == 3
+
+    def test_equals_constructed_interval(self):
+        assert (
+            FloatInterval.from_bounds(-inf, 2.5, False, True) ==
+            FloatInterval.at_most(2.5)
+        )
+
+    def test_invalid_argument(self):
+        with raises(IllegalArgument):
+            FloatInterval.from_bounds(1.0, 1.0, False, False)
+
+
+class TestIsoStrings(object):
+    @mark.parametrize(('string', 'expected'), (
+        (
+            '[2000-01-01, 2000-02-01)',
+            DateInterval.closed_open(date(2000, 1, 1), date(2000, 2, 1))
+        ),
+        (
+            '2000-01-01 - 2000-01-31',
+            DateInterval([date(2000, 1, 1), date(2000, 1, 31)])
+        ),
+        ('2000-02-29', DateInterval([date(2000, 2, 29), date(2000, 2, 29)])),
+        ('(,2000-01-01]', DateInterval.at_most(date(2000, 1, 1))),
+    ))
+    def test_dates(self, string, expected):
+        assert DateInterval.from_string(string).equals(expected)
+
+    @mark.parametrize(('string', 'expected'), (
+        (
+            '[2000-01-01T10:00, 2000-01-01 12:30:15.250000)',
+            DateTimeInterval.closed_open(
+                datetime(2000, 1, 1, 10),
+                datetime(2000, 1, 1, 12, 30, 15, 250000)
+            )
+        ),
+        (
+            '2000-01-01 10:00 - 2000-01-01 12:00',
+            DateTimeInterval([
+                datetime(2000, 1, 1, 10),
+                datetime(2000, 1, 1, 12)
+            ])
+        ),
+        (
+            '[2000-01-01, 2000-01-02]',
+            DateTimeInterval([datetime(2000, 1, 1), datetime(2000, 1, 2)])
+        ),
+    ))
+    def test_datetimes(self, string, expected):
+        assert DateTimeInterval.from_string(string).equals(expected)
+
+    def test_timezone_aware_datetimes(self):
+        tz = timezone(timedelta(hours=2))
+        interval = DateTimeInterval.from_string(
+            '[2000-01-01T10:00+02:00, 2000-01-01T12:00+02:00]'
+        )
+        assert interval.lower == datetime(2000, 1, 1, 10, tzinfo=tz)
+
+    def test_timezone_aware_datetimes_without_fromisoformat(
+        self,
+        monkeypatch
+    ):
+        monkeypatch.setattr(
+            encoding,
+            'parse_datetime',
+            encoding._parse_datetime
+        )
+        interval = DateTimeInterval.from_string(
+            '[2000-01-01T10:00+02:00, 2000-01-01T12:00Z]'
+        )
+        assert interval.lower == datetime(
+            2000, 1, 1, 10, tzinfo=timezone(timedelta(hours=2))
+        )
+        assert interval.upper.tzinfo == timezone.utc
+
+    @mark.parametrize('string', (
+        '[2000-13-01, 2000-12-31]',
+        '[2000-02-30, 2000-03-01]',
+        '[yesterday, today]',
+    ))
+    def test_invalid_dates(self, string):
+        with raises(ValueError):
+            DateInterval.from_string(string)
+
+
+class TestSlots(object):
+    @mark.parametrize('interval', (
+        IntInterval([1, 2]),
+        FloatInterval([1, 2]),
+        DecimalInterval([1, 2]),
+        DateInterval([date(2000, 1, 1), date(2000, 1, 2)]),
+        DateTimeInterval([datetime(2000, 1, 1), datetime(2000, 1, 2)]),
+        CharacterInterval(['a', 'b']),
+    ))
+    def test_intervals_have_no_dict(self, interval):
+        assert not hasattr(interval, '__dict__')
+
+    def test_class_step(self):
+        assert IntInterval.step == 1
+        assert FloatInterval.step is None
+        assert DateInterval.step == timedelta(days=1)
+
+    def test_instance_step_does_not_change_class_step(self):
+        interval = IntInterval([0, 4], step=2)
+        assert interval.step == 2
+        assert IntInterval([0, 4]).step == 1
+        assert IntInterval.step == 1
+
+    def test_step_can_not_be_assigned(self):
+        interval = IntInterval([0, 4])
+        with raises(AttributeError):
+            interval.step = 2
+
+    def test_subclass_with_class_level_step(self):
+        class EvenInterval(IntInterval):
+            step = 2
+
+        assert EvenInterval.step == 2
+        assert EvenInterval([1, 5]).step == 2
+        assert EvenInterval([1, 5]).upper == 6
+        assert EvenInterval([1, 5], step=4).step == 4
+
+
+class TestPickling(object):
+    @mark.parametrize('interval', (
+        IntInterval([1, 2]),
+        IntInterval([0, 4], step=2),
+        IntInterval.at_least(3),
+        FloatInterval.open_closed(1.5, 2),
+        DecimalInterval([Decimal('1.5'), Decimal('2')]),
+        DateInterval([date(2000, 1, 1), date(2000, 1, 2)]),
+        DateTimeInterval([datetime(2000, 1, 1), datetime(2000, 1, 2)]),
+        CharacterInterval(['a', 'b']),
+    ))
+    def test_round_trip(self, interval):
+        loaded = pickle.loads(pickle.dumps(interval))
+        assert type(loaded) is type(interval)
+        assert loaded.lower == interval.lower
+        assert loaded.upper == interval.upper
+        assert loaded.step == interval.step
+        assert loaded.lower_inc == interval.lower_inc
+        assert loaded.upper_inc == interval.upper_inc
+
+    def test_does_not_pickle_parser(self):
+        data = pickle.dumps(IntInterval([1, 2]))
+        assert b'parser' not in data.lower()
+
+
 class TestTypeGuessing(object):
     @mark.parametrize(
         ('number_range', 'type'),
@@ -202,3 +370,114 @@ class TestTypeGuessing(object):
     )
     def test_guesses_types(self, number_range, type):
         assert Interval(number_range).type == type
+
+    @mark.parametrize(
+        ('number_range', 'type'),
+        (
+            ([1, 2.5], float),
+            ([datetime(2000, 1, 1), inf], datetime),
+            ((-inf, Decimal('1.5')), float),
+            (IntInterval([1, 2]), int),
+            (True, int),
+        )
+    )
+    def test_guesses_types_of_mixed_and_special_bounds(
+        self,
+        number_range,
+        type
+    ):
+        assert Interval(number_range).type == type
+
+    def test_does_not_try_other_classes_for_registered_types(
+        self,
+        monkeypatch
+    ):
+        def fail(*args, **kwargs):
+            raise AssertionError('Unexpected interval class tried.')
+
+        monkeypatch.setattr(CharacterInterval, '__init__', fail)
+        assert Interval([date(2000, 1, 1), date(2000, 1, 2)]).type == date
+
+    @mark.parametrize(
+        ('string', 'interval_class'),
+        (
+            ('[1, 4]', CharacterInterval),
+            ('(1, 4.5]', CharacterInterval),
+            ('[a, e]', CharacterInterval),
+            ('(,)', CharacterInterval),
+            ('[2000-01-01, 2000-02-01)', CharacterInterval),
+        )
+    )
+    def test_from_string(self, string, interval_class):
+        assert type(Interval.from_string(string)) is interval_class
+
+    @mark.parametrize('bounds', (
+        [1, 4],
+        [1.5, 4],
+        [Decimal('1.5'), 4],
+        [Decimal(1), Decimal(3)],
+        [Decimal('1.5'), Decimal('2.5')],
+        ['a', 'c'],
+        [date(2000, 1, 1), date(2000, 2, 1)],
+        [datetime(2000, 1, 1), datetime(2000, 1, 2)],
+        [1, None],
+        [None, None],
+        [-inf, inf],
+        [True, 3],
+        [Fraction(1, 2), Fraction(3, 2)],
+        [1.0, 2.0],
+        IntInterval([1, 3]),
+        3,
+    ))
+    def test_matches_cascade(self, bounds):
+        for interval_class in IntervalFactory.interval_classes:
+            try:
+                expected = interval_class(bounds)
+                break
+            except (IntervalException, TypeError):
+                pass
+        interval = Interval(bounds)
+        assert type(interval) is type(expected)
+        assert interval.equals(expected)
+
+    def test_invalid_bounds(self):
+        with raises(IntervalException):
+            Interval(object())
+
+
+class TestIntervalFactoryRegistry(object):
+    @fixture(autouse=True)
+    def registry(self, monkeypatch):
+        monkeypatch.setattr(
+            IntervalFactory,
+            'type_registry',
+            dict(IntervalFactory.type_registry)
+        )
+        monkeypatch.setattr(
+            IntervalFactory,
+            'interval_classes',
+            list(IntervalFactory.interval_classes)
+        )
+
+    def test_register_interval_class(self):
+        class FractionInterval(NumberInterval):
+            type = Fraction
+
+        assert IntervalFactory.register(FractionInterval) is FractionInterval
+        interval = Interval([Fraction(1, 3), Fraction(1, 2)])
+        assert type(interval) is FractionInterval
+        assert FractionInterval in IntervalFactory.interval_classes
+
+    def test_registered_classes_take_precedence(self):
+        class EvenInterval(IntInterval):
+            step = 2
+
+        IntervalFactory.register(EvenInterval)
+        assert type(Interval([1, 4])) is EvenInterval
+        assert IntervalFactory.lookup(int) == [EvenInterval, IntInterval]
+
+    def test_lookup_subclass_of_registered_type(self):
+        class MyDate(date):
+            pass
+
+        assert IntervalFactory.lookup(MyDate) == [DateInterval]
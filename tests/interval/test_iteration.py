@@ -0,0 +1,208 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from itertools import islice
+
+from pytest import mark, raises
+
+from intervals import (
+    DateInterval,
+    DateTimeInterval,
+    DecimalInterval,
+    DiscreteRange,
+    FloatInterval,
+    IntInterval
+)
+
+
+class TestIteration(object):
+    @mark.parametrize(('interval', 'expected'), (
+        (IntInterval([1, 4]), [1, 2, 3, 4]),
+        (IntInterval.open(1, 4), [2, 3]),
+        (IntInterval.open(1, 2), []),
+        (IntInterval.closed_open(1, 1), []),
+        (IntInterval([3, 3]), [3]),
+        (IntInterval([-5, -3]), [-5, -4, -3]),
+        (IntInterval([0, 10], step=5), [0, 5, 10]),
+        (IntInterval.open(0, 10, step=5), [5]),
+        (FloatInterval([0, 1], step=0.5), [0.0, 0.5, 1.0]),
+        (
+            DecimalInterval([Decimal(0), Decimal(1)], step=Decimal('0.5')),
+            [Decimal(0), Decimal('0.5'), Decimal(1)]
+        ),
+        (
+            DateInterval.closed_open(date(2000, 2, 28), date(2000, 3, 2)),
+            [date(2000, 2, 28), date(2000, 2, 29), date(2000, 3, 1)]
+        ),
+    ))
+    def test_iter(self, interval, expected):
+        assert list(interval) == expected
+        assert list(reversed(interval)) == expected[::-1]
+        assert len(interval) == len(expected)
+
+    def test_iterates_lazily(self):
+        interval = IntInterval([0, 10 ** 18])
+        assert list(islice(interval, 3)) == [0, 1, 2]
+        assert len(interval) == 10 ** 18 + 1
+
+    def test_iterates_large_date_ranges_lazily(self):
+        interval = DateInterval([date(1, 1, 1), date(9999, 12, 31)])
+        assert next(iter(interval)) == date(1, 1, 1)
+        assert next(reversed(interval)) == date(9999, 12, 31)
+        assert len(interval) == 3652059
+
+    def test_date_interval_with_step(self):
+        interval = DateInterval(
+            [date(2000, 1, 1), date(2000, 1, 20)],
+            step=timedelta(days=7)
+        )
+        assert list(interval) == [
+            date(2000, 1, 1), date(2000, 1, 8), date(2000, 1, 15)
+        ]
+        assert list(reversed(interval)) == [
+            date(2000, 1, 15), date(2000, 1, 8), date(2000, 1, 1)
+        ]
+        assert len(interval) == 3
+
+    def test_unbounded_upper(self):
+        interval = IntInterval.at_least(5)
+        assert list(islice(interval, 3)) == [5, 6, 7]
+        assert interval[10] == 15
+        with raises(TypeError):
+            len(interval)
+        with raises(TypeError):
+            reversed(interval)
+        with raises(TypeError):
+            interval[-1]
+
+    def test_unbounded_lower(self):
+        with raises(TypeError):
+            iter(IntInterval.at_most(5))
+
+    @mark.parametrize('interval', (
+        FloatInterval([1, 2]),
+        DateTimeInterval.all(),
+    ))
+    def test_continuous_intervals(self, interval):
+        with raises(TypeError):
+            iter(interval)
+        with raises(TypeError):
+            len(interval)
+        with raises(TypeError):
+            interval[0]
+
+    def test_truthiness_is_unchanged(self):
+        assert IntInterval.at_least(5)
+        assert FloatInterval([1, 2])
+        assert not IntInterval.open(1, 2)
+
+
+class TestIndexing(object):
+    @mark.parametrize(('index', 'expected'), (
+        (0, 1),
+        (3, 4),
+        (9, 10),
+        (-1, 10),
+        (-10, 1),
+    ))
+    def test_index(self, index, expected):
+        assert IntInterval([1, 10])[index] == expected
+
+    @mark.parametrize('index', (10, -11))
+    def test_index_out_of_range(self, index):
+        with raises(IndexError):
+            IntInterval([1, 10])[index]
+
+    def test_index_of_empty_interval(self):
+        with raises(IndexError):
+            IntInterval.open(1, 2)[0]
+
+    def test_date_index(self):
+        interval = DateInterval([date(2000, 1, 1), date(2000, 12, 31)])
+        assert interval[59] == date(2000, 2, 29)
+        assert interval[-1] == date(2000, 12, 31)
+
+    @mark.parametrize('index', (
+        slice(None),
+        slice(2, 5),
+        slice(2, 8, 2),
+        slice(None, None, 3),
+        slice(-3, None),
+        slice(5, 2),
+        slice(1, 100),
+    ))
+    def test_slice_matches_range(self, index):
+        interval = IntInterval([1, 10])
+        assert list(interval[index]) == list(range(1, 11)[index])
+        assert len(interval[index]) == len(range(1, 11)[index])
+
+    def test_slice_returns_interval(self):
+        assert IntInterval([1, 10])[2:5] == IntInterval([3, 5])
+
+    def test_date_slice(self):
+        interval = DateInterval([date(2000, 1, 1), date(2000, 12, 31)])
+        assert list(interval[::100]) == [
+            date(2000, 1, 1), date(2000, 4, 10), date(2000, 7, 19),
+            date(2000, 10, 27)
+        ]
+
+    @mark.parametrize(('index', 'last'), (
+        (slice(1, 100), 9),
+        (slice(None, 5), 4),
+    ))
+    def test_slice_ends_at_last_member(self, index, last):
+        sliced = IntInterval.closed_open(0, 10)[index]
+        assert sliced.upper == last
+        assert sliced.upper_inc
+        for value in range(last + 1, 15):
+            assert value not in sliced
+
+    def test_empty_slice(self):
+        sliced = IntInterval([1, 10])[5:2]
+        assert sliced.empty
+        assert 6 not in sliced
+
+    def test_slice_equals_constructed_interval(self):
+        sliced = IntInterval([1, 10], step=2)[1:3]
+        assert sliced == IntInterval([4, 6], step=2)
+        assert list(sliced) == [4, 6]
+
+    @mark.parametrize('index', (
+        slice(None, None, 3),
+        slice(2, 8, 2),
+        slice(1, 100, 4),
+        slice(5, 2, 2),
+    ))
+    def test_strided_slice(self, index):
+        values = range(0, 10)[index]
+        sliced = IntInterval.closed_open(0, 10)[index]
+        assert isinstance(sliced, DiscreteRange)
+        assert sliced == DiscreteRange(values.start, len(values), values.step)
+        assert len(sliced) == len(values) == len(list(sliced))
+        assert list(sliced) == list(values)
+        assert list(reversed(sliced)) == list(reversed(values))
+        for value in range(-2, 15):
+            assert (value in sliced) is (value in values)
+
+    def test_strided_slice_of_step_interval(self):
+        sliced = IntInterval([0, 20], step=2)[1::3]
+        assert list(sliced) == [2, 8, 14, 20]
+        assert 8 in sliced
+        assert 4 not in sliced
+
+    def test_strided_date_slice(self):
+        interval = DateInterval([date(2000, 1, 1), date(2000, 1, 31)])
+        sliced = interval[::7]
+        assert list(sliced)[-1] == date(2000, 1, 29)
+        assert len(sliced) == 5
+        assert date(2000, 1, 8) in sliced
+        assert date(2000, 1, 9) not in sliced
+        assert date(2000, 2, 5) not in sliced
+        assert 'a' not in sliced
+
+    def test_negative_slice_step(self):
+        with raises(ValueError):
+            IntInterval([1, 10])[::-1]
+
+    def test_invalid_index(self):
+        with raises(TypeError):
+            IntInterval([1, 10])['a']
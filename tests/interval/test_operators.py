@@ -102,6 +102,40 @@ class TestComparisonOperators(object):
     def test_contains_operator_for_non_inclusive_interval(self, value):
         assert value not in IntInterval((-1, 2))
 
+    @mark.parametrize(('interval', 'value', 'expected'), (
+        (IntInterval([1, 3]), 1, True),
+        (IntInterval([1, 3]), 3, True),
+        (IntInterval((1, 3)), 1, False),
+        (IntInterval((1, 3)), 3, False),
+        (IntInterval.at_least(1), 10 ** 20, True),
+        (FloatInterval.closed_open(0, 1), 0, True),
+        (FloatInterval.closed_open(0, 1), 0.999, True),
+        (FloatInterval.closed_open(0, 1), 1, False),
+        (
+            DateInterval([date(2000, 1, 1), date(2000, 1, 31)]),
+            date(2000, 1, 31),
+            True
+        ),
+        (
+            DateInterval((date(2000, 1, 1), date(2000, 1, 31))),
+            date(2000, 1, 31),
+            False
+        ),
+    ))
+    def test_contains_point(self, interval, value, expected):
+        assert interval.contains_point(value) is expected
+        assert (value in interval) is expected
+
+    def test_contains_scalar_does_not_construct_intervals(self, monkeypatch):
+        interval = IntInterval([1, 3])
+
+        def fail(*args, **kwargs):
+            raise AssertionError('Interval was constructed.')
+
+        monkeypatch.setattr(IntInterval, '__init__', fail)
+        assert 2 in interval
+        assert 4 not in interval
+
     @mark.parametrize(('interval1', 'interval2', 'expected'), (
         (IntInterval((0, 2)), IntInterval((0, 2)), True),
         (IntInterval([0, 2]), IntInterval([0, 2]), True),
@@ -137,6 +171,38 @@ class TestComparisonOperators(object):
     def test_hash_operator_with_collections(self, contains_check, expected):
         assert contains_check is expected
 
+    @mark.parametrize(('interval1', 'interval2'), (
+        ('[1, 3]', '[1, 4)'),
+        ('(1, 5]', '[2, 5]'),
+        ('(1, 6)', '[2, 5]'),
+        ('(, 3]', '(, 4)'),
+        ('(1,)', '[2,)'),
+    ))
+    def test_hash_of_equal_discrete_intervals(self, interval1, interval2):
+        interval1 = IntInterval.from_string(interval1)
+        interval2 = IntInterval.from_string(interval2)
+        assert interval1 == interval2
+        assert hash(interval1) == hash(interval2)
+        assert len({interval1, interval2}) == 1
+
+    @mark.parametrize(('interval1', 'interval2'), (
+        ('(,)', '(, 1]'),
+        ('[1, 3]', '[1, 3)'),
+        ('(1, 5]', '[1, 5]'),
+    ))
+    def test_hash_of_unequal_discrete_intervals(self, interval1, interval2):
+        interval1 = IntInterval.from_string(interval1)
+        interval2 = IntInterval.from_string(interval2)
+        assert interval1 != interval2
+        assert len({interval1, interval2}) == 2
+
+    def test_hash_is_cached(self):
+        interval = IntInterval([1, 3])
+        assert interval._hash is None
+        value = hash(interval)
+        assert interval._hash == value
+        assert hash(interval) == value
+
 
 class TestDiscreteRangeComparison(object):
     @mark.parametrize(('interval', 'interval2'), (
@@ -1,4 +1,7 @@
 from decimal import Decimal
+from fractions import Fraction
+
+from pytest import importorskip, mark, raises
 
 from intervals import DecimalInterval, FloatInterval, IntInterval
 
@@ -14,6 +17,40 @@ class TestStepWithIntegers(object):
         assert interval.lower == 0
         assert interval.upper == 6
 
+    def test_equality_keeps_step(self):
+        interval = IntInterval([4, 6], step=2)
+        assert interval == IntInterval([4, 6], step=2)
+        assert interval != IntInterval([4, 6])
+
+    @mark.parametrize(('value', 'step', 'expected'), (
+        (7, 1, 7),
+        (-7, 1, -7),
+        (5, 2, 6),
+        (-5, 2, -6),
+        (4, 3, 3),
+        (-4, 3, -3),
+        (2 ** 60 + 1, 1, 2 ** 60 + 1),
+        (2 ** 60 + 3, 2, 2 ** 60 + 4),
+    ))
+    def test_rounds_halfway_values_away_from_zero(self, value, step, expected):
+        interval = IntInterval([value, value], step=step)
+        assert interval.lower == expected
+        assert isinstance(interval.lower, int)
+
+    def test_coerces_bool_bounds_to_int(self):
+        interval = IntInterval([True, 5])
+        assert str(interval) == '[1, 5]'
+        assert type(interval.lower) is int
+
+    def test_fraction_bounds_are_not_kept(self):
+        with raises(TypeError):
+            IntInterval([Fraction(1, 2), 3])
+
+    def test_numpy_integer_bounds_are_not_kept(self):
+        np = importorskip('numpy')
+        with raises(TypeError):
+            IntInterval([np.int64(2), 5])
+
 
 class TestStepWithFloats(object):
     def test_floats_with_step(self):
@@ -49,3 +86,17 @@ class TestStepWithDecimals(object):
         )
         assert interval.lower == 0
         assert interval.upper == 1
+
+    @mark.parametrize(('value', 'step', 'expected'), (
+        (Decimal('0.25'), Decimal('0.5'), Decimal('0.5')),
+        (Decimal('-0.25'), Decimal('0.5'), Decimal('-0.5')),
+        (Decimal('1.005'), Decimal('0.01'), Decimal('1.01')),
+        (Decimal('12345678901234567.23'), Decimal('0.1'),
+         Decimal('12345678901234567.2')),
+        (Decimal('7.4'), 1, Decimal('7')),
+        (Decimal('0.3'), 0.2, Decimal('0.4')),
+    ))
+    def test_rounding_keeps_decimal_precision(self, value, step, expected):
+        interval = DecimalInterval([value, value], step=step)
+        assert interval.lower == expected
+        assert isinstance(interval.lower, Decimal)
@@ -0,0 +1,317 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+from infinity import inf
+from pytest import importorskip, mark, raises
+
+from intervals import array as array_module
+from intervals import (
+    DateInterval,
+    DateTimeInterval,
+    DecimalInterval,
+    FloatInterval,
+    IllegalArgument,
+    IntervalArray,
+    IntervalException,
+    IntInterval,
+    RangeBoundsException
+)
+
+np = importorskip('numpy')
+
+
+INTERVALS = {
+    IntInterval: [
+        IntInterval([1, 5]),
+        IntInterval.open(1, 5),
+        IntInterval.closed_open(4, 4),
+        IntInterval.at_least(3),
+        IntInterval.less_than(0),
+        IntInterval.all(),
+    ],
+    FloatInterval: [
+        FloatInterval([1.5, 5]),
+        FloatInterval.open_closed(-1, 2),
+        FloatInterval.greater_than(3),
+        FloatInterval.all(),
+    ],
+    DecimalInterval: [
+        DecimalInterval([Decimal('1.5'), Decimal('2.5')]),
+        DecimalInterval.at_most(Decimal('3')),
+    ],
+    DateInterval: [
+        DateInterval([date(2000, 1, 1), date(2000, 2, 1)]),
+        DateInterval.closed_open(date(1, 1, 1), date(9999, 12, 31)),
+        DateInterval.at_least(date(2020, 5, 1)),
+    ],
+    DateTimeInterval: [
+        DateTimeInterval([
+            datetime(2000, 1, 1, 12, 30, 15, 123456),
+            datetime(2000, 1, 2)
+        ]),
+        DateTimeInterval.less_than(datetime(2000, 1, 1)),
+    ],
+}
+
+
+def for_all_classes():
+    return mark.parametrize('interval_class', list(INTERVALS))
+
+
+class TestIntervalArrayConversion(object):
+    @for_all_classes()
+    def test_round_trip(self, interval_class):
+        intervals = INTERVALS[interval_class]
+        array = IntervalArray.from_intervals(intervals)
+        result = array.to_intervals()
+        assert len(array) == len(intervals)
+        for interval, expected in zip(result, intervals):
+            assert type(interval) is interval_class
+            assert interval.equals(expected)
+
+    def test_datetime_dtypes(self):
+        array = IntervalArray.from_intervals(INTERVALS[DateTimeInterval])
+        assert array.lower.dtype == np.dtype('datetime64[us]')
+        array = IntervalArray.from_intervals(INTERVALS[DateInterval])
+        assert array.lower.dtype == np.dtype('datetime64[D]')
+
+    @mark.parametrize('interval_class', (DateInterval, DateTimeInterval))
+    def test_encodes_like_numpy(self, interval_class):
+        intervals = INTERVALS[interval_class]
+        array = IntervalArray.from_intervals(intervals)
+        expected = np.array(
+            [interval.lower for interval in intervals[:1]],
+            dtype=array.lower.dtype
+        )
+        assert array.lower[:1].tolist() == expected.tolist()
+        assert array.upper[:1].tolist() == [intervals[0].upper]
+
+    def test_timezone_aware_datetimes(self):
+        interval = DateTimeInterval([
+            datetime(2000, 1, 1, tzinfo=timezone.utc),
+            datetime(2000, 1, 2, tzinfo=timezone.utc)
+        ])
+        with raises(ValueError):
+            IntervalArray.from_intervals([interval])
+
+    def test_empty_requires_interval_class(self):
+        with raises(TypeError):
+            IntervalArray.from_intervals([])
+        array = IntervalArray.from_intervals([], interval_class=IntInterval)
+        assert len(array) == 0
+
+    def test_getitem(self):
+        intervals = INTERVALS[IntInterval]
+        array = IntervalArray.from_intervals(intervals)
+        assert array[1].equals(intervals[1])
+        assert array[-1].equals(intervals[-1])
+        assert array[1:3].to_intervals() == intervals[1:3]
+        mask = np.array([True, False, False, False, False, True])
+        assert array[mask].to_intervals() == [intervals[0], intervals[-1]]
+
+    def test_largest_finite_integer_bounds(self):
+        intervals = [IntInterval([-2 ** 63 + 1, 2 ** 63 - 2])]
+        array = IntervalArray.from_intervals(intervals)
+        assert array.to_intervals() == intervals
+
+    @mark.parametrize('bounds', (
+        [-2 ** 63, 0],
+        [0, 2 ** 63 - 1],
+        [0, 2 ** 64],
+        [-2 ** 70, 0],
+    ))
+    def test_integer_bounds_out_of_range(self, bounds):
+        with raises(ValueError):
+            IntervalArray.from_intervals([IntInterval(bounds)])
+
+    @mark.parametrize('create', (
+        lambda: IntervalArray.from_intervals([IntInterval([1, 2])]),
+        lambda: IntervalArray.from_strings(['[1, 2]'], IntInterval),
+        lambda: IntervalArray([1], [2], interval_class=IntInterval),
+    ))
+    def test_requires_numpy(self, monkeypatch, create):
+        monkeypatch.setattr(array_module, 'np', None)
+        with raises(ImportError):
+            create()
+
+
+class TestIntervalArrayFromStrings(object):
+    @mark.parametrize(('interval_class', 'strings'), (
+        (DateInterval, [
+            '[2000-01-01, 2000-02-01)',
+            '2000-03-01 - 2000-03-31',
+            '(,2000-01-05]',
+            '[2000-01-01,)',
+            '2000-02-29',
+        ]),
+        (DateTimeInterval, [
+            '[2000-01-01T10:00, 2000-02-01 12:00:00.5)',
+            '(2000-01-01, 2000-01-01 00:00:01)',
+            '(,2000-01-05 10:00]',
+        ]),
+        (IntInterval, ['[1, 5)', '3 - 4', '(,0]']),
+        (FloatInterval, ['[1.5, 5)', '(,)']),
+    ))
+    def test_matches_from_string(self, interval_class, strings):
+        array = IntervalArray.from_strings(strings, interval_class)
+        expected = IntervalArray.from_intervals(
+            [interval_class.from_string(string) for string in strings]
+        )
+        assert array.lower.dtype == expected.lower.dtype
+        assert array.lower.tolist() == expected.lower.tolist()
+        assert array.upper.tolist() == expected.upper.tolist()
+        assert array.lower_inc.tolist() == expected.lower_inc.tolist()
+        assert array.upper_inc.tolist() == expected.upper_inc.tolist()
+
+    def test_empty(self):
+        array = IntervalArray.from_strings([], DateInterval)
+        assert len(array) == 0
+        assert array.lower.dtype == np.dtype('datetime64[D]')
+
+    @mark.parametrize(('interval_class', 'string', 'exception'), (
+        (DateInterval, '[2000-01-01T10:00, 2000-01-02]', ValueError),
+        (DateInterval, '[2000-01, 2000-01-02]', ValueError),
+        (DateInterval, '[NaT, 2000-01-02]', ValueError),
+        (DateInterval, '[2000-01-03, 2000-01-02]', RangeBoundsException),
+        (DateInterval, '(2000-01-03, 2000-01-03)', IllegalArgument),
+        (DateTimeInterval, '[NaT, 2000-01-02]', ValueError),
+        (DateTimeInterval, '[2000-01-01T10:00+02:00, 2000-01-02]', ValueError),
+        (
+            DateTimeInterval,
+            '[2000-01-01, 2000-01-02, 2000-01-03]',
+            IntervalException
+        ),
+    ))
+    def test_invalid_strings(self, interval_class, string, exception):
+        with raises(exception):
+            IntervalArray.from_strings([string], interval_class)
+
+    @mark.parametrize('interval_class', (DateInterval, DateTimeInterval))
+    @mark.parametrize('string', (
+        '[2000-01, 2000]',
+        '[2000, 2000-01-02]',
+        '[today, 2100-01-01]',
+        '[2000-01-01, now]',
+        '[2000-1-1, 2000-01-02]',
+        '[2000-01-01x, 2000-01-02]',
+    ))
+    def test_rejects_strings_the_scalar_parser_rejects(
+        self,
+        interval_class,
+        string
+    ):
+        with raises(ValueError):
+            interval_class.from_string(string)
+        with raises(ValueError):
+            IntervalArray.from_strings([string], interval_class)
+
+    @mark.parametrize('string', (
+        '[2000-01-01T10, 2000-01-02]',
+        '[2000-01-01T10:00:00.1234567, 2000-01-02]',
+        '[2000-01-01T10:00:00+0200, 2000-01-02]',
+        '[2000-01-01T1000, 2000-01-02]',
+    ))
+    def test_rejects_times_the_scalar_parser_rejects(self, string):
+        with raises(ValueError):
+            DateTimeInterval.from_string(string)
+        with raises(ValueError):
+            IntervalArray.from_strings([string], DateTimeInterval)
+
+
+class TestIntervalArrayOperations(object):
+    @for_all_classes()
+    def test_contains_interval(self, interval_class):
+        intervals = INTERVALS[interval_class]
+        array = IntervalArray.from_intervals(intervals)
+        for other in intervals:
+            expected = [other in interval for interval in intervals]
+            assert array.contains(other).tolist() == expected
+
+    @mark.parametrize('point', [-1, 0, 1, 3, 4, 5, 10])
+    def test_contains_point(self, point):
+        intervals = INTERVALS[IntInterval]
+        array = IntervalArray.from_intervals(intervals)
+        expected = [point in interval for interval in intervals]
+        result = array.contains(point)
+        assert result.dtype == np.dtype(bool)
+        assert result.tolist() == expected
+
+    def test_contains_points_array(self):
+        array = IntervalArray.from_intervals(
+            [FloatInterval([1, 2]), FloatInterval.open(1, 2)]
+        )
+        assert array.contains(np.array([1, 1.5])).tolist() == [True, True]
+
+    @for_all_classes()
+    def test_is_connected(self, interval_class):
+        intervals = INTERVALS[interval_class]
+        array = IntervalArray.from_intervals(intervals)
+        for other in intervals:
+            expected = [interval.is_connected(other) for interval in intervals]
+            result = array.is_connected(other)
+            assert result.dtype == np.dtype(bool)
+            assert result.tolist() == expected
+
+    def test_is_connected_with_interval_array(self):
+        intervals = INTERVALS[IntInterval]
+        array = IntervalArray.from_intervals(intervals)
+        other = IntervalArray.from_intervals(intervals[::-1])
+        expected = [
+            a.is_connected(b) for a, b in zip(intervals, intervals[::-1])
+        ]
+        assert array.is_connected(other).tolist() == expected
+
+    @for_all_classes()
+    def test_and(self, interval_class):
+        intervals = INTERVALS[interval_class]
+        array = IntervalArray.from_intervals(intervals)
+        for other in intervals:
+            mask = array.is_connected(other)
+            result = (array[mask] & other).to_intervals()
+            expected = [
+                interval & other
+                for interval in intervals if interval.is_connected(other)
+            ]
+            assert [str(i) for i in result] == [str(i) for i in expected]
+
+    def test_and_with_unconnected_intervals(self):
+        array = IntervalArray.from_intervals(INTERVALS[IntInterval])
+        with raises(IllegalArgument):
+            array & IntInterval([100, 200])
+
+    @mark.parametrize('interval_class', [IntInterval, FloatInterval])
+    def test_numeric_length(self, interval_class):
+        intervals = INTERVALS[interval_class]
+        array = IntervalArray.from_intervals(intervals)
+        length = array.length
+        assert length.dtype == array.lower.dtype
+        assert length.tolist() == [
+            np.iinfo(np.int64).max if i.length == inf and
+            interval_class is IntInterval else i.length
+            for i in intervals
+        ]
+
+    def test_date_length(self):
+        intervals = INTERVALS[DateInterval]
+        array = IntervalArray.from_intervals(intervals)
+        length = array.length
+        assert length[:2].tolist() == [i.length for i in intervals[:2]]
+        assert np.isnat(length[2])
+
+    @for_all_classes()
+    def test_empty(self, interval_class):
+        intervals = INTERVALS[interval_class]
+        array = IntervalArray.from_intervals(intervals)
+        assert array.empty.tolist() == [i.empty for i in intervals]
+
+    def test_centre(self):
+        intervals = INTERVALS[FloatInterval][:2]
+        array = IntervalArray.from_intervals(intervals)
+        assert array.centre.tolist() == [i.centre for i in intervals]
+        array = IntervalArray.from_intervals([IntInterval.at_least(1)])
+        assert array.centre.tolist() == [inf]
+
+    def test_datetime_centre(self):
+        array = IntervalArray.from_intervals(INTERVALS[DateTimeInterval])
+        with raises(TypeError):
+            array.centre
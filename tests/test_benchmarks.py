@@ -0,0 +1,96 @@
+import io
+import json
+
+from pytest import mark
+
+from benchmarks.__main__ import main
+from benchmarks.suite import collect, compare, dump, load, missing, report, run
+
+
+class TestCompare(object):
+    @mark.parametrize(('time', 'expected'), (
+        (1.0, []),
+        (1.19, []),
+        (1.2, []),
+        (1.25, [('a', 1.0, 1.25, 1.25)]),
+        (0.5, []),
+    ))
+    def test_threshold(self, time, expected):
+        assert compare({'a': time}, {'a': 1.0}, 0.2) == expected
+
+    def test_sorted_by_name(self):
+        results = {'b': 2.0, 'a': 3.0, 'c': 1.0}
+        baseline = {'a': 1.0, 'b': 1.0, 'c': 1.0}
+        assert [name for name, _, _, _ in compare(results, baseline, 0)] == [
+            'a', 'b'
+        ]
+
+    def test_skips_benchmarks_without_baseline(self):
+        assert compare({'a': 1.0, 'new': 5.0}, {'a': 1.0}, 0.2) == []
+
+
+class TestMissing(object):
+    def test_missing_from_results(self):
+        baseline = {'a': 1.0, 'b': 1.0, 'c': 1.0}
+        assert missing({'b': 1.0}, baseline) == ['a', 'c']
+
+    def test_new_benchmarks_are_not_missing(self):
+        assert missing({'a': 1.0, 'new': 1.0}, {'a': 1.0}) == []
+
+    def test_report_lists_missing(self):
+        out = io.StringIO()
+        report({'a': 1.0}, {'a': 1.0, 'gone': 2.0}, file=out)
+        line = out.getvalue().splitlines()[-1]
+        assert line.split() == ['gone', '2.000', '-', '-']
+
+
+class TestDumpAndLoad(object):
+    def test_round_trip(self):
+        results = {'IntInterval.construct': 1.5, 'mixed.Interval()': 0.25}
+        fp = io.StringIO()
+        dump(results, fp)
+        fp.seek(0)
+        assert load(fp) == results
+
+    def test_dump_records_python(self):
+        fp = io.StringIO()
+        dump({'a': 1.0}, fp)
+        data = json.loads(fp.getvalue())
+        assert set(data) == {'implementation', 'python', 'results'}
+
+
+class TestMain(object):
+    def run(self, tmpdir, baseline, *args):
+        path = str(tmpdir.join('baseline.json'))
+        with open(path, 'w') as fp:
+            dump(baseline, fp)
+        return main([
+            '-k', 'IntInterval.__eq__',
+            '--baseline', path,
+            '--number', '1',
+            '--repeat', '1',
+        ] + list(args))
+
+    def test_passes_against_slow_baseline(self, tmpdir, capsys):
+        assert self.run(tmpdir, {'IntInterval.__eq__': 1e6}) == 0
+
+    def test_fails_on_missing_benchmark(self, tmpdir, capsys):
+        baseline = {'IntInterval.__eq__': 1e6, 'IntInterval.__eq__ old': 1.0}
+        assert self.run(tmpdir, baseline) == 1
+        assert 'Missing: IntInterval.__eq__ old' in capsys.readouterr().err
+
+    def test_ignores_baseline_outside_pattern(self, tmpdir, capsys):
+        baseline = {'IntInterval.__eq__': 1e6, 'FloatInterval.__eq__': 1.0}
+        assert self.run(tmpdir, baseline) == 0
+
+
+class TestCollect(object):
+    def test_includes_benchmark_scripts(self):
+        names = [name for name, _, _, _ in collect('rounding.')]
+        assert names
+        assert all(name.startswith('rounding.') for name in names)
+
+    def test_memory_is_reported(self):
+        results = run('memory.IntInterval', number=1, repeat=1)
+        assert results
+        assert all(name.startswith('memory.') for name in results)
@@ -0,0 +1,102 @@
+from pytest import fixture, raises
+
+from intervals import FloatInterval, IntervalException, IntInterval, LRUCache
+
+
+class TestLRUCache(object):
+    def test_maxsize_must_be_positive(self):
+        with raises(ValueError):
+            LRUCache(maxsize=0)
+
+    def test_get_and_set(self):
+        cache = LRUCache()
+        assert cache.get('a') is None
+        assert cache.get('a', 1) == 1
+        cache.set('a', 2)
+        assert cache.get('a') == 2
+        assert len(cache) == 1
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert cache.get('c') == 3
+        assert cache.evictions == 1
+
+    def test_stats(self):
+        cache = LRUCache(maxsize=1)
+        cache.set('a', 1)
+        cache.get('a')
+        cache.get('b')
+        cache.set('b', 2)
+        assert cache.stats == {
+            'hits': 1,
+            'misses': 1,
+            'evictions': 1,
+            'size': 1,
+            'maxsize': 1
+        }
+
+    def test_clear(self):
+        cache = LRUCache()
+        cache.set('a', 1)
+        cache.get('a')
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.hits == 0
+
+
+class TestStringCache(object):
+    @fixture
+    def cache(self, monkeypatch):
+        cache = LRUCache(maxsize=2)
+        monkeypatch.setattr(IntInterval, 'string_cache', cache)
+        return cache
+
+    def test_disabled_by_default(self):
+        assert IntInterval.string_cache is None
+        assert (
+            IntInterval.from_string('[1, 2]') is not
+            IntInterval.from_string('[1, 2]')
+        )
+
+    def test_returns_cached_interval(self, cache):
+        interval = IntInterval.from_string('[1, 2]')
+        assert IntInterval.from_string('[1, 2]') is interval
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_keyed_by_keyword_arguments(self, cache):
+        interval = IntInterval.from_string('[1, 5]')
+        stepped = IntInterval.from_string('[1, 5]', step=2)
+        assert stepped is not interval
+        assert stepped.step == 2
+        assert IntInterval.from_string('[1, 5]', step=2) is stepped
+
+    def test_keyed_by_class(self, cache, monkeypatch):
+        monkeypatch.setattr(FloatInterval, 'string_cache', cache)
+        assert isinstance(IntInterval.from_string('[1, 2]'), IntInterval)
+        assert isinstance(FloatInterval.from_string('[1, 2]'), FloatInterval)
+
+    def test_configured_per_class(self, cache):
+        assert FloatInterval.string_cache is None
+        assert (
+            FloatInterval.from_string('[1, 2]') is not
+            FloatInterval.from_string('[1, 2]')
+        )
+
+    def test_failures_are_not_cached(self, cache):
+        with raises(IntervalException):
+            IntInterval.from_string('[1, 2, 3]')
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self, cache):
+        IntInterval.from_string('[1, 2]')
+        IntInterval.from_string('[2, 3]')
+        IntInterval.from_string('[3, 4]')
+        assert cache.evictions == 1
+        assert len(cache) == 2
@@ -0,0 +1,60 @@
+from datetime import date, timedelta
+
+from pytest import mark, raises
+
+from intervals import DiscreteRange
+
+
+class TestDiscreteRange(object):
+    @mark.parametrize(('discrete_range', 'values'), (
+        (DiscreteRange(3, 4, 2), range(3, 11, 2)),
+        (DiscreteRange(10, 3, -3), range(10, 1, -3)),
+        (DiscreteRange(3, 0, 2), range(3, 3, 2)),
+    ))
+    def test_matches_range(self, discrete_range, values):
+        assert list(discrete_range) == list(values)
+        assert list(reversed(discrete_range)) == list(reversed(values))
+        assert len(discrete_range) == len(values)
+        for value in range(-2, 14):
+            assert (value in discrete_range) is (value in values)
+
+    @mark.parametrize('index', (0, 2, -1, -4))
+    def test_index(self, index):
+        assert DiscreteRange(3, 4, 2)[index] == range(3, 11, 2)[index]
+
+    @mark.parametrize('index', (4, -5))
+    def test_index_out_of_range(self, index):
+        with raises(IndexError):
+            DiscreteRange(3, 4, 2)[index]
+
+    @mark.parametrize('index', (
+        slice(1, 3),
+        slice(None, None, 2),
+        slice(None, None, -1),
+        slice(5, 1),
+    ))
+    def test_slice(self, index):
+        values = range(3, 11, 2)[index]
+        assert DiscreteRange(3, 4, 2)[index] == DiscreteRange(
+            values.start, len(values), values.step
+        )
+
+    @mark.parametrize(('first', 'second', 'expected'), (
+        (DiscreteRange(3, 4, 2), DiscreteRange(3, 4, 2), True),
+        (DiscreteRange(3, 0, 2), DiscreteRange(5, 0, 1), True),
+        (DiscreteRange(3, 1, 2), DiscreteRange(3, 1, 5), True),
+        (DiscreteRange(3, 4, 2), DiscreteRange(3, 4, 1), False),
+        (DiscreteRange(3, 4, 2), DiscreteRange(3, 3, 2), False),
+    ))
+    def test_equality(self, first, second, expected):
+        assert (first == second) is expected
+        assert (first != second) is not expected
+        if expected:
+            assert hash(first) == hash(second)
+
+    def test_dates(self):
+        discrete_range = DiscreteRange(date(2000, 1, 1), 3, timedelta(days=7))
+        assert discrete_range[-1] == date(2000, 1, 15)
+        assert date(2000, 1, 8) in discrete_range
+        assert date(2000, 1, 9) not in discrete_range
+        assert 1 not in discrete_range
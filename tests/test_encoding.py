@@ -0,0 +1,149 @@
+from datetime import date, datetime, timedelta, timezone
+
+from pytest import mark, raises
+
+from intervals import (
+    DateInterval,
+    DateTimeInterval,
+    FloatInterval,
+    IntInterval
+)
+from intervals.encoding import (
+    _parse_date,
+    _parse_datetime,
+    date_codec,
+    datetime_codec
+)
+
+
+class TestDateCodec(object):
+    @mark.parametrize('value', (
+        date(1, 1, 1),
+        date(1970, 1, 1),
+        date(2000, 2, 29),
+        date(9999, 12, 31),
+    ))
+    def test_round_trip(self, value):
+        assert date_codec.decode(date_codec.encode(value)) == value
+
+    def test_encodes_ordinals(self):
+        assert date_codec.encode(date(1, 1, 1)) == 1
+        assert date_codec.encode(date(1970, 1, 1)) == date_codec.epoch
+
+    def test_preserves_order(self):
+        values = [date(2000, 1, 1) + timedelta(days=i) for i in range(-5, 5)]
+        assert sorted(values, key=date_codec.encode) == values
+
+
+class TestDateTimeCodec(object):
+    @mark.parametrize('value', (
+        datetime.min,
+        datetime(1969, 12, 31, 23, 59, 59, 999999),
+        datetime(1970, 1, 1),
+        datetime(2000, 1, 1, 12, 30, 15, 123456),
+        datetime.max,
+    ))
+    def test_round_trip(self, value):
+        assert datetime_codec.decode(datetime_codec.encode(value)) == value
+
+    def test_encodes_epoch_microseconds(self):
+        assert datetime_codec.encode(datetime(1970, 1, 1)) == 0
+        assert datetime_codec.encode(datetime(1970, 1, 1, 0, 0, 1)) == 10 ** 6
+        assert datetime_codec.encode(datetime(1969, 12, 31, 23, 59)) == (
+            -60 * 10 ** 6
+        )
+
+    def test_timezone_aware_datetimes(self):
+        tz = timezone(timedelta(hours=2))
+        value = datetime(2000, 1, 1, 12, tzinfo=tz)
+        encoded = datetime_codec.encode(value)
+        assert encoded == datetime_codec.encode(datetime(2000, 1, 1, 10))
+        assert encoded == datetime_codec.encode(value.astimezone(timezone.utc))
+        decoded = datetime_codec.decode(encoded, tz)
+        assert decoded == value
+        assert decoded.tzinfo is tz
+
+
+class TestParsing(object):
+    @mark.parametrize(('value', 'expected'), (
+        ('2000-01-01', date(2000, 1, 1)),
+        ('0001-01-01', date(1, 1, 1)),
+        ('9999-12-31', date(9999, 12, 31)),
+    ))
+    def test_parse_date(self, value, expected):
+        assert date_codec.parse(value) == expected
+        assert _parse_date(value) == expected
+
+    @mark.parametrize(('value', 'expected'), (
+        ('2000-01-01', datetime(2000, 1, 1)),
+        ('2000-01-01T10:20', datetime(2000, 1, 1, 10, 20)),
+        ('2000-01-01 10:20:30', datetime(2000, 1, 1, 10, 20, 30)),
+        ('2000-01-01T10:20:30.250', datetime(2000, 1, 1, 10, 20, 30, 250000)),
+        ('2000-01-01T10:20:30.000001', datetime(2000, 1, 1, 10, 20, 30, 1)),
+        ('2000-01-01T10:20:30.5', datetime(2000, 1, 1, 10, 20, 30, 500000)),
+        (
+            '2000-01-01T10:20Z',
+            datetime(2000, 1, 1, 10, 20, tzinfo=timezone.utc)
+        ),
+        (
+            '2000-01-01T10:20:30+02:00',
+            datetime(2000, 1, 1, 10, 20, 30, tzinfo=timezone(
+                timedelta(hours=2)
+            ))
+        ),
+        (
+            '2000-01-01 10:20:30.250-05:30',
+            datetime(2000, 1, 1, 10, 20, 30, 250000, tzinfo=timezone(
+                -timedelta(hours=5, minutes=30)
+            ))
+        ),
+    ))
+    def test_parse_datetime(self, value, expected):
+        for parse in (datetime_codec.parse, _parse_datetime):
+            parsed = parse(value)
+            assert parsed == expected
+            assert parsed.utcoffset() == expected.utcoffset()
+
+    @mark.parametrize('value', (
+        '2000-1-1',
+        '2000-02-30',
+        '20000101x',
+        '',
+        '20000101',
+        '2000-W01-1',
+        '2000-01-01\n',
+        '\u0662000-01-01',
+    ))
+    def test_invalid_dates(self, value):
+        with raises(ValueError):
+            _parse_date(value)
+        with raises(ValueError):
+            date_codec.parse(value)
+
+    @mark.parametrize('value', (
+        '2000-01-01T1:00',
+        '2000-01-01T25:00',
+        '2000-01-01T10',
+        '2000-01-01T1020',
+        '2000-01-01T10:20:30.1234567',
+        '2000-01-01T10:20:30,500',
+        '2000-01-01T10:20+0200',
+        '2000-01-01+02:00',
+        '2000-01-01T10:20:30+02:00:00',
+    ))
+    def test_invalid_datetimes(self, value):
+        with raises(ValueError):
+            _parse_datetime(value)
+        with raises(ValueError):
+            datetime_codec.parse(value)
+
+
+class TestIntervalCodecs(object):
+    @mark.parametrize(('interval_class', 'codec'), (
+        (DateInterval, date_codec),
+        (DateTimeInterval, datetime_codec),
+        (IntInterval, None),
+        (FloatInterval, None),
+    ))
+    def test_codec(self, interval_class, codec):
+        assert interval_class.codec is codec
@@ -0,0 +1,309 @@
+import random
+from datetime import date, datetime, timedelta
+
+from infinity import inf
+from pytest import mark, raises
+
+from intervals import (
+    DateInterval,
+    DateTimeInterval,
+    FloatInterval,
+    IntervalIndex,
+    IntInterval,
+    MutableIntervalIndex
+)
+
+from .helpers import random_intervals
+
+
+def as_ids(intervals):
+    return sorted(id(interval) for interval in intervals)
+
+
+class TestIntervalIndex(object):
+    def setup_method(self, method):
+        self.intervals = random_intervals(random.Random(0), 300)
+        self.index = IntervalIndex(self.intervals)
+
+    def test_len(self):
+        assert len(self.index) == 300
+        assert list(self.index) == self.intervals
+
+    def test_empty_index(self):
+        index = IntervalIndex()
+        assert index.containing(1) == []
+        assert index.overlapping(IntInterval([1, 2])) == []
+
+    @mark.parametrize('point', [-1, 0, 0.5, 10, 50, 55.5, 100, 110, 111])
+    def test_containing(self, point):
+        expected = [i for i in self.intervals if point in i]
+        assert as_ids(self.index.containing(point)) == as_ids(expected)
+
+    @mark.parametrize(('bounds', 'lower_inc', 'upper_inc'), (
+        ([10, 20], True, True),
+        ([10, 20], False, False),
+        ([10, 10], True, True),
+        ([0, 0], True, True),
+        ([-5, 0], False, False),
+        ([50, 60], True, False),
+        ([110, 120], False, True),
+        ([-inf, inf], False, False),
+    ))
+    def test_overlapping(self, bounds, lower_inc, upper_inc):
+        query = FloatInterval(
+            bounds,
+            lower_inc=lower_inc,
+            upper_inc=upper_inc
+        )
+        expected = [i for i in self.intervals if i.is_connected(query)]
+        assert as_ids(self.index.overlapping(query)) == as_ids(expected)
+
+    def test_inclusivity_follows_is_connected(self):
+        intervals = [
+            FloatInterval.closed_open(1, 3),
+            FloatInterval.open(3, 5),
+        ]
+        index = IntervalIndex(intervals)
+        assert as_ids(index.overlapping(FloatInterval([3, 5]))) == as_ids(
+            intervals
+        )
+        assert index.overlapping(FloatInterval.open(3, 4)) == [intervals[1]]
+        assert index.containing(3) == []
+
+    def test_unbounded_intervals(self):
+        intervals = [
+            IntInterval.all(),
+            IntInterval.at_least(5),
+            IntInterval.less_than(0),
+            IntInterval([1, 2]),
+        ]
+        index = IntervalIndex(intervals)
+        assert len(index.containing(10)) == 2
+        assert len(index.containing(-10)) == 2
+        assert len(index.containing(1)) == 2
+
+    def test_datetime_intervals(self):
+        start = datetime(2020, 1, 1)
+        intervals = [
+            DateTimeInterval.closed_open(
+                start + timedelta(hours=i),
+                start + timedelta(hours=i + 2)
+            )
+            for i in range(48)
+        ]
+        index = IntervalIndex(intervals)
+        result = index.containing(start + timedelta(hours=10))
+        assert as_ids(result) == as_ids(intervals[9:11])
+
+
+def as_entry(interval, payload):
+    return (
+        interval.lower,
+        interval.lower_inc,
+        interval.upper,
+        interval.upper_inc,
+        payload
+    )
+
+
+def tree_height(node):
+    if node is None:
+        return 0
+    left, right = tree_height(node.left), tree_height(node.right)
+    assert abs(left - right) <= 1
+    assert node.height == 1 + max(left, right)
+    return node.height
+
+
+class TestMutableIntervalIndex(object):
+    def setup_method(self, method):
+        self.intervals = random_intervals(random.Random(0), 300)
+        self.index = MutableIntervalIndex(
+            self.intervals,
+            range(len(self.intervals))
+        )
+
+    def test_len(self):
+        assert len(self.index) == 300
+
+    def test_iter_is_sorted(self):
+        intervals = [interval for interval, _ in self.index]
+        assert intervals == sorted(
+            self.intervals,
+            key=lambda i: (i.lower, not i.lower_inc, i.upper, i.upper_inc)
+        )
+
+    def test_empty_index(self):
+        index = MutableIntervalIndex()
+        assert len(index) == 0
+        assert list(index) == []
+        assert index.containing(1) == []
+        assert index.overlapping(IntInterval([1, 2])) == []
+
+    def test_default_payload(self):
+        index = MutableIntervalIndex([IntInterval([1, 2])])
+        assert index.containing(1) == [(IntInterval([1, 2]), None)]
+
+    @mark.parametrize('point', [-1, 0, 0.5, 10, 50, 55.5, 100, 110, 111])
+    def test_containing(self, point):
+        expected = [
+            index
+            for index, interval in enumerate(self.intervals)
+            if point in interval
+        ]
+        result = self.index.containing(point)
+        assert sorted(payload for _, payload in result) == expected
+
+    @mark.parametrize(('bounds', 'lower_inc', 'upper_inc'), (
+        ([10, 20], True, True),
+        ([10, 20], False, False),
+        ([10, 10], True, True),
+        ([0, 0], True, True),
+        ([-5, 0], False, False),
+        ([50, 60], True, False),
+        ([110, 120], False, True),
+        ([-inf, inf], False, False),
+    ))
+    def test_overlapping(self, bounds, lower_inc, upper_inc):
+        query = FloatInterval(
+            bounds,
+            lower_inc=lower_inc,
+            upper_inc=upper_inc
+        )
+        expected = [
+            index
+            for index, interval in enumerate(self.intervals)
+            if interval.is_connected(query)
+        ]
+        result = self.index.overlapping(query)
+        assert sorted(payload for _, payload in result) == expected
+
+    def test_stays_balanced(self):
+        index = MutableIntervalIndex()
+        for lower in range(1000):
+            index.add(IntInterval([lower, lower + 1]))
+        assert tree_height(index._root) <= 15
+        for lower in range(0, 1000, 2):
+            index.remove(IntInterval([lower, lower + 1]))
+        assert tree_height(index._root) <= 14
+        assert len(index) == 500
+
+    def test_mixed_updates_and_queries(self):
+        rnd = random.Random(1)
+        index = MutableIntervalIndex()
+        entries = []
+        for step in range(2000):
+            if entries and rnd.random() < 0.4:
+                interval, payload = entries.pop(rnd.randrange(len(entries)))
+                index.remove(interval, payload)
+            else:
+                interval = random_intervals(random.Random(step), 1)[0]
+                payload = rnd.randint(0, 3)
+                index.add(interval, payload)
+                entries.append((interval, payload))
+            if step % 50 == 0:
+                point = rnd.randint(0, 110)
+                expected = sorted(
+                    as_entry(interval, payload)
+                    for interval, payload in entries
+                    if point in interval
+                )
+                assert sorted(
+                    as_entry(interval, payload)
+                    for interval, payload in index.containing(point)
+                ) == expected
+        assert len(index) == len(entries)
+        tree_height(index._root)
+
+    def test_duplicates(self):
+        interval = IntInterval([1, 5])
+        index = MutableIntervalIndex(
+            [interval, interval, interval],
+            ['a', 'b', 'a']
+        )
+        assert [payload for _, payload in index.containing(3)] == [
+            'a', 'b', 'a'
+        ]
+        index.remove(IntInterval([1, 5]), 'a')
+        assert [payload for _, payload in index.containing(3)] == ['b', 'a']
+        index.remove(interval, 'a')
+        index.remove(interval, 'b')
+        assert len(index) == 0
+        assert index.containing(3) == []
+
+    @mark.parametrize(('interval', 'payload'), (
+        (IntInterval([1, 6]), 'a'),
+        (IntInterval([1, 5]), 'b'),
+        (IntInterval((1, 5)), 'a'),
+    ))
+    def test_remove_missing_interval(self, interval, payload):
+        index = MutableIntervalIndex([IntInterval([1, 5])], ['a'])
+        with raises(KeyError):
+            index.remove(interval, payload)
+        assert len(index) == 1
+
+    @mark.parametrize(('added', 'removed'), (
+        (IntInterval.closed_open(5, 12), IntInterval([5, 11])),
+        (IntInterval([5, 11]), IntInterval.open(4, 12)),
+        (IntInterval.open(4, 12), IntInterval.closed_open(5, 12)),
+        (IntInterval.at_least(3), IntInterval.greater_than(2)),
+        (
+            DateInterval([date.min, date(2000, 1, 1)]),
+            DateInterval.closed_open(date.min, date(2000, 1, 2))
+        ),
+    ))
+    def test_remove_equal_interval(self, added, removed):
+        index = MutableIntervalIndex([added], ['z'])
+        index.remove(removed, 'z')
+        assert len(index) == 0
+
+    def test_remove_many_entries_with_same_lower_bound(self):
+        index = MutableIntervalIndex()
+        for upper in range(1, 1001):
+            index.add(IntInterval([0, upper]), upper)
+        index.remove(IntInterval([0, 500]), 500)
+        assert len(index) == 999
+        assert (IntInterval([0, 500]), 500) not in list(index)
+
+    def test_inclusivity_follows_is_connected(self):
+        index = MutableIntervalIndex([
+            FloatInterval.closed_open(1, 3),
+            FloatInterval.open(3, 5),
+        ])
+        assert len(index.overlapping(FloatInterval([3, 5]))) == 2
+        assert index.overlapping(FloatInterval.open(3, 4)) == [
+            (FloatInterval.open(3, 5), None)
+        ]
+        assert index.containing(3) == []
+
+    def test_unbounded_intervals(self):
+        index = MutableIntervalIndex([
+            IntInterval.all(),
+            IntInterval.at_least(5),
+            IntInterval.less_than(0),
+            IntInterval([1, 2]),
+        ])
+        assert len(index.containing(10)) == 2
+        assert len(index.containing(-10)) == 2
+        assert len(index.containing(1)) == 2
+
+    def test_datetime_reservations(self):
+        start = datetime(2020, 1, 1)
+        index = MutableIntervalIndex()
+        for hour in range(48):
+            index.add(
+                DateTimeInterval.closed_open(
+                    start + timedelta(hours=hour),
+                    start + timedelta(hours=hour + 2)
+                ),
+                hour
+            )
+        index.remove(
+            DateTimeInterval.closed_open(
+                start + timedelta(hours=9),
+                start + timedelta(hours=11)
+            ),
+            9
+        )
+        result = index.containing(start + timedelta(hours=10))
+        assert [payload for _, payload in result] == [10]
@@ -0,0 +1,140 @@
+import os
+import subprocess
+import sys
+from decimal import Decimal
+
+from pytest import mark, raises
+
+from intervals import (
+    FloatInterval,
+    instrumentation,
+    Interval,
+    IntervalException,
+    IntervalFactory,
+    IntInterval,
+    parse_many
+)
+
+
+class TestInstrumentation(object):
+    def test_disabled_by_default(self):
+        assert not instrumentation.enabled
+        before = instrumentation.get_stats()
+        IntInterval([1, 2])
+        assert instrumentation.get_stats() == before
+
+    def test_counts_constructions(self):
+        with instrumentation.collect() as stats:
+            IntInterval([1, 2])
+            IntInterval([1, 3])
+            FloatInterval([1, 2])
+        assert stats['constructions'] == {
+            'IntInterval': 2,
+            'FloatInterval': 1
+        }
+        assert 'construction_time' not in stats
+
+    def test_times_constructions(self):
+        with instrumentation.collect(timing=True) as stats:
+            IntInterval([1, 2])
+        assert stats['constructions'] == {'IntInterval': 1}
+        assert stats['construction_time']['IntInterval'] > 0
+
+    def test_counts_trusted_constructions(self):
+        with instrumentation.collect() as stats:
+            IntInterval([1, 3]) & IntInterval([2, 4])
+        assert stats['trusted_constructions'] == {'IntInterval': 1}
+
+    def test_counts_coercions(self):
+        interval = IntInterval([1, 3])
+        with instrumentation.collect() as stats:
+            interval == IntInterval([1, 3])
+            interval == [1, 3]
+            interval == 2
+        assert stats['coercions'] == {'IntInterval': 2}
+
+    def test_counts_string_parses(self):
+        with instrumentation.collect() as stats:
+            IntInterval.from_string('[1, 3]')
+            list(parse_many(['1 - 3', '[2, 4)'], IntInterval))
+        assert stats['string_parses'] == 3
+
+    def test_counts_canonicalizations(self):
+        with instrumentation.collect() as stats:
+            interval = IntInterval([1, 3])
+            interval == IntInterval([1, 3])
+            interval == IntInterval([1, 3])
+        assert stats['canonicalizations'] == {'IntInterval': 3}
+
+    def test_counts_factory_fallbacks(self):
+        with instrumentation.collect() as stats:
+            Interval.from_string('[1.5, 3]')
+        assert 'factory_fallbacks' not in stats
+        with instrumentation.collect() as stats:
+            Interval([Decimal('1.5'), Decimal('2')])
+        assert stats['factory_fallbacks'] == {'IntInterval': 1}
+
+    def test_factory_tries_each_class_once(self):
+        with instrumentation.collect() as stats:
+            with raises(IntervalException):
+                Interval([3, 1])
+        assert stats['factory_fallbacks'] == {
+            interval_class.__name__: 1
+            for interval_class in IntervalFactory.interval_classes
+        }
+        with instrumentation.collect() as stats:
+            with raises(IntervalException):
+                Interval([Decimal(3), Decimal(1)])
+        assert stats['factory_fallbacks'] == {
+            interval_class.__name__: 1
+            for interval_class in IntervalFactory.interval_classes
+        }
+
+    def test_collect_restores_previous_state(self):
+        with instrumentation.collect():
+            assert instrumentation.enabled
+        assert not instrumentation.enabled
+
+    def test_enable_and_disable(self):
+        instrumentation.enable()
+        try:
+            before = instrumentation.get_stats()
+            IntInterval([1, 2])
+            after = instrumentation.get_stats()
+        finally:
+            instrumentation.disable()
+        assert (
+            after['constructions']['IntInterval'] ==
+            before.get('constructions', {}).get('IntInterval', 0) + 1
+        )
+
+    def test_reset(self):
+        with instrumentation.collect():
+            IntInterval([1, 2])
+        instrumentation.reset()
+        assert instrumentation.get_stats() == {}
+
+    def test_stats_are_a_plain_dict(self):
+        with instrumentation.collect() as stats:
+            IntInterval([1, 2])
+        stats['constructions']['IntInterval'] = 0
+        assert instrumentation.get_stats()['constructions']['IntInterval']
+
+    @mark.parametrize(('setting', 'expected'), (
+        ('1', 'True False'),
+        ('timing', 'True True'),
+        ('0', 'False False'),
+    ))
+    def test_environment_variable(self, setting, expected):
+        env = dict(os.environ, INTERVALS_STATS=setting)
+        output = subprocess.check_output(
+            [
+                sys.executable,
+                '-c',
+                'from intervals import instrumentation as i; '
+                'print(i.enabled, i._timing)'
+            ],
+            env=env,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        )
+        assert output.decode().strip() == expected
@@ -0,0 +1,325 @@
+import random
+from datetime import date
+
+from infinity import inf
+from pytest import mark, raises
+
+from intervals import (
+    DateInterval,
+    FloatInterval,
+    IllegalArgument,
+    IntervalMap,
+    IntInterval
+)
+
+
+def assert_canonical(interval_map):
+    """
+    Assert that the entries of given map are sorted and disjoint, and that
+    connected entries have different values.
+    """
+    items = list(interval_map.items())
+    for (interval, value), (following, following_value) in zip(
+        items, items[1:]
+    ):
+        assert interval.upper <= following.lower
+        if interval.upper == following.lower:
+            assert not (interval.upper_inc and following.lower_inc)
+            if interval.upper_inc or following.lower_inc:
+                assert value != following_value
+
+
+class TestIntervalMap(object):
+    def test_empty(self):
+        interval_map = IntervalMap()
+        assert len(interval_map) == 0
+        assert not interval_map
+        assert list(interval_map) == []
+        assert interval_map.get(1) is None
+
+    def test_init_with_pairs(self):
+        interval_map = IntervalMap([
+            (IntInterval([1, 5]), 'a'),
+            (IntInterval([3, 8]), 'b'),
+        ])
+        assert list(interval_map.items()) == [
+            (IntInterval([1, 2]), 'a'),
+            (IntInterval([3, 8]), 'b'),
+        ]
+
+    def test_init_with_mapping(self):
+        interval_map = IntervalMap({IntInterval([1, 5]): 'a'})
+        assert interval_map[3] == 'a'
+
+    def test_init_with_bounds(self):
+        interval_map = IntervalMap(
+            [([1, 5], 'a')],
+            interval_class=IntInterval
+        )
+        assert list(interval_map) == [IntInterval([1, 5])]
+
+    def test_non_interval_items_without_class(self):
+        with raises(TypeError):
+            IntervalMap([([1, 5], 'a')])
+
+    def test_mixed_interval_classes(self):
+        interval_map = IntervalMap([(IntInterval([1, 5]), 'a')])
+        with raises(TypeError):
+            interval_map[FloatInterval([1, 5])] = 'b'
+
+    def test_repr(self):
+        interval_map = IntervalMap([(IntInterval([1, 5]), 'a')])
+        assert repr(interval_map) == (
+            "IntervalMap([(IntInterval('[1, 6)'), 'a')])"
+        )
+
+    def test_equality(self):
+        interval_map = IntervalMap([(IntInterval([1, 5]), 'a')])
+        assert interval_map == IntervalMap([
+            (IntInterval([1, 2]), 'a'),
+            (IntInterval([3, 5]), 'a'),
+        ])
+        assert interval_map != IntervalMap([(IntInterval([1, 5]), 'b')])
+        assert interval_map != IntervalMap([(FloatInterval([1, 5]), 'a')])
+
+
+class TestAssignment(object):
+    @mark.parametrize(('items', 'expected'), (
+        (
+            [(FloatInterval([0, 10]), 1), (FloatInterval([3, 5]), 2)],
+            [
+                (FloatInterval.closed_open(0, 3), 1),
+                (FloatInterval([3, 5]), 2),
+                (FloatInterval.open_closed(5, 10), 1),
+            ]
+        ),
+        (
+            [(FloatInterval([0, 10]), 1), (FloatInterval([3, 5]), 1)],
+            [(FloatInterval([0, 10]), 1)]
+        ),
+        (
+            [(FloatInterval([3, 5]), 1), (FloatInterval([0, 10]), 2)],
+            [(FloatInterval([0, 10]), 2)]
+        ),
+        (
+            [
+                (FloatInterval.closed_open(0, 3), 1),
+                (FloatInterval([3, 6]), 1),
+            ],
+            [(FloatInterval([0, 6]), 1)]
+        ),
+        (
+            [
+                (FloatInterval.closed_open(0, 3), 1),
+                (FloatInterval.open(3, 6), 1),
+            ],
+            [
+                (FloatInterval.closed_open(0, 3), 1),
+                (FloatInterval.open(3, 6), 1),
+            ]
+        ),
+        (
+            [(FloatInterval([0, 10]), 1), (FloatInterval([5, 5]), 2)],
+            [
+                (FloatInterval.closed_open(0, 5), 1),
+                (FloatInterval([5, 5]), 2),
+                (FloatInterval.open_closed(5, 10), 1),
+            ]
+        ),
+        (
+            [
+                (FloatInterval([0, 2]), 1),
+                (FloatInterval([4, 6]), 2),
+                (FloatInterval([8, 10]), 1),
+                (FloatInterval([1, 9]), 3),
+            ],
+            [
+                (FloatInterval.closed_open(0, 1), 1),
+                (FloatInterval([1, 9]), 3),
+                (FloatInterval.open_closed(9, 10), 1),
+            ]
+        ),
+        (
+            [
+                (FloatInterval([0, 2]), 1),
+                (FloatInterval([4, 6]), 1),
+                (FloatInterval.open(2, 4), 1),
+            ],
+            [(FloatInterval([0, 6]), 1)]
+        ),
+        (
+            [(IntInterval([1, 3]), 'a'), (IntInterval([4, 6]), 'a')],
+            [(IntInterval([1, 6]), 'a')]
+        ),
+        (
+            [(IntInterval([1, 3]), 'a'), (IntInterval([5, 6]), 'a')],
+            [(IntInterval([1, 3]), 'a'), (IntInterval([5, 6]), 'a')]
+        ),
+        (
+            [(IntInterval.all(), 'a'), (IntInterval([1, 3]), 'b')],
+            [
+                (IntInterval.at_most(0), 'a'),
+                (IntInterval([1, 3]), 'b'),
+                (IntInterval.at_least(4), 'a'),
+            ]
+        ),
+        (
+            [(IntInterval([1, 3]), 'a'), (IntInterval.open(1, 2), 'b')],
+            [(IntInterval([1, 3]), 'a')]
+        ),
+    ))
+    def test_assign(self, items, expected):
+        interval_map = IntervalMap(items)
+        assert list(interval_map.items()) == expected
+        assert_canonical(interval_map)
+
+    def test_discrete_step(self):
+        interval_map = IntervalMap([
+            (IntInterval([0, 4], step=2), 'a'),
+            (IntInterval([6, 8], step=2), 'a'),
+        ])
+        assert len(interval_map) == 1
+        interval, = interval_map
+        assert interval.step == 2
+        assert list(interval) == [0, 2, 4, 6, 8]
+
+    def test_mixed_steps(self):
+        interval_map = IntervalMap([(IntInterval([0, 4], step=2), 'a')])
+        with raises(IllegalArgument):
+            interval_map[IntInterval([6, 8])] = 'a'
+
+    def test_dates(self):
+        interval_map = IntervalMap([
+            (DateInterval([date(2000, 1, 1), date(2000, 1, 31)]), 10),
+            (DateInterval([date(2000, 2, 1), date(2000, 2, 29)]), 10),
+            (DateInterval([date(2000, 3, 1), date(2000, 3, 31)]), 12),
+        ])
+        assert len(interval_map) == 2
+        assert interval_map[date(2000, 2, 15)] == 10
+        assert interval_map[date(2000, 3, 31)] == 12
+
+    def test_matches_list_of_pairs(self):
+        rnd = random.Random(0)
+        interval_map = IntervalMap()
+        values = {}
+        for _ in range(500):
+            lower = rnd.randint(0, 100)
+            upper = lower + rnd.randint(0, 15)
+            value = rnd.randint(0, 3)
+            interval_map[IntInterval([lower, upper])] = value
+            for point in range(lower, upper + 1):
+                values[point] = value
+        assert_canonical(interval_map)
+        for point in range(-5, 120):
+            assert interval_map.get(point) == values.get(point)
+
+    def test_matches_continuous_assignments(self):
+        rnd = random.Random(1)
+        interval_map = IntervalMap()
+        assignments = []
+        for _ in range(300):
+            lower = rnd.randint(0, 50)
+            upper = lower + rnd.randint(0, 10)
+            interval = FloatInterval(
+                [lower, upper],
+                lower_inc=lower == upper or rnd.random() < 0.5,
+                upper_inc=lower == upper or rnd.random() < 0.5
+            )
+            value = rnd.randint(0, 2)
+            interval_map[interval] = value
+            assignments.append((interval, value))
+        assert_canonical(interval_map)
+        for point in [value / 2.0 for value in range(-2, 125)]:
+            expected = None
+            for interval, value in assignments:
+                if point in interval:
+                    expected = value
+            assert interval_map.get(point) == expected
+
+
+class TestDeletion(object):
+    def test_splits_entries(self):
+        interval_map = IntervalMap([(FloatInterval([0, 10]), 1)])
+        del interval_map[FloatInterval([3, 5])]
+        assert list(interval_map.items()) == [
+            (FloatInterval.closed_open(0, 3), 1),
+            (FloatInterval.open_closed(5, 10), 1),
+        ]
+
+    def test_removes_entries(self):
+        interval_map = IntervalMap([
+            (IntInterval([0, 2]), 1),
+            (IntInterval([3, 5]), 2),
+            (IntInterval([6, 8]), 1),
+        ])
+        del interval_map[IntInterval([1, 6])]
+        assert list(interval_map.items()) == [
+            (IntInterval([0, 0]), 1),
+            (IntInterval([7, 8]), 1),
+        ]
+
+    def test_missing_range(self):
+        interval_map = IntervalMap([(IntInterval([0, 2]), 1)])
+        del interval_map[IntInterval([5, 6])]
+        assert list(interval_map.items()) == [(IntInterval([0, 2]), 1)]
+
+
+class TestLookup(object):
+    def setup_method(self, method):
+        self.interval_map = IntervalMap([
+            (FloatInterval.closed_open(0, 10), 'a'),
+            (FloatInterval([10, 10]), 'b'),
+            (FloatInterval.open_closed(10, 20), 'c'),
+            (FloatInterval.at_least(30), 'd'),
+        ])
+
+    @mark.parametrize(('point', 'value'), (
+        (0, 'a'),
+        (9.5, 'a'),
+        (10, 'b'),
+        (10.5, 'c'),
+        (20, 'c'),
+        (30, 'd'),
+        (10 ** 9, 'd'),
+    ))
+    def test_getitem(self, point, value):
+        assert self.interval_map[point] == value
+        assert point in self.interval_map
+
+    @mark.parametrize('point', (-1, 25, -inf))
+    def test_missing_point(self, point):
+        with raises(KeyError):
+            self.interval_map[point]
+        assert point not in self.interval_map
+        assert self.interval_map.get(point, 'x') == 'x'
+
+    @mark.parametrize(('interval', 'expected'), (
+        (
+            FloatInterval([5, 15]),
+            [
+                (FloatInterval.closed_open(5, 10), 'a'),
+                (FloatInterval([10, 10]), 'b'),
+                (FloatInterval.open_closed(10, 15), 'c'),
+            ]
+        ),
+        (FloatInterval.open(10, 12), [(FloatInterval.open(10, 12), 'c')]),
+        (FloatInterval([10, 10]), [(FloatInterval([10, 10]), 'b')]),
+        (FloatInterval.open(20, 30), []),
+        (FloatInterval([20, 30]), [
+            (FloatInterval([20, 20]), 'c'),
+            (FloatInterval([30, 30]), 'd'),
+        ]),
+        (FloatInterval.at_least(25), [(FloatInterval.at_least(30), 'd')]),
+        (FloatInterval.closed_open(1, 1), []),
+    ))
+    def test_slice(self, interval, expected):
+        sliced = self.interval_map[interval]
+        assert isinstance(sliced, IntervalMap)
+        assert list(sliced.items()) == expected
+
+    def test_slice_keeps_original(self):
+        self.interval_map[FloatInterval([5, 15])][5] = 'x'
+        assert self.interval_map[5] == 'a'
+
+    def test_values(self):
+        assert list(self.interval_map.values()) == ['a', 'b', 'c', 'd']
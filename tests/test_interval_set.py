@@ -0,0 +1,239 @@
+from datetime import date
+
+from infinity import inf
+from pytest import mark, raises
+
+from intervals import (
+    DateInterval,
+    FloatInterval,
+    IllegalArgument,
+    IntervalSet,
+    IntInterval
+)
+
+
+class TestIntervalSetInitialization(object):
+    def test_empty(self):
+        interval_set = IntervalSet()
+        assert len(interval_set) == 0
+        assert not interval_set
+        assert list(interval_set) == []
+
+    def test_sorts_and_merges_overlapping_intervals(self):
+        interval_set = IntervalSet([
+            FloatInterval([10, 20]),
+            FloatInterval([1, 5]),
+            FloatInterval([4, 7]),
+        ])
+        assert list(interval_set) == [
+            FloatInterval([1, 7]),
+            FloatInterval([10, 20]),
+        ]
+
+    @mark.parametrize(('intervals', 'expected'), (
+        (
+            [FloatInterval.closed_open(1, 3), FloatInterval([3, 5])],
+            [FloatInterval([1, 5])]
+        ),
+        (
+            [FloatInterval([1, 3]), FloatInterval.open_closed(3, 5)],
+            [FloatInterval([1, 5])]
+        ),
+        (
+            [FloatInterval.closed_open(1, 3), FloatInterval.open(3, 5)],
+            [FloatInterval.closed_open(1, 3), FloatInterval.open(3, 5)]
+        ),
+    ))
+    def test_merges_connected_continuous_intervals(self, intervals, expected):
+        assert list(IntervalSet(intervals)) == expected
+
+    def test_merges_adjacent_discrete_intervals(self):
+        interval_set = IntervalSet([IntInterval([1, 3]), IntInterval([4, 6])])
+        assert list(interval_set) == [IntInterval([1, 6])]
+
+    def test_merges_adjacent_dates(self):
+        interval_set = IntervalSet([
+            DateInterval([date(2000, 1, 1), date(2000, 1, 31)]),
+            DateInterval([date(2000, 2, 1), date(2000, 2, 29)]),
+        ])
+        assert list(interval_set) == [
+            DateInterval([date(2000, 1, 1), date(2000, 2, 29)])
+        ]
+
+    def test_skips_empty_intervals(self):
+        interval_set = IntervalSet([
+            IntInterval.from_string('[2, 2)'),
+            IntInterval((2, 3)),
+        ])
+        assert len(interval_set) == 0
+
+    def test_non_interval_items_with_interval_class(self):
+        interval_set = IntervalSet(
+            [[1, 2], (5, 8)],
+            interval_class=IntInterval
+        )
+        assert list(interval_set) == [IntInterval([1, 2]), IntInterval([6, 7])]
+
+    def test_non_interval_items_without_interval_class(self):
+        with raises(TypeError):
+            IntervalSet([[1, 2]])
+
+    def test_mixed_interval_classes(self):
+        with raises(TypeError):
+            IntervalSet([IntInterval([1, 2]), FloatInterval([1, 2])])
+
+    def test_preserves_step(self):
+        interval_set = IntervalSet([IntInterval([0, 4], step=2)])
+        assert interval_set[0].step == 2
+
+    @mark.parametrize('intervals', (
+        [IntInterval([0, 4], step=2), IntInterval([6, 9], step=3)],
+        [IntInterval([0, 4], step=2), IntInterval([6, 9])],
+        [IntInterval([0, 4]), IntInterval([6, 8], step=2)],
+        [FloatInterval([0, 4]), FloatInterval([6, 8], step=0.5)],
+    ))
+    def test_mixed_steps(self, intervals):
+        with raises(IllegalArgument):
+            IntervalSet(intervals)
+
+    def test_step_other_than_given(self):
+        with raises(IllegalArgument):
+            IntervalSet([IntInterval([0, 4], step=2)], step=3)
+
+    def test_step_other_than_interval_class(self):
+        with raises(IllegalArgument):
+            IntervalSet(
+                [IntInterval([0, 4], step=2)],
+                interval_class=IntInterval
+            )
+
+    def test_combine_sets_with_mixed_steps(self):
+        interval_set = IntervalSet([IntInterval([0, 4], step=2)])
+        with raises(IllegalArgument):
+            interval_set | IntervalSet([IntInterval([6, 8])])
+
+
+class TestIntervalSetMembership(object):
+    @mark.parametrize(('value', 'expected'), (
+        (0, False),
+        (1, True),
+        (3, True),
+        (3.5, False),
+        (5, False),
+        (6, True),
+        (10, True),
+        (inf, False),
+    ))
+    def test_contains_point(self, value, expected):
+        interval_set = IntervalSet([
+            FloatInterval([1, 3]),
+            FloatInterval.open_closed(5, 10)
+        ])
+        assert (value in interval_set) is expected
+
+    @mark.parametrize(('interval', 'expected'), (
+        (FloatInterval([1, 3]), True),
+        (FloatInterval([2, 3]), True),
+        (FloatInterval([5, 6]), False),
+        (FloatInterval.open(5, 6), True),
+        (FloatInterval([3, 6]), False),
+        (FloatInterval.closed_open(3, 3), True),
+    ))
+    def test_contains_interval(self, interval, expected):
+        interval_set = IntervalSet([
+            FloatInterval([1, 3]),
+            FloatInterval.open_closed(5, 10)
+        ])
+        assert (interval in interval_set) is expected
+
+    def test_contains_discrete_interval(self):
+        interval_set = IntervalSet([IntInterval([1, 3]), IntInterval([6, 9])])
+        assert IntInterval((0, 4)) in interval_set
+        assert IntInterval([3, 6]) not in interval_set
+
+    def test_unbounded(self):
+        interval_set = IntervalSet([FloatInterval.all()])
+        assert -10 ** 10 in interval_set
+        assert FloatInterval.at_least(5) in interval_set
+
+
+class TestIntervalSetOperations(object):
+    def setup_method(self, method):
+        self.a = IntervalSet([IntInterval([1, 5]), IntInterval([10, 20])])
+        self.b = IntervalSet([IntInterval([4, 12]), IntInterval([18, 30])])
+
+    def test_union(self):
+        assert list(self.a | self.b) == [IntInterval([1, 30])]
+
+    def test_union_with_interval(self):
+        assert list(self.a | IntInterval([6, 9])) == [IntInterval([1, 20])]
+
+    def test_intersection(self):
+        assert list(self.a & self.b) == [
+            IntInterval([4, 5]),
+            IntInterval([10, 12]),
+            IntInterval([18, 20]),
+        ]
+
+    def test_intersection_with_shared_bounds(self):
+        a = IntervalSet([FloatInterval.closed_open(1, 3)])
+        b = IntervalSet([FloatInterval([3, 4])])
+        assert not (a & b)
+        b = IntervalSet([FloatInterval([0, 3])])
+        assert list(a & b) == [FloatInterval.closed_open(1, 3)]
+
+    def test_difference(self):
+        assert list(self.a - self.b) == [
+            IntInterval([1, 3]),
+            IntInterval([13, 17]),
+        ]
+
+    def test_continuous_difference(self):
+        a = IntervalSet([FloatInterval([1, 10])])
+        b = IntervalSet([FloatInterval([2, 3]), FloatInterval.open(5, 6)])
+        assert list(a - b) == [
+            FloatInterval.closed_open(1, 2),
+            FloatInterval.open_closed(3, 5),
+            FloatInterval([6, 10]),
+        ]
+
+    def test_complement(self):
+        assert list(~self.a) == [
+            IntInterval.less_than(1),
+            IntInterval([6, 9]),
+            IntInterval.greater_than(20),
+        ]
+
+    def test_complement_of_empty_set(self):
+        interval_set = IntervalSet(interval_class=FloatInterval)
+        assert list(~interval_set) == [FloatInterval.all()]
+
+    def test_complement_of_empty_set_without_interval_class(self):
+        with raises(TypeError):
+            ~IntervalSet()
+
+    def test_difference_of_empty_set_without_interval_class(self):
+        assert not IntervalSet() - IntInterval([1, 3])
+
+    def test_double_complement(self):
+        assert ~~self.a == self.a
+
+    def test_complement_of_all(self):
+        assert not ~IntervalSet([FloatInterval.all()])
+
+    def test_complement_of_point(self):
+        interval_set = IntervalSet([
+            FloatInterval.less_than(1),
+            FloatInterval.greater_than(1)
+        ])
+        assert list(~interval_set) == [FloatInterval([1, 1])]
+
+    def test_incompatible_classes(self):
+        with raises(TypeError):
+            self.a | IntervalSet([FloatInterval([1, 2])])
+
+    def test_equality(self):
+        assert self.a == IntervalSet(
+            [IntInterval((0, 6)), IntInterval([10, 20])]
+        )
+        assert self.a != self.b
@@ -0,0 +1,80 @@
+import random
+
+from pytest import importorskip, mark
+
+from intervals import (
+    FloatInterval,
+    IntervalArray,
+    IntInterval,
+    overlap_join,
+    parallel_overlap_join
+)
+
+from .helpers import random_intervals
+
+LENGTHS = (0, 1, 5, 20, 200)
+
+
+class TestParallelOverlapJoin(object):
+    def test_empty(self):
+        assert parallel_overlap_join([], [], workers=2) == []
+        assert parallel_overlap_join(
+            [IntInterval([1, 2])], [], workers=2
+        ) == []
+
+    def test_single_worker(self):
+        left = [FloatInterval([5, 8]), FloatInterval([1, 3])]
+        right = [FloatInterval([2, 6])]
+        assert parallel_overlap_join(left, right, workers=1) == [
+            (FloatInterval([1, 3]), FloatInterval([2, 6])),
+            (FloatInterval([5, 8]), FloatInterval([2, 6])),
+        ]
+
+    def test_yields_interval_pairs(self):
+        left = [FloatInterval([5, 8]), FloatInterval.at_least(20)]
+        right = [FloatInterval([2, 6]), FloatInterval([21, 22])]
+        assert sorted(
+            parallel_overlap_join(left, right, workers=2),
+            key=lambda pair: pair[0].lower
+        ) == [
+            (FloatInterval([5, 8]), FloatInterval([2, 6])),
+            (FloatInterval.at_least(20), FloatInterval([21, 22])),
+        ]
+
+    @mark.parametrize('adjacent', (True, False))
+    @mark.parametrize('partitions', (1, 3, 16))
+    def test_matches_overlap_join(self, adjacent, partitions):
+        rnd = random.Random(partitions)
+        left = random_intervals(
+            rnd, 300, IntInterval, span=500, lengths=LENGTHS, empty=True
+        )
+        right = random_intervals(
+            rnd, 300, IntInterval, span=500, lengths=LENGTHS, empty=True
+        )
+        expected = sorted(
+            overlap_join(left, right, adjacent=adjacent, indices=True)
+        )
+        assert sorted(parallel_overlap_join(
+            left,
+            right,
+            workers=2,
+            partitions=partitions,
+            adjacent=adjacent,
+            indices=True
+        )) == expected
+
+    def test_interval_arrays(self):
+        importorskip('numpy')
+        rnd = random.Random(1)
+        left = random_intervals(
+            rnd, 100, IntInterval, span=500, lengths=LENGTHS, empty=True
+        )
+        right = random_intervals(
+            rnd, 100, IntInterval, span=500, lengths=LENGTHS, empty=True
+        )
+        assert sorted(parallel_overlap_join(
+            IntervalArray.from_intervals(left),
+            IntervalArray.from_intervals(right),
+            workers=2,
+            indices=True
+        )) == sorted(overlap_join(left, right, indices=True))
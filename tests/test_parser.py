@@ -0,0 +1,105 @@
+from decimal import Decimal
+
+from infinity import inf
+from pytest import mark, raises
+
+from intervals import (
+    DecimalInterval,
+    FloatInterval,
+    IntervalException,
+    IntInterval,
+    parse_many
+)
+from intervals.parser import string_parser
+
+
+class TestIntervalStringParser(object):
+    @mark.parametrize(('value', 'expected'), (
+        ('[1, 5)', (['1', '5'], True, False)),
+        ('(1,5]', (['1', '5'], False, True)),
+        (' ( 1 , 5 ) ', (['1', '5'], False, False)),
+        ('[2,)', (['2', ''], True, False)),
+        ('(,2]', (['', '2'], False, True)),
+        ('2 - 5', (['2', '5'], True, True)),
+        ('2-5', (['2', '5'], True, True)),
+        ('-2 - -1', (['-2', '-1'], True, True)),
+        ('-3 - 5', (['-3', '5'], True, True)),
+        ('-3', (['-3', '-3'], True, True)),
+        ('3', (['3', '3'], True, True)),
+        ('A - Z', (['A', 'Z'], True, True)),
+        (
+            '2000-01-01 - 2000-01-31',
+            (['2000-01-01', '2000-01-31'], True, True)
+        ),
+        (
+            ' 2000-01-01 10:00 - 2000-01-01 12:00 ',
+            (['2000-01-01 10:00', '2000-01-01 12:00'], True, True)
+        ),
+        ('2000-01-01', (['2000-01-01', '2000-01-01'], True, True)),
+    ))
+    def test_parse_string(self, value, expected):
+        assert string_parser.parse_string(value) == expected
+
+    @mark.parametrize('value', (
+        '[1, 2, 3]',
+        '1, 2',
+        '1 - 2 - 3',
+        '2000-01-01 - 2000-01-02 - 2000-01-03',
+    ))
+    def test_unknown_format(self, value):
+        with raises(IntervalException):
+            string_parser.parse_string(value)
+
+    def test_from_string_uses_class_parser(self):
+        assert IntInterval.string_parser is string_parser
+
+
+class TestParseMany(object):
+    def test_parses_strings(self):
+        assert list(parse_many(['[1, 3)', '4 - 6', '(,0]'], IntInterval)) == [
+            IntInterval.closed_open(1, 3),
+            IntInterval([4, 6]),
+            IntInterval.at_most(0),
+        ]
+
+    def test_matches_from_string(self):
+        strings = ['[1.5, 3)', '4 - 6', '(,0]', '-2 - -1', '7']
+        assert list(parse_many(strings, FloatInterval)) == [
+            FloatInterval.from_string(string) for string in strings
+        ]
+
+    def test_collects_errors_by_index(self):
+        errors = {}
+        result = list(parse_many(
+            ['[1, 2]', '[a, 2]', '[1, 2, 3]', '[3, 1]', '(5, 6)'],
+            DecimalInterval,
+            errors
+        ))
+        assert result == [
+            DecimalInterval([Decimal(1), Decimal(2)]),
+            None,
+            None,
+            None,
+            DecimalInterval.open(Decimal(5), Decimal(6)),
+        ]
+        assert sorted(errors) == [1, 2, 3]
+        assert isinstance(errors[2], IntervalException)
+
+    def test_errors_without_dict(self):
+        assert list(parse_many(['[a, 2]'], IntInterval)) == [None]
+
+    def test_keyword_arguments(self):
+        interval, = parse_many(['[2,)'], IntInterval, step=2)
+        assert interval.step == 2
+        assert interval.upper == inf
+
+    def test_streams_results(self):
+        def generate():
+            i = 0
+            while True:
+                yield '[%d, %d]' % (i, i + 1)
+                i += 1
+
+        result = parse_many(generate(), IntInterval)
+        assert next(result) == IntInterval([0, 1])
+        assert next(result) == IntInterval([1, 2])
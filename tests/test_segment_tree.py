@@ -0,0 +1,265 @@
+import random
+from datetime import date, datetime, timedelta
+
+from infinity import inf
+from pytest import approx, mark, raises
+
+from intervals import (
+    DateInterval,
+    DateTimeInterval,
+    FloatInterval,
+    IntInterval,
+    SegmentTree
+)
+
+from .helpers import random_intervals
+
+
+def overlaps(interval, other):
+    return interval.is_connected(other) and not (interval & other).empty
+
+
+def sample_points():
+    return [value / 2.0 for value in range(-2, 125)]
+
+
+class TestSegmentTree(object):
+    def setup_method(self, method):
+        rnd = random.Random(1)
+        self.intervals = random_intervals(
+            random.Random(0), 200, span=50
+        )
+        self.weights = [rnd.randint(1, 5) for _ in self.intervals]
+        self.tree = SegmentTree(self.intervals, self.weights)
+
+    def brute_depth(self, point):
+        return sum(
+            weight
+            for interval, weight in zip(self.intervals, self.weights)
+            if point in interval
+        )
+
+    def test_len(self):
+        assert len(self.tree) == 200
+
+    def test_depth(self):
+        for point in sample_points():
+            assert self.tree.depth(point) == self.brute_depth(point)
+
+    @mark.parametrize('query', (
+        FloatInterval([10, 20]),
+        FloatInterval((10, 20)),
+        FloatInterval([10.5, 10.7]),
+        FloatInterval.closed_open(0, 5),
+        FloatInterval([-10, -5]),
+        FloatInterval.at_least(30),
+        FloatInterval.all(),
+    ))
+    def test_weight(self, query):
+        assert self.tree.weight(query) == sum(
+            weight
+            for interval, weight in zip(self.intervals, self.weights)
+            if overlaps(interval, query)
+        )
+
+    @mark.parametrize(('lower', 'upper'), (
+        (0, 60),
+        (10.25, 10.75),
+        (10.25, 30.5),
+        (-5, 3),
+        (55, 70),
+    ))
+    def test_integral(self, lower, upper):
+        step = 0.25
+        expected = sum(
+            self.brute_depth(lower + (index + 0.5) * step) * step
+            for index in range(int((upper - lower) / step))
+        )
+        assert self.tree.integral(FloatInterval([lower, upper])) == (
+            approx(expected)
+        )
+
+    def test_max(self):
+        depth, where = self.tree.max()
+        assert depth == max(map(self.brute_depth, sample_points()))
+        assert self.brute_depth(where.centre) == depth
+        assert where.lower == where.upper or not where.lower_inc
+        for point in sample_points():
+            if point < where.lower:
+                assert self.brute_depth(point) < depth
+
+    def test_max_within_interval(self):
+        query = FloatInterval([40, 45])
+        depth, where = self.tree.max(query)
+        assert depth == max(
+            self.brute_depth(point)
+            for point in sample_points()
+            if point in query
+        )
+        assert where in query
+        assert self.brute_depth(where.centre) == depth
+
+    def test_remove(self):
+        for interval, weight in zip(self.intervals[:100], self.weights):
+            self.tree.remove(interval, weight)
+        self.intervals = self.intervals[100:]
+        self.weights = self.weights[100:]
+        assert len(self.tree) == 100
+        for point in sample_points():
+            assert self.tree.depth(point) == self.brute_depth(point)
+
+    def test_add(self):
+        tree = SegmentTree()
+        for interval, weight in zip(self.intervals, self.weights):
+            tree.add(interval, weight)
+        for point in sample_points():
+            assert tree.depth(point) == self.brute_depth(point)
+        assert tree.max() == self.tree.max()
+
+
+class TestBounds(object):
+    @mark.parametrize(('point', 'depth'), (
+        (0, 0),
+        (1, 1),
+        (3, 1),
+        (4, 0),
+        (4.5, 1),
+        (5, 0),
+    ))
+    def test_inclusivity(self, point, depth):
+        tree = SegmentTree([
+            FloatInterval.closed_open(1, 4),
+            FloatInterval.open(4, 5),
+        ])
+        assert tree.depth(point) == depth
+
+    def test_touching_bounds_do_not_overlap(self):
+        tree = SegmentTree([
+            FloatInterval.closed_open(1, 4),
+            FloatInterval([4, 8]),
+        ])
+        assert tree.max() == (1, FloatInterval([1, 8]))
+        assert tree.weight(FloatInterval([4, 4])) == 1
+        assert tree.weight(FloatInterval([3, 4])) == 2
+
+    def test_discrete_intervals_are_canonical(self):
+        tree = SegmentTree([IntInterval([1, 3]), IntInterval((3, 6))])
+        assert tree.depth(3) == 1
+        assert tree.depth(4) == 1
+        assert tree.max() == (1, IntInterval([1, 5]))
+        assert tree.integral(IntInterval([0, 10])) == 5
+        assert tree.weight(IntInterval((3, 4))) == 0
+
+    def test_unbounded_intervals(self):
+        tree = SegmentTree([
+            IntInterval.at_most(5),
+            IntInterval.at_least(3),
+        ])
+        assert tree.depth(-1000) == 1
+        assert tree.depth(4) == 2
+        assert tree.max() == (2, IntInterval([3, 5]))
+        assert tree.max(IntInterval.at_least(7)) == (
+            1, IntInterval.at_least(7)
+        )
+        assert tree.weight(IntInterval.all()) == 2
+
+    def test_max_of_empty_tree(self):
+        assert SegmentTree().max() == (0, None)
+
+    def test_max_of_empty_interval(self):
+        tree = SegmentTree([IntInterval([1, 3])])
+        assert tree.max(IntInterval.open(1, 2)) == (0, None)
+
+    def test_max_of_uncovered_line(self):
+        tree = SegmentTree(interval_class=IntInterval)
+        assert tree.max() == (0, IntInterval.all())
+
+    def test_empty_intervals_are_ignored(self):
+        tree = SegmentTree([IntInterval.open(1, 2), IntInterval([1, 1])])
+        assert len(tree) == 1
+        assert tree.depth(1) == 1
+        tree.remove(IntInterval.open(1, 2))
+        assert len(tree) == 1
+
+
+class TestUpdates(object):
+    def test_remove_missing_interval(self):
+        tree = SegmentTree([IntInterval([1, 3])])
+        with raises(KeyError):
+            tree.remove(IntInterval([1, 4]))
+
+    def test_remove_with_other_weight(self):
+        tree = SegmentTree([IntInterval([1, 3])], weights=[2])
+        with raises(KeyError):
+            tree.remove(IntInterval([1, 3]))
+
+    def test_duplicates(self):
+        tree = SegmentTree([IntInterval([1, 3])] * 2)
+        tree.remove(IntInterval([1, 3]))
+        assert tree.depth(2) == 1
+        tree.remove(IntInterval([1, 3]))
+        assert tree.depth(2) == 0
+        assert len(tree) == 0
+
+    def test_add_with_new_bounds(self):
+        tree = SegmentTree([FloatInterval([0, 10])])
+        tree.add(FloatInterval([2, 4]), 3)
+        tree.add(FloatInterval([4, 10]))
+        assert tree.max() == (5, FloatInterval([4, 4]))
+        assert tree.integral(FloatInterval([0, 10])) == 22
+
+    def test_negative_weights(self):
+        tree = SegmentTree(
+            [FloatInterval([0, 10]), FloatInterval([3, 5])],
+            weights=[1, -1]
+        )
+        assert tree.depth(4) == 0
+        assert tree.max() == (1, FloatInterval.closed_open(0, 3))
+
+    def test_mismatching_weights(self):
+        with raises(ValueError):
+            SegmentTree([IntInterval([1, 3])], weights=[1, 2])
+
+
+class TestTemporalIntervals(object):
+    def test_datetime_integral(self):
+        tree = SegmentTree(
+            [
+                DateTimeInterval.closed_open(
+                    datetime(2000, 1, 1, 9),
+                    datetime(2000, 1, 1, 17)
+                ),
+                DateTimeInterval.closed_open(
+                    datetime(2000, 1, 1, 12),
+                    datetime(2000, 1, 1, 14)
+                ),
+            ],
+            weights=[2, 3]
+        )
+        day = DateTimeInterval.closed_open(
+            datetime(2000, 1, 1, 10),
+            datetime(2000, 1, 2)
+        )
+        assert tree.integral(day) == timedelta(hours=20)
+        assert tree.max(day) == (5, DateTimeInterval.closed_open(
+            datetime(2000, 1, 1, 12),
+            datetime(2000, 1, 1, 14)
+        ))
+
+    def test_date_depth(self):
+        tree = SegmentTree([
+            DateInterval([date(2000, 1, 1), date(2000, 1, 31)]),
+            DateInterval([date(2000, 1, 31), date(2000, 2, 29)]),
+        ])
+        assert tree.depth(date(2000, 1, 31)) == 2
+        assert tree.depth(date(2000, 2, 1)) == 1
+        assert tree.integral(DateInterval(
+            [date(2000, 1, 1), date(2000, 12, 31)]
+        )) == timedelta(days=61)
+
+    def test_unbounded_integral(self):
+        tree = SegmentTree([FloatInterval([0, 1])])
+        with raises(TypeError):
+            tree.integral(FloatInterval.at_least(0))
+        with raises(TypeError):
+            tree.integral(FloatInterval([0, inf]))
@@ -0,0 +1,469 @@
+import random
+from datetime import datetime, timedelta
+
+from pytest import importorskip, mark, raises
+
+from intervals import (
+    coverage,
+    DateTimeInterval,
+    FloatInterval,
+    IntervalArray,
+    IntervalSet,
+    IntInterval,
+    merge,
+    overlap_join
+)
+
+from .helpers import random_intervals
+
+
+class TestMerge(object):
+    def test_empty(self):
+        assert list(merge([])) == []
+
+    def test_merges_overlapping_intervals(self):
+        intervals = [
+            FloatInterval([5, 8]),
+            FloatInterval([1, 3]),
+            FloatInterval([2, 6]),
+            FloatInterval([10, 12]),
+        ]
+        assert list(merge(intervals)) == [
+            FloatInterval([1, 8]),
+            FloatInterval([10, 12]),
+        ]
+
+    @mark.parametrize(('intervals', 'adjacent', 'expected'), (
+        (
+            [FloatInterval.closed_open(1, 3), FloatInterval([3, 5])],
+            True,
+            [FloatInterval([1, 5])]
+        ),
+        (
+            [FloatInterval.closed_open(1, 3), FloatInterval([3, 5])],
+            False,
+            [FloatInterval.closed_open(1, 3), FloatInterval([3, 5])]
+        ),
+        (
+            [FloatInterval([1, 3]), FloatInterval([3, 5])],
+            False,
+            [FloatInterval([1, 5])]
+        ),
+        (
+            [FloatInterval.closed_open(1, 3), FloatInterval.open(3, 5)],
+            True,
+            [FloatInterval.closed_open(1, 3), FloatInterval.open(3, 5)]
+        ),
+        (
+            [IntInterval([1, 3]), IntInterval([4, 6])],
+            True,
+            [IntInterval([1, 6])]
+        ),
+        (
+            [IntInterval([1, 3]), IntInterval([4, 6])],
+            False,
+            [IntInterval([1, 3]), IntInterval([4, 6])]
+        ),
+        (
+            [IntInterval([1, 3]), IntInterval.open(3, 6)],
+            True,
+            [IntInterval.closed_open(1, 6)]
+        ),
+        (
+            [IntInterval.closed_open(1, 2), IntInterval.open(1, 3)],
+            False,
+            [IntInterval.closed_open(1, 2), IntInterval.open(1, 3)]
+        ),
+        (
+            [IntInterval.closed_open(1, 3), IntInterval.open(1, 4)],
+            False,
+            [IntInterval.closed_open(1, 4)]
+        ),
+    ))
+    def test_adjacent_intervals(self, intervals, adjacent, expected):
+        result = list(merge(intervals, adjacent=adjacent))
+        assert [str(i) for i in result] == [str(i) for i in expected]
+
+    def test_keeps_inclusive_upper_bound(self):
+        intervals = [FloatInterval.closed_open(1, 5), FloatInterval([2, 5])]
+        assert list(merge(intervals)) == [FloatInterval([1, 5])]
+
+    def test_yields_unmerged_intervals_as_is(self):
+        intervals = [IntInterval([1, 3]), IntInterval([10, 12])]
+        result = list(merge(intervals))
+        assert result[0] is intervals[0]
+        assert result[1] is intervals[1]
+
+    def test_skips_empty_intervals(self):
+        intervals = [IntInterval((1, 2)), IntInterval([5, 6])]
+        assert list(merge(intervals)) == [IntInterval([5, 6])]
+
+    def test_unbounded_intervals(self):
+        intervals = [IntInterval.at_most(5), IntInterval.at_least(3)]
+        assert list(merge(intervals)) == [IntInterval.all()]
+
+    def test_presorted_input_is_merged_lazily(self):
+        def generate():
+            for i in range(10 ** 9):
+                yield IntInterval([i * 10, i * 10 + 5])
+
+        result = merge(generate(), presorted=True)
+        assert next(result) == IntInterval([0, 5])
+        assert next(result) == IntInterval([10, 15])
+
+    def test_presorted_input_not_sorted(self):
+        intervals = [IntInterval([5, 8]), IntInterval([1, 3])]
+        with raises(ValueError):
+            list(merge(intervals, presorted=True))
+
+    def test_datetime_intervals(self):
+        start = datetime(2020, 1, 1)
+        intervals = [
+            DateTimeInterval.closed_open(
+                start + timedelta(hours=i),
+                start + timedelta(hours=i + 1)
+            )
+            for i in range(24)
+        ]
+        assert list(merge(intervals)) == [
+            DateTimeInterval.closed_open(start, start + timedelta(days=1))
+        ]
+
+    def test_matches_interval_set(self):
+        rnd = random.Random(1)
+        intervals = []
+        for _ in range(500):
+            lower = rnd.randint(0, 1000)
+            intervals.append(IntInterval([lower, lower + rnd.randint(0, 5)]))
+        assert IntervalSet(merge(intervals)) == IntervalSet(intervals)
+        assert len(list(merge(intervals))) == len(IntervalSet(intervals))
+
+
+def points(interval):
+    if interval.empty:
+        return set()
+    lower, _, upper, _ = interval.canonical_bounds()
+    return set(range(lower, upper))
+
+
+class TestOverlapJoin(object):
+    def test_empty(self):
+        assert list(overlap_join([], [IntInterval([1, 2])])) == []
+        assert list(overlap_join([IntInterval([1, 2])], [])) == []
+
+    def test_yields_interval_pairs(self):
+        left = [FloatInterval([5, 8]), FloatInterval([1, 3])]
+        right = [FloatInterval([2, 6]), FloatInterval([10, 12])]
+        assert list(overlap_join(left, right)) == [
+            (FloatInterval([1, 3]), FloatInterval([2, 6])),
+            (FloatInterval([5, 8]), FloatInterval([2, 6])),
+        ]
+
+    def test_yields_index_pairs(self):
+        left = [FloatInterval([5, 8]), FloatInterval([1, 3])]
+        right = [FloatInterval([2, 6]), FloatInterval([10, 12])]
+        assert sorted(overlap_join(left, right, indices=True)) == [
+            (0, 0), (1, 0)
+        ]
+
+    @mark.parametrize(('left', 'right', 'adjacent', 'expected'), (
+        (FloatInterval.closed_open(1, 3), FloatInterval([3, 5]), False, 0),
+        (FloatInterval.closed_open(1, 3), FloatInterval([3, 5]), True, 1),
+        (FloatInterval([1, 3]), FloatInterval([3, 5]), False, 1),
+        (FloatInterval([3, 5]), FloatInterval([1, 3]), False, 1),
+        (FloatInterval([3, 5]), FloatInterval.open(1, 3), False, 0),
+        (FloatInterval([3, 5]), FloatInterval.open(1, 3), True, 1),
+        (FloatInterval.open(1, 3), FloatInterval.open(3, 5), True, 0),
+        (IntInterval([1, 3]), IntInterval([4, 6]), False, 0),
+        (IntInterval([1, 3]), IntInterval([4, 6]), True, 1),
+        (IntInterval.closed_open(1, 3), IntInterval.open(2, 5), False, 0),
+        (IntInterval.open(1, 2), IntInterval([0, 5]), False, 0),
+    ))
+    def test_inclusivity(self, left, right, adjacent, expected):
+        pairs = list(overlap_join([left], [right], adjacent=adjacent))
+        assert len(pairs) == expected
+
+    def test_unbounded_intervals(self):
+        left = [IntInterval.at_most(5), IntInterval.at_least(10)]
+        right = [IntInterval.all(), IntInterval([7, 8])]
+        assert sorted(overlap_join(left, right, indices=True)) == [
+            (0, 0), (1, 0)
+        ]
+
+    def test_datetime_intervals(self):
+        start = datetime(2020, 1, 1)
+        bookings = [
+            DateTimeInterval.closed_open(
+                start + timedelta(hours=i),
+                start + timedelta(hours=i + 1)
+            )
+            for i in range(24)
+        ]
+        maintenance = [
+            DateTimeInterval.closed_open(
+                start + timedelta(hours=3),
+                start + timedelta(hours=5)
+            )
+        ]
+        assert list(overlap_join(bookings, maintenance, indices=True)) == [
+            (3, 0), (4, 0)
+        ]
+
+    def test_presorted_input_is_joined_lazily(self):
+        def generate():
+            for i in range(10 ** 9):
+                yield IntInterval([i * 10, i * 10 + 5])
+
+        result = overlap_join(generate(), generate(), presorted=True)
+        assert next(result) == (IntInterval([0, 5]), IntInterval([0, 5]))
+        assert next(result) == (IntInterval([10, 15]), IntInterval([10, 15]))
+
+    def test_presorted_input_not_sorted(self):
+        intervals = [IntInterval([5, 8]), IntInterval([1, 3])]
+        with raises(ValueError):
+            list(overlap_join(intervals, intervals, presorted=True))
+
+    @mark.parametrize('adjacent', (True, False))
+    def test_matches_nested_loop_join(self, adjacent):
+        rnd = random.Random(2)
+        left = random_intervals(
+            rnd, 300, IntInterval, span=200, empty=True
+        )
+        right = random_intervals(
+            rnd, 300, IntInterval, span=200, empty=True
+        )
+        expected = sorted(
+            (i, j)
+            for i, a in enumerate(left)
+            for j, b in enumerate(right)
+            if points(a) and points(b) and (
+                points(a) & points(b) or
+                adjacent and (min(points(a)) - max(points(b)) == 1 or
+                              min(points(b)) - max(points(a)) == 1)
+            )
+        )
+        result = list(overlap_join(
+            left, right, adjacent=adjacent, indices=True
+        ))
+        assert sorted(result) == expected
+        assert len(set(result)) == len(result)
+
+    def test_interval_arrays(self):
+        importorskip('numpy')
+        rnd = random.Random(3)
+        left = random_intervals(
+            rnd, 200, IntInterval, span=200, empty=True
+        )
+        right = random_intervals(
+            rnd, 200, IntInterval, span=200, empty=True
+        )
+        expected = sorted(overlap_join(left, right, indices=True))
+        assert sorted(overlap_join(
+            IntervalArray.from_intervals(left),
+            IntervalArray.from_intervals(right),
+            indices=True
+        )) == expected
+        assert sorted(overlap_join(
+            IntervalArray.from_intervals(left), right, indices=True
+        )) == expected
+
+    def test_interval_array_pairs(self):
+        importorskip('numpy')
+        left = IntervalArray.from_intervals([
+            FloatInterval([5, 8]), FloatInterval.at_least(20)
+        ])
+        right = [FloatInterval([2, 6]), FloatInterval([21, 22])]
+        assert list(overlap_join(left, right)) == [
+            (FloatInterval([5, 8]), FloatInterval([2, 6])),
+            (FloatInterval.at_least(20), FloatInterval([21, 22])),
+        ]
+
+
+def float_intervals(rnd, count):
+    intervals = []
+    for _ in range(count):
+        lower = rnd.randint(0, 100)
+        upper = lower + rnd.randint(0, 10)
+        intervals.append(FloatInterval(
+            [lower, upper],
+            lower_inc=lower == upper or rnd.random() < 0.5,
+            upper_inc=lower == upper or rnd.random() < 0.5
+        ))
+    return intervals
+
+
+def assert_profile(profile):
+    """
+    Assert that given profile is a run-length encoded step function.
+    """
+    for (segment, depth), (following, following_depth) in zip(
+        profile, profile[1:]
+    ):
+        assert depth != following_depth
+        assert segment.upper == following.lower
+        assert segment.upper_inc != following.lower_inc
+
+
+class TestCoverage(object):
+    def test_empty(self):
+        assert list(coverage([])) == []
+        assert list(coverage([IntInterval.open(1, 2)])) == []
+
+    def test_yields_depths(self):
+        assert list(coverage([
+            FloatInterval([1, 5]),
+            FloatInterval.closed_open(2, 3),
+            FloatInterval([3, 4]),
+            FloatInterval([8, 9]),
+        ])) == [
+            (FloatInterval.closed_open(1, 2), 1),
+            (FloatInterval([2, 4]), 2),
+            (FloatInterval.open_closed(4, 5), 1),
+            (FloatInterval.open(5, 8), 0),
+            (FloatInterval([8, 9]), 1),
+        ]
+
+    @mark.parametrize(('intervals', 'expected'), (
+        (
+            [FloatInterval.closed_open(1, 3), FloatInterval([3, 5])],
+            [(FloatInterval([1, 5]), 1)]
+        ),
+        (
+            [FloatInterval([1, 3]), FloatInterval([3, 5])],
+            [
+                (FloatInterval.closed_open(1, 3), 1),
+                (FloatInterval([3, 3]), 2),
+                (FloatInterval.open_closed(3, 5), 1),
+            ]
+        ),
+        (
+            [FloatInterval.closed_open(1, 3), FloatInterval.open(3, 5)],
+            [
+                (FloatInterval.closed_open(1, 3), 1),
+                (FloatInterval([3, 3]), 0),
+                (FloatInterval.open(3, 5), 1),
+            ]
+        ),
+        (
+            [IntInterval([1, 3]), IntInterval([4, 6])],
+            [(IntInterval([1, 6]), 1)]
+        ),
+        (
+            [IntInterval([1, 4]), IntInterval((2, 8))],
+            [
+                (IntInterval([1, 2]), 1),
+                (IntInterval([3, 4]), 2),
+                (IntInterval([5, 7]), 1),
+            ]
+        ),
+        (
+            [IntInterval.at_most(3), IntInterval.at_least(2)],
+            [
+                (IntInterval.at_most(1), 1),
+                (IntInterval([2, 3]), 2),
+                (IntInterval.at_least(4), 1),
+            ]
+        ),
+    ))
+    def test_bounds(self, intervals, expected):
+        assert list(coverage(intervals)) == expected
+
+    def test_weights(self):
+        assert list(coverage(
+            [FloatInterval([0, 10]), FloatInterval([2, 4])],
+            weights=[2, 3]
+        )) == [
+            (FloatInterval.closed_open(0, 2), 2),
+            (FloatInterval([2, 4]), 5),
+            (FloatInterval.open_closed(4, 10), 2),
+        ]
+
+    def test_cancelling_weights(self):
+        assert list(coverage(
+            [FloatInterval([0, 2]), FloatInterval([0, 3])],
+            weights=[1, -1]
+        )) == [(FloatInterval.open_closed(2, 3), -1)]
+
+    def test_skips_empty_weighted_intervals(self):
+        assert list(coverage(
+            [IntInterval.open(1, 2), IntInterval([1, 3])],
+            weights=[5, 1]
+        )) == [(IntInterval([1, 3]), 1)]
+
+    def test_keeps_step(self):
+        (segment, depth), = coverage([IntInterval([0, 10], step=2)])
+        assert segment.step == 2
+        assert list(segment) == [0, 2, 4, 6, 8, 10]
+        assert depth == 1
+
+    def test_matches_point_depths(self):
+        rnd = random.Random(0)
+        intervals = float_intervals(rnd, 300)
+        profile = list(coverage(intervals))
+        assert_profile(profile)
+        assert profile[0][0].lower == min(i.lower for i in intervals)
+        assert profile[-1][0].upper == max(i.upper for i in intervals)
+        for segment, depth in profile:
+            for point in (segment.lower, segment.centre, segment.upper):
+                if point in segment:
+                    assert depth == sum(
+                        point in interval for interval in intervals
+                    )
+
+    def test_presorted(self):
+        rnd = random.Random(1)
+        intervals = sorted(
+            float_intervals(rnd, 300),
+            key=lambda interval: (interval.lower, not interval.lower_inc)
+        )
+        assert list(coverage(iter(intervals), presorted=True)) == (
+            list(coverage(intervals))
+        )
+
+    def test_presorted_is_lazy(self):
+        def intervals():
+            for lower in range(0, 100, 10):
+                yield IntInterval([lower, lower + 4])
+            raise AssertionError('Consumed too far.')
+
+        profile = coverage(intervals(), presorted=True)
+        assert next(profile) == (IntInterval([0, 4]), 1)
+        assert next(profile) == (IntInterval([5, 9]), 0)
+
+    def test_unsorted_input(self):
+        with raises(ValueError):
+            list(coverage(
+                [FloatInterval([3, 4]), FloatInterval([1, 2])],
+                presorted=True
+            ))
+
+    def test_datetimes(self):
+        start = datetime(2000, 1, 1)
+        hour = timedelta(hours=1)
+        intervals = [
+            DateTimeInterval.closed_open(start, start + 3 * hour),
+            DateTimeInterval.closed_open(start + hour, start + 2 * hour),
+        ]
+        profile = list(coverage(intervals))
+        assert [depth for _, depth in profile] == [1, 2, 1]
+        assert [segment.lower for segment, _ in profile] == [
+            start, start + hour, start + 2 * hour
+        ]
+        assert all(
+            segment.lower_inc and not segment.upper_inc
+            for segment, _ in profile
+        )
+
+    @mark.parametrize('presorted', (False, True))
+    def test_interval_array(self, presorted):
+        importorskip('numpy')
+        rnd = random.Random(2)
+        intervals = sorted(
+            random_intervals(rnd, 200, IntInterval, span=200, empty=True),
+            key=lambda interval: interval.canonical_bounds()[0]
+        )
+        weights = [rnd.randint(1, 3) for _ in intervals]
+        array = IntervalArray.from_intervals(intervals)
+        assert list(coverage(array, weights, presorted=presorted)) == (
+            list(coverage(intervals, weights, presorted=presorted))
+        )